@@ -82,11 +82,10 @@ class BodyPart(PhysicsObject):
                 x_force = (1/2)*(body_part_spring_constant)*x_squared
                 y_force = (1/2)*(body_part_spring_constant)*y_squared
 
-                self.remove_force_by_name(part.name + " pull")
-                f = Force(name=(part.name + " pull"), x=x_force, y=y_force)
-                self.apply_force(f)
+                #Reuse the same force every tick instead of creating a new one
+                self.replace_force(part.name + " pull", x=x_force, y=y_force)
                 self.tick(wall_bump_tick_length)
-                self.remove_force(f)
+                self.replace_force(part.name + " pull", x=0, y=0)
 
 class Stickman():
 
@@ -251,10 +250,9 @@ def main():
             for part in stickman.body_parts:
                 #Apply grab forces so that the body parts will go towards the mouse
                 if part.grabbed:
-                    part.remove_force_by_name("grabbed")
                     x_force = 10*(mouse_x-part.xpos)
                     y_force = 10*(mouse_y-part.ypos)
-                    part.apply_force(Force("grabbed", x=x_force, y=y_force))
+                    part.replace_force("grabbed", x=x_force, y=y_force)
                 else:
                     part.remove_force_by_name("grabbed")
 
@@ -264,10 +262,9 @@ def main():
             #Air density at 15 degrees celcius at sea level is about 1.225 kg/m^3
             #Cross-sectional area is assumed to be 1 square meter
             for part in stickman.body_parts:
-                part.remove_force_by_name("air_resistance")
                 x_force = (1/2)*(0.47)*(-part.xvel)*(1.225)*(1)
                 y_force = (1/2)*(0.47)*(-part.yvel)*(1.225)*(1)
-                part.apply_force(Force("air_resistance", x=x_force, y=y_force))
+                part.replace_force("air_resistance", x=x_force, y=y_force)
 
             #Make the body parts go towards each other if they are too far apart and if not on ground
             for part in stickman.body_parts: #Hands will still expreience body part forces even when standing
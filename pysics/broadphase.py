@@ -0,0 +1,243 @@
+import bisect
+
+from .world import require_numpy
+
+class BroadPhase():
+    """The base class of every broad phase.
+
+    A broad phase quickly finds the pairs of objects whose axis-aligned bounding boxes overlap (candidate pairs),
+    so that exact collision tests only have to be run on those pairs instead of on every pair of objects.
+    Give a broad phase to a :class:`pysics.manager.PhysicsManager` to have it find candidate pairs every tick.
+
+    Broad phases require ``numpy``.
+
+    """
+
+    def __init__(self):
+        require_numpy() #Fail early if numpy is missing
+
+    def find_pairs(self, objects, mins, maxs):
+        """
+        Find the pairs of objects whose bounding boxes overlap (touching counts as overlapping).
+
+        Parameters
+        ----------
+        objects: List[:class:`pysics.obj.PhysicsObject`]
+            The objects to test. Broad phases that remember information between ticks use these to identify objects.
+
+        mins: :class:`numpy.ndarray`
+            The lowest corner of each object's bounding box, shape ``(len(objects), 3)``.
+
+        maxs: :class:`numpy.ndarray`
+            The highest corner of each object's bounding box, shape ``(len(objects), 3)``.
+
+        Returns
+        -------
+        :class:`numpy.ndarray`
+            The pairs as indexes into ``objects``, shape ``(number of pairs, 2)``.
+            The first index of each pair is always lower than the second, and the pairs are sorted.
+        """
+        raise NotImplementedError
+
+    def _finish_pairs(self, first, second, count, mins, maxs):
+        """Remove pairs whose boxes do not actually overlap and duplicate pairs, and sort the rest."""
+        np = require_numpy()
+        overlapping = (first != second) & ((mins[first] <= maxs[second]) & (mins[second] <= maxs[first])).all(axis=1)
+        first = first[overlapping]
+        second = second[overlapping]
+        keys = np.unique(np.minimum(first, second).astype(np.int64)*count + np.maximum(first, second))
+        pairs = np.empty((len(keys), 2), dtype=np.intp)
+        pairs[:, 0] = keys // count
+        pairs[:, 1] = keys % count
+        return pairs
+
+class SpatialHashGrid(BroadPhase):
+    """A broad phase that sorts objects into the cells of a uniform grid, stored in a hash table so that the grid is unbounded.
+    Only objects sharing a cell are compared, so finding pairs takes close to linear time.
+
+    The whole search is done with batched NumPy operations (no Python loop over objects).
+
+    Works best when objects are roughly the same size as a cell. Objects much larger than a cell are placed in many cells;
+    for scenes mixing tiny and huge objects, sweep and prune is a better fit.
+
+    Parameters
+    ----------
+    cell_size: :class:`float`
+        The length of each side of a cell in meters. Defaults to ``1.0``.
+
+    Attributes
+    ----------
+    cell_size: :class:`float`
+        The length of each side of a cell in meters.
+
+    """
+
+    #Large primes used to hash cell coordinates (Teschner et al., "Optimized Spatial Hashing for Collision Detection of Deformable Objects")
+    _PRIMES = (73856093, 19349663, 83492791)
+
+    def __init__(self, cell_size=1.0):
+        super().__init__()
+        if cell_size <= 0:
+            raise ValueError("The cell size of a spatial hash grid must be positive.")
+        self.cell_size = cell_size
+
+    def find_pairs(self, objects, mins, maxs):
+        np = require_numpy()
+        count = len(mins)
+        if count < 2:
+            return np.empty((0, 2), dtype=np.intp)
+
+        #The range of cells each object covers on each axis
+        low = np.floor(mins/self.cell_size).astype(np.int64)
+        high = np.floor(maxs/self.cell_size).astype(np.int64)
+        span = high - low + 1
+        cells_per_object = span.prod(axis=1)
+
+        #One entry for every (object, cell) combination
+        owner = np.repeat(np.arange(count), cells_per_object)
+        first_entry = np.cumsum(cells_per_object) - cells_per_object
+        local = np.arange(len(owner)) - first_entry[owner]
+        x_span = span[owner, 0]
+        y_span = span[owner, 1]
+        x = low[owner, 0] + local % x_span
+        y = low[owner, 1] + (local//x_span) % y_span
+        z = low[owner, 2] + local//(x_span*y_span)
+        keys = (x*self._PRIMES[0]) ^ (y*self._PRIMES[1]) ^ (z*self._PRIMES[2])
+
+        #Entries of the same cell end up next to each other. Comparing each entry with the entry d places later
+        #finds every pair in cells holding more than d objects, so stop once no cell is that full.
+        order = np.lexsort((owner, keys))
+        keys = keys[order]
+        owner = owner[order]
+        first = []
+        second = []
+        distance = 1
+        while distance < len(keys):
+            same_cell = keys[distance:] == keys[:-distance]
+            if not same_cell.any(): break
+            first.append(owner[:-distance][same_cell])
+            second.append(owner[distance:][same_cell])
+            distance += 1
+
+        if not first:
+            return np.empty((0, 2), dtype=np.intp)
+        return self._finish_pairs(np.concatenate(first), np.concatenate(second), count, mins, maxs)
+
+class SweepAndPrune(BroadPhase):
+    """A broad phase that keeps the bounding boxes of all objects sorted by their lowest point on one axis,
+    then sweeps along that axis comparing each box only with the boxes that start before it ends.
+
+    The sorted order is kept between ticks and repaired with an insertion sort. Objects move only a little each tick,
+    so the order is almost sorted already and repairing it takes close to linear time (temporal coherence).
+    When the order is far from sorted (such as on the first tick), it is sorted from scratch instead.
+    Unlike a :class:`SpatialHashGrid`, the cost does not depend on how large objects are, so it handles
+    scenes that mix tiny projectiles with huge platforms well.
+
+    Parameters
+    ----------
+    axis: :class:`int`
+        The axis to sort along: ``0`` for x, ``1`` for y, ``2`` for z. Defaults to ``0``.
+        Choose the axis along which objects are most spread out.
+
+    Attributes
+    ----------
+    axis: :class:`int`
+        The axis objects are sorted along. Changing it makes the next sort start from scratch.
+
+    """
+
+    #The fraction of boxes that may be out of place before sorting from scratch instead of repairing the order
+    _MAX_INSERTIONS = 0.05
+
+    def __init__(self, axis=0):
+        super().__init__()
+        if axis not in (0, 1, 2):
+            raise ValueError("The axis of a sweep and prune broad phase must be 0, 1 or 2.")
+        self.axis = axis
+        self._objects = [] #The objects given last time
+        self._order = [] #Indexes into _objects, sorted by the lowest point of each box on the axis
+        self._sorted_axis = axis
+
+    def find_pairs(self, objects, mins, maxs):
+        np = require_numpy()
+        count = len(objects)
+        if count < 2:
+            self._objects = list(objects)
+            self._order = list(range(count))
+            return np.empty((0, 2), dtype=np.intp)
+
+        if self._sorted_axis != self.axis:
+            self._objects = []
+            self._order = []
+            self._sorted_axis = self.axis
+        if objects != self._objects:
+            self._remap(objects)
+
+        order = self._sort(mins[:, self.axis])
+
+        #Sweep: every box starting (in sorted order) before box i ends is a candidate for box i
+        sorted_mins = mins[order, self.axis]
+        sorted_maxs = maxs[order, self.axis]
+        ends = np.searchsorted(sorted_mins, sorted_maxs, side="right")
+        candidates = np.maximum(ends - np.arange(count) - 1, 0)
+        first = np.repeat(np.arange(count), candidates)
+        start = np.cumsum(candidates) - candidates
+        second = first + 1 + (np.arange(len(first)) - start[first])
+        first = order[first]
+        second = order[second]
+
+        #Prune with the other axes one at a time, which shrinks the candidates before the full test
+        for axis in (0, 1, 2):
+            if axis == self.axis: continue
+            overlapping = (mins[first, axis] <= maxs[second, axis]) & (mins[second, axis] <= maxs[first, axis])
+            first = first[overlapping]
+            second = second[overlapping]
+        return self._finish_pairs(first, second, count, mins, maxs)
+
+    def _remap(self, objects):
+        """Keep the sorted order of the objects that are still present, and add new objects at the end."""
+        new_indexes = {}
+        for index, obj in enumerate(objects):
+            new_indexes[id(obj)] = index
+        order = []
+        for old_index in self._order:
+            index = new_indexes.pop(id(self._objects[old_index]), None)
+            if index is not None:
+                order.append(index)
+        order.extend(sorted(new_indexes.values()))
+        self._objects = list(objects)
+        self._order = order
+
+    def _sort(self, lows):
+        """Repair the sorted order with an insertion sort and return it as an array.
+
+        NumPy finds the places where the order is broken. Each out of place box is then moved back to where it belongs
+        (found by bisection), so the Python work is proportional to the number of boxes that changed places."""
+        np = require_numpy()
+        order = np.asarray(self._order, dtype=np.intp)
+        keys = lows[order]
+        broken = np.flatnonzero(keys[1:] < keys[:-1]) + 1
+        if len(broken) == 0:
+            return order
+        if len(broken) > self._MAX_INSERTIONS*len(keys):
+            #Far from sorted (the first tick, or many new objects): insertion sort would take quadratic time
+            order = order[np.argsort(keys, kind="stable")]
+            self._order = order.tolist()
+            return order
+
+        keys = keys.tolist()
+        order = self._order
+        pending = broken.tolist()
+        pending.reverse() #Pop the lowest position first
+        while pending:
+            position = pending.pop()
+            key = keys[position]
+            if key >= keys[position-1]: continue
+            destination = bisect.bisect_right(keys, key, 0, position-1)
+            keys.insert(destination, keys.pop(position))
+            order.insert(destination, order.pop(position))
+            #The box moved up into this position may now be out of place with the box after it
+            after = position + 1
+            if after < len(keys) and keys[after] < keys[position] and (not pending or pending[-1] != after):
+                pending.append(after)
+        return np.asarray(order, dtype=np.intp)
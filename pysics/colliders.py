@@ -0,0 +1,239 @@
+import math
+
+from .world import require_numpy, POS, EXTENTS, SHAPE
+from .shapes import SPHERE, BOX
+from .collision import plane_contacts, _sphere_box, _box_box
+
+class StaticCollider():
+    """The base class of static geometry (floors, walls, ceilings, platforms).
+
+    Static colliders are not objects: they never move, are never ticked and are never tested against each other.
+    Every object in a :class:`pysics.manager.PhysicsManager` is tested against every collider of the manager in bulk
+    at the end of each tick, and objects that hit a collider bounce off it with the collider's restitution and friction.
+    Objects without a shape are treated as points.
+
+    Parameters
+    ----------
+    restitution: :class:`float`
+        How bouncy the collider is, from ``0`` (objects stop) to ``1`` (perfectly elastic). Defaults to ``1.0``.
+
+    friction: :class:`float`
+        The coefficient of friction between the collider and objects. Defaults to ``0.0``.
+
+    Attributes
+    ----------
+    restitution: :class:`float`
+        How bouncy the collider is.
+
+    friction: :class:`float`
+        The coefficient of friction between the collider and objects.
+
+    """
+
+    def __init__(self, restitution=1.0, friction=0.0):
+        require_numpy() #Fail early if numpy is missing
+        self.restitution = restitution
+        self.friction = friction
+
+    def find_contacts(self, states) -> tuple:
+        """
+        Test many objects against this collider at once.
+
+        Parameters
+        ----------
+        states: :class:`numpy.ndarray`
+            The state row of each object (see :data:`pysics.world.STATE_FIELDS`), shape ``(number of objects, NUM_FIELDS)``.
+
+        Returns
+        -------
+        tuple(:class:`numpy.ndarray`, :class:`numpy.ndarray`, :class:`numpy.ndarray`)
+            The indexes of the objects touching this collider, the normals pushing each of them out of the collider,
+            and how deep each one is, in meters.
+        """
+        raise NotImplementedError
+
+    def time_of_impact(self, states, starts, ends) -> tuple:
+        """
+        Find when objects moving in straight lines during a tick first hit this collider (continuous collision detection).
+
+        Objects that start the tick touching or inside the collider are not reported: they are handled by :meth:`find_contacts`.
+
+        Parameters
+        ----------
+        states: :class:`numpy.ndarray`
+            The state row of each object, shape ``(number of objects, NUM_FIELDS)``. Only the shapes are used.
+
+        starts: :class:`numpy.ndarray`
+            The position of each object at the start of the tick, shape ``(number of objects, 3)``.
+
+        ends: :class:`numpy.ndarray`
+            The position of each object at the end of the tick, shape ``(number of objects, 3)``.
+
+        Returns
+        -------
+        tuple(:class:`numpy.ndarray`, :class:`numpy.ndarray`)
+            The fraction of the path (from ``0`` to ``1``) travelled by each object when it hits the collider
+            (``inf`` for objects that miss it), and the normal of the surface each object hits.
+        """
+        raise NotImplementedError
+
+class HalfSpace(StaticCollider):
+    """An infinite plane with everything on one side of it solid, such as a floor, a wall or a ceiling.
+
+    Points on the plane satisfy ``point·normal = offset``, and the normal points out of the solid side.
+    For example, a floor at a height of ``0`` (with up being positive): ::
+
+        floor = HalfSpace(normal=(0, 1, 0), offset=0)
+
+    and the right wall of a 400 pixel wide pygame window: ::
+
+        right_wall = HalfSpace(normal=(-1, 0, 0), offset=-400)
+
+    Parameters
+    ----------
+    normal: tuple(:class:`float`, :class:`float`, :class:`float`)
+        The direction pointing out of the solid side. It does not have to be a unit vector. Defaults to ``(0, 1, 0)`` (up).
+
+    offset: :class:`float`
+        The distance of the plane from the origin along the normal. Defaults to ``0.0``.
+
+    restitution: :class:`float`
+        How bouncy the plane is. Defaults to ``1.0``.
+
+    friction: :class:`float`
+        The coefficient of friction of the plane. Defaults to ``0.0``.
+
+    Attributes
+    ----------
+    normal: tuple(:class:`float`, :class:`float`, :class:`float`)
+        The unit vector pointing out of the solid side.
+
+    offset: :class:`float`
+        The distance of the plane from the origin along the normal.
+
+    """
+
+    def __init__(self, normal=(0.0, 1.0, 0.0), offset=0.0, restitution=1.0, friction=0.0):
+        super().__init__(restitution, friction)
+        length = math.sqrt(sum(component*component for component in normal))
+        if length == 0:
+            raise ValueError("The normal of a half-space cannot be (0, 0, 0).")
+        self.normal = tuple(component/length for component in normal)
+        self.offset = offset/length
+
+    def find_contacts(self, states) -> tuple:
+        np = require_numpy()
+        indexes, depths = plane_contacts(states, self.normal, self.offset)
+        normals = np.tile(np.asarray(self.normal, dtype=float), (len(indexes), 1))
+        return indexes, normals, depths
+
+    def time_of_impact(self, states, starts, ends) -> tuple:
+        np = require_numpy()
+        normal = np.asarray(self.normal, dtype=float)
+        extents = states[:, EXTENTS:EXTENTS+3]
+        reach = np.where(states[:, SHAPE] == SPHERE, extents[:, 0], (extents*np.abs(normal)).sum(axis=1))
+        #The distance between the surface of each object and the plane, at the start and at the end of the path
+        #(Dot products are summed in a fixed order, instead of by BLAS, so that every machine gets the same results)
+        start_gap = (starts*normal).sum(axis=1) - self.offset - reach
+        end_gap = (ends*normal).sum(axis=1) - self.offset - reach
+        hitting = (start_gap > 0) & (end_gap < 0)
+        times = np.full(len(states), np.inf)
+        times[hitting] = start_gap[hitting]/(start_gap[hitting] - end_gap[hitting])
+        return times, np.tile(normal, (len(states), 1))
+
+class StaticBox(StaticCollider):
+    """An axis-aligned box that never moves, such as a platform.
+
+    Parameters
+    ----------
+    xpos: :class:`float`
+        The position of the center of the box on the x axis.
+
+    ypos: :class:`float`
+        The position of the center of the box on the y axis.
+
+    zpos: :class:`float`
+        The position of the center of the box on the z axis. Defaults to ``0.0``.
+
+    x_length: :class:`float`
+        The length of the box on the x axis in meters.
+
+    y_length: :class:`float`
+        The length of the box on the y axis in meters.
+
+    z_length: :class:`float`
+        The length of the box on the z axis in meters. Defaults to ``0.0`` (a flat box, for 2D games).
+
+    restitution: :class:`float`
+        How bouncy the box is. Defaults to ``1.0``.
+
+    friction: :class:`float`
+        The coefficient of friction of the box. Defaults to ``0.0``.
+
+    Attributes
+    ----------
+    center: tuple(:class:`float`, :class:`float`, :class:`float`)
+        The position of the center of the box in the form (x, y, z)
+
+    half_extents: tuple(:class:`float`, :class:`float`, :class:`float`)
+        Half the length of the box on each axis in the form (x, y, z)
+
+    """
+
+    def __init__(self, xpos, ypos, x_length, y_length, zpos=0.0, z_length=0.0, restitution=1.0, friction=0.0):
+        super().__init__(restitution, friction)
+        self.center = (xpos, ypos, zpos)
+        self.half_extents = (x_length/2, y_length/2, z_length/2)
+
+    def find_contacts(self, states) -> tuple:
+        np = require_numpy()
+        center = np.asarray(self.center, dtype=float)
+        half_extents = np.asarray(self.half_extents, dtype=float)
+        positions = states[:, POS:POS+3]
+        extents = states[:, EXTENTS:EXTENTS+3]
+
+        #Only test the objects whose bounding boxes reach the box
+        near = np.flatnonzero((np.abs(positions - center) <= extents + half_extents).all(axis=1))
+        if len(near) == 0:
+            return near, np.zeros((0, 3)), np.zeros(0)
+        boxes = near[states[near, SHAPE] == BOX]
+        others = near[states[near, SHAPE] != BOX] #Spheres, and points (spheres with no radius)
+
+        box_colliding, box_normals, box_depths = _box_box(np, np.tile(center, (len(boxes), 1)), np.tile(half_extents, (len(boxes), 1)),
+                positions[boxes], extents[boxes])
+        radii = np.where(states[others, SHAPE] == SPHERE, extents[others, 0], 0.0)
+        other_colliding, other_normals, other_depths = _sphere_box(np, positions[others], radii,
+                np.tile(center, (len(others), 1)), np.tile(half_extents, (len(others), 1)))
+
+        #The normals of the sphere test point from the sphere into the box, so they are flipped to push objects out
+        indexes = np.concatenate((boxes[box_colliding], others[other_colliding]))
+        normals = np.concatenate((box_normals[box_colliding], -other_normals[other_colliding]))
+        depths = np.concatenate((box_depths[box_colliding], other_depths[other_colliding]))
+        order = np.argsort(indexes, kind="stable")
+        return indexes[order], normals[order], depths[order]
+
+    def time_of_impact(self, states, starts, ends) -> tuple:
+        np = require_numpy()
+        #Growing the box by the size of each object turns the object into a point moving along a ray (slab method).
+        #This is exact for boxes, and slightly early at the corners for spheres.
+        reach = np.asarray(self.half_extents, dtype=float) + states[:, EXTENTS:EXTENTS+3]
+        lows = np.asarray(self.center, dtype=float) - reach
+        highs = np.asarray(self.center, dtype=float) + reach
+        path = ends - starts
+        moving = path != 0
+        safe_path = np.where(moving, path, 1.0)
+        with np.errstate(invalid="ignore"):
+            first_crossing = np.where(moving, np.minimum((lows - starts)/safe_path, (highs - starts)/safe_path), -np.inf)
+            last_crossing = np.where(moving, np.maximum((lows - starts)/safe_path, (highs - starts)/safe_path), np.inf)
+        #Axes the object does not move along must already be within the box's slab
+        outside_slab = ~moving & ((starts < lows) | (starts > highs))
+        entry_axis = first_crossing.argmax(axis=1)
+        entry = first_crossing.max(axis=1)
+        leave = last_crossing.min(axis=1)
+        hitting = ~outside_slab.any(axis=1) & (entry > 0) & (entry <= leave) & (entry <= 1)
+
+        rows = np.arange(len(states))
+        times = np.where(hitting, entry, np.inf)
+        normals = np.zeros((len(states), 3))
+        normals[rows, entry_axis] = -np.sign(path[rows, entry_axis])
+        return times, normals
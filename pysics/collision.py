@@ -0,0 +1,356 @@
+from .world import require_numpy, POS, VEL, MASS, EXTENTS, SHAPE
+from .shapes import SPHERE, BOX
+
+class Contact():
+    """A single point of contact between two objects that are overlapping.
+
+    Attributes
+    ----------
+    first: :class:`pysics.obj.PhysicsObject`
+        The first object.
+
+    second: :class:`pysics.obj.PhysicsObject`
+        The second object.
+
+    normal: tuple(:class:`float`, :class:`float`, :class:`float`)
+        The direction (a unit vector) in which the second object should be pushed to separate it from the first, in the form (x, y, z)
+
+    depth: :class:`float`
+        How far the objects overlap along the normal, in meters.
+
+    """
+
+    __slots__ = ("first", "second", "normal", "depth")
+
+    def __init__(self, first, second, normal, depth):
+        self.first = first
+        self.second = second
+        self.normal = normal
+        self.depth = depth
+
+class Contacts():
+    """All the contacts found in one tick, stored as arrays so that they can be resolved in bulk.
+
+    Iterating over it gives :class:`Contact` instances.
+
+    Attributes
+    ----------
+    objects: List[:class:`pysics.obj.PhysicsObject`]
+        The objects the indexes in :attr:`first` and :attr:`second` refer to.
+
+    first: :class:`numpy.ndarray`
+        The index of the first object of each contact.
+
+    second: :class:`numpy.ndarray`
+        The index of the second object of each contact.
+
+    normals: :class:`numpy.ndarray`
+        The normal of each contact (pointing from the first object towards the second), shape ``(len(contacts), 3)``.
+
+    depths: :class:`numpy.ndarray`
+        How far the objects of each contact overlap, in meters.
+
+    """
+
+    def __init__(self, objects, first, second, normals, depths):
+        self.objects = objects
+        self.first = first
+        self.second = second
+        self.normals = normals
+        self.depths = depths
+
+    def __len__(self):
+        return len(self.depths)
+
+    def __iter__(self):
+        if len(self) == 0: return
+        objects = self.objects
+        for first, second, normal, depth in zip(self.first.tolist(), self.second.tolist(), self.normals.tolist(), self.depths.tolist()):
+            yield Contact(objects[first], objects[second], tuple(normal), depth)
+
+def _sphere_sphere(np, position_a, radius_a, position_b, radius_b):
+    """Returns (colliding, normals, depths) for spheres a and b."""
+    delta = position_b - position_a
+    distance = np.sqrt((delta*delta).sum(axis=1))
+    depths = radius_a + radius_b - distance
+    normals = np.zeros_like(delta)
+    normals[:, 1] = 1.0 #Spheres exactly on top of each other are pushed apart vertically
+    apart = distance > 0
+    normals[apart] = delta[apart]/distance[apart, None]
+    return depths > 0, normals, depths
+
+def _box_box(np, position_a, extents_a, position_b, extents_b):
+    """Returns (colliding, normals, depths) for axis-aligned boxes a and b, separated along the axis they overlap least on."""
+    overlap = np.minimum(position_a + extents_a, position_b + extents_b) - np.maximum(position_a - extents_a, position_b - extents_b)
+    #Flat boxes (such as 2D boxes with no z length) in the same plane overlap on that axis without any depth
+    flat = (extents_a + extents_b) == 0
+    overlap[flat] = np.where(position_a[flat] == position_b[flat], np.inf, -1.0)
+    axis = overlap.argmin(axis=1)
+    rows = np.arange(len(axis))
+    depths = overlap[rows, axis]
+    normals = np.zeros_like(position_a)
+    normals[rows, axis] = np.where(position_b[rows, axis] >= position_a[rows, axis], 1.0, -1.0)
+    return depths > 0, normals, depths
+
+def _sphere_box(np, position_a, radius_a, position_b, extents_b):
+    """Returns (colliding, normals, depths) for sphere a and axis-aligned box b."""
+    closest = np.clip(position_a, position_b - extents_b, position_b + extents_b)
+    delta = closest - position_a
+    distance = np.sqrt((delta*delta).sum(axis=1))
+    depths = radius_a - distance
+    normals = np.zeros_like(delta)
+    outside = distance > 0
+    normals[outside] = delta[outside]/distance[outside, None]
+
+    #A center inside the box is pushed out through the nearest face
+    inside = ~outside
+    if inside.any():
+        offset = position_a[inside] - position_b[inside]
+        face_distance = extents_b[inside] - np.abs(offset)
+        face_distance[extents_b[inside] == 0] = np.inf
+        axis = face_distance.argmin(axis=1)
+        rows = np.arange(len(axis))
+        inside_normals = np.zeros_like(offset)
+        #The box is pushed away from the sphere, the opposite way to the face the center is nearest to
+        inside_normals[rows, axis] = np.where(offset[rows, axis] >= 0, -1.0, 1.0)
+        normals[inside] = inside_normals
+        depths[inside] = radius_a[inside] + face_distance[rows, axis]
+    return depths > 0, normals, depths
+
+def find_contacts(objects, states, pairs) -> Contacts:
+    """
+    Run the exact (narrow phase) collision tests on candidate pairs found by a broad phase, for every pair at once.
+
+    Supports sphere/sphere, box/box (axis-aligned) and sphere/box pairs.
+    Use :func:`plane_contacts` to test shapes against a plane.
+
+    Parameters
+    ----------
+    objects: List[:class:`pysics.obj.PhysicsObject`]
+        The objects the pairs refer to.
+
+    states: :class:`numpy.ndarray`
+        The state row of each object (see :data:`pysics.world.STATE_FIELDS`), shape ``(len(objects), NUM_FIELDS)``.
+
+    pairs: :class:`numpy.ndarray`
+        The candidate pairs as indexes into ``objects``, shape ``(number of pairs, 2)``.
+
+    Returns
+    -------
+    :class:`Contacts`
+        The pairs that are actually overlapping, in the order they were given.
+    """
+    np = require_numpy()
+    first = pairs[:, 0]
+    second = pairs[:, 1]
+    kind_a = states[first, SHAPE]
+    kind_b = states[second, SHAPE]
+    position_a = states[first, POS:POS+3]
+    position_b = states[second, POS:POS+3]
+    extents_a = states[first, EXTENTS:EXTENTS+3]
+    extents_b = states[second, EXTENTS:EXTENTS+3]
+
+    colliding = np.zeros(len(pairs), dtype=bool)
+    normals = np.zeros((len(pairs), 3))
+    depths = np.zeros(len(pairs))
+
+    def test(mask, function, position_1, size_1, position_2, size_2, flip=False):
+        """Run one kind of test on the masked pairs. Flipped tests have their shapes given in the opposite order."""
+        if not mask.any(): return
+        pair_colliding, pair_normals, pair_depths = function(np, position_1[mask], size_1[mask], position_2[mask], size_2[mask])
+        colliding[mask] = pair_colliding
+        normals[mask] = -pair_normals if flip else pair_normals
+        depths[mask] = pair_depths
+
+    radius_a = extents_a[:, 0]
+    radius_b = extents_b[:, 0]
+    test((kind_a == SPHERE) & (kind_b == SPHERE), _sphere_sphere, position_a, radius_a, position_b, radius_b)
+    test((kind_a == BOX) & (kind_b == BOX), _box_box, position_a, extents_a, position_b, extents_b)
+    test((kind_a == SPHERE) & (kind_b == BOX), _sphere_box, position_a, radius_a, position_b, extents_b)
+    test((kind_a == BOX) & (kind_b == SPHERE), _sphere_box, position_b, radius_b, position_a, extents_a, flip=True)
+
+    return Contacts(objects, first[colliding], second[colliding], normals[colliding], depths[colliding])
+
+def plane_contacts(states, normal, offset) -> tuple:
+    """
+    Test many shapes against one plane at once. Everything on the side of the plane opposite the normal is solid.
+
+    Spheres use their radius and boxes the distance from their center to the corner deepest in the plane.
+
+    Parameters
+    ----------
+    states: :class:`numpy.ndarray`
+        The state row of each object (see :data:`pysics.world.STATE_FIELDS`), shape ``(number of objects, NUM_FIELDS)``.
+
+    normal: tuple(:class:`float`, :class:`float`, :class:`float`)
+        The unit vector pointing out of the solid side of the plane.
+
+    offset: :class:`float`
+        The distance of the plane from the origin along the normal (points on the plane satisfy ``point·normal = offset``).
+
+    Returns
+    -------
+    tuple(:class:`numpy.ndarray`, :class:`numpy.ndarray`)
+        The indexes of the objects penetrating the plane, and how deep each one is, in meters.
+    """
+    np = require_numpy()
+    normal = np.asarray(normal, dtype=float)
+    extents = states[:, EXTENTS:EXTENTS+3]
+    #Spheres reach their radius into the plane, boxes reach their deepest corner
+    reach = np.where(states[:, SHAPE] == SPHERE, extents[:, 0], (extents*np.abs(normal)).sum(axis=1))
+    depths = reach - ((states[:, POS:POS+3]*normal).sum(axis=1) - offset) #Not @, which is done by BLAS in an order that depends on the machine
+    penetrating = np.flatnonzero(depths > 0)
+    return penetrating, depths[penetrating]
+
+class ContactSolver():
+    """Resolves contacts by applying impulses: instant changes of velocity, instead of applying huge forces over tiny ticks.
+
+    For each contact in which the objects are moving towards each other, an impulse along the normal stops them
+    (and bounces them apart according to the :attr:`restitution`), while friction opposes their sliding along the contact: ::
+
+        normal impulse = -(1 + restitution)(relative velocity · normal)/(1/mass1 + 1/mass2)
+        friction impulse <= friction*(normal impulse)
+
+    Momentum is conserved. Overlapping objects are also pushed apart a little each tick so that they do not sink into each other.
+    All contacts are resolved together with NumPy operations. Impulses only change linear velocity.
+
+    Give a contact solver to a :class:`pysics.manager.PhysicsManager` that has a broad phase to resolve collisions every tick.
+
+    Parameters
+    ----------
+    restitution: :class:`float`
+        How bouncy collisions are, from ``0`` (objects stop) to ``1`` (perfectly elastic, no kinetic energy is lost). Defaults to ``1.0``.
+
+    friction: :class:`float`
+        The coefficient of friction between objects. Defaults to ``0.0``.
+
+    iterations: :class:`int`
+        How many times all the contacts are resolved each tick. More iterations are more accurate when objects touch many others. Defaults to ``4``.
+
+    position_correction: :class:`float`
+        The fraction of the overlap removed each tick by moving objects apart. Defaults to ``0.8``.
+
+    slop: :class:`float`
+        An overlap, in meters, that is allowed without being corrected, which keeps resting objects from jittering. Defaults to ``0.01``.
+
+    Attributes
+    ----------
+    restitution: :class:`float`
+        How bouncy collisions are between two objects.
+
+    friction: :class:`float`
+        The coefficient of friction between two objects.
+
+    iterations: :class:`int`
+        How many times all the contacts are resolved each tick.
+
+    position_correction: :class:`float`
+        The fraction of the overlap removed each tick.
+
+    slop: :class:`float`
+        The overlap, in meters, that is allowed without being corrected.
+
+    """
+
+    def __init__(self, restitution=1.0, friction=0.0, iterations=4, position_correction=0.8, slop=0.01):
+        require_numpy() #Fail early if numpy is missing
+        self.restitution = restitution
+        self.friction = friction
+        self.iterations = iterations
+        self.position_correction = position_correction
+        self.slop = slop
+
+    def solve(self, contacts, states):
+        """
+        Apply impulses and position corrections for every contact.
+
+        Parameters
+        ----------
+        contacts: :class:`Contacts`
+            The contacts to resolve.
+
+        states: :class:`numpy.ndarray`
+            The state rows of the contacts' objects. The positions and velocities are changed in place.
+
+        Returns
+        -------
+        :class:`numpy.ndarray`
+            The indexes of the objects whose state changed.
+        """
+        np = require_numpy()
+        if len(contacts) == 0:
+            return np.empty(0, dtype=np.intp)
+        first = contacts.first
+        second = contacts.second
+        inverse_masses = 1/states[:, MASS]
+        self.apply_impulses(states, first, inverse_masses[first], second, inverse_masses[second],
+                contacts.normals, self.restitution, self.friction)
+        self.correct_positions(states, first, inverse_masses[first], second, inverse_masses[second], contacts.normals, contacts.depths)
+        return np.unique(np.concatenate((first, second)))
+
+    def solve_static(self, states, indexes, normals, depths, restitution, friction):
+        """
+        Apply impulses and position corrections for contacts between objects and static geometry that cannot move
+        (see :class:`pysics.colliders.StaticCollider`).
+
+        Parameters
+        ----------
+        states: :class:`numpy.ndarray`
+            The state rows of the objects. The positions and velocities are changed in place.
+
+        indexes: :class:`numpy.ndarray`
+            The index of the object in each contact.
+
+        normals: :class:`numpy.ndarray`
+            The normal of each contact, pointing out of the static geometry.
+
+        depths: :class:`numpy.ndarray`
+            How deep each object is in the static geometry, in meters.
+
+        restitution: :class:`float`
+            How bouncy the static geometry is.
+
+        friction: :class:`float`
+            The coefficient of friction of the static geometry.
+        """
+        if len(indexes) == 0: return
+        inverse_masses = 1/states[indexes, MASS]
+        self.apply_impulses(states, None, 0.0, indexes, inverse_masses, normals, restitution, friction)
+        self.correct_positions(states, None, 0.0, indexes, inverse_masses, normals, depths)
+
+    def apply_impulses(self, states, first, inverse_mass_a, second, inverse_mass_b, normals, restitution, friction):
+        """Apply the normal and friction impulses for a batch of contacts, :attr:`iterations` times.
+        ``restitution`` and ``friction`` can be single values or one value per contact.
+        Contacts against static geometry are given by setting ``first`` to ``None`` and ``inverse_mass_a`` to ``0``."""
+        np = require_numpy()
+        total_inverse_mass = inverse_mass_a + inverse_mass_b
+        for _ in range(self.iterations):
+            velocity_b = states[second, VEL:VEL+3]
+            relative = velocity_b if first is None else velocity_b - states[first, VEL:VEL+3]
+            normal_speed = (relative*normals).sum(axis=1)
+            approaching = normal_speed < 0
+            if not approaching.any(): break
+
+            normal_impulse = np.where(approaching, -(1 + restitution)*normal_speed/total_inverse_mass, 0.0)
+            tangent = relative - normal_speed[:, None]*normals
+            tangent_speed = np.sqrt((tangent*tangent).sum(axis=1))
+            sliding = approaching & (tangent_speed > 0)
+            #Friction can at most stop the sliding, and can be at most friction*(normal impulse) (Coulomb friction)
+            friction_impulse = np.where(sliding, np.minimum(tangent_speed/total_inverse_mass, friction*normal_impulse), 0.0)
+            safe_speed = np.where(sliding, tangent_speed, 1.0)
+            impulses = normal_impulse[:, None]*normals - (friction_impulse/safe_speed)[:, None]*tangent
+
+            #Objects in several contacts receive the sum of their impulses
+            velocities = states[:, VEL:VEL+3] #A view
+            np.add.at(velocities, second, impulses*inverse_mass_b[:, None])
+            if first is not None:
+                np.add.at(velocities, first, -impulses*inverse_mass_a[:, None])
+
+    def correct_positions(self, states, first, inverse_mass_a, second, inverse_mass_b, normals, depths):
+        """Move the objects of a batch of contacts apart along their normals, in proportion to their inverse masses."""
+        np = require_numpy()
+        correction = np.maximum(depths - self.slop, 0.0)*self.position_correction/(inverse_mass_a + inverse_mass_b)
+        positions = states[:, POS:POS+3] #A view
+        np.add.at(positions, second, (correction*inverse_mass_b)[:, None]*normals)
+        if first is not None:
+            np.add.at(positions, first, -(correction*inverse_mass_a)[:, None]*normals)
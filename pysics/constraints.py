@@ -0,0 +1,319 @@
+import math
+
+from .world import require_numpy, POS, VEL, MASS
+
+class Constraint():
+    """The base class of every constraint. A constraint connects an object to another object, or to a fixed point in space (an anchor).
+
+    Give constraints to a :class:`pysics.manager.PhysicsManager` with :meth:`pysics.manager.PhysicsManager.add_constraint`.
+    Every constraint of a universe is solved together, with NumPy operations, every tick. Both objects must be in the universe;
+    constraints whose objects are not in the universe are skipped.
+
+    Parameters
+    ----------
+    first: :class:`pysics.obj.PhysicsObject`
+        The first object.
+
+    second: :class:`pysics.obj.PhysicsObject`
+        The second object, or ``None`` to connect the first object to the ``anchor`` instead.
+
+    anchor: tuple(:class:`float`, :class:`float`, :class:`float`)
+        The fixed point the first object is connected to if there is no second object. Defaults to ``(0, 0, 0)``.
+
+    Attributes
+    ----------
+    first: :class:`pysics.obj.PhysicsObject`
+        The first object.
+
+    second: :class:`pysics.obj.PhysicsObject`
+        The second object, or ``None`` if the first object is connected to the :attr:`anchor`.
+
+    anchor: tuple(:class:`float`, :class:`float`, :class:`float`)
+        The fixed point the first object is connected to if there is no second object.
+
+    """
+
+    def __init__(self, first, second=None, anchor=(0.0, 0.0, 0.0)):
+        self.first = first
+        self.second = second
+        self.anchor = tuple(anchor)
+
+    def get_length(self) -> float:
+        """
+        Returns the current distance between the first object and the second object (or the anchor).
+
+        Returns
+        -------
+        :class:`float`
+            The distance in meters.
+        """
+        end = self.anchor if self.second is None else self.second.get_pos()
+        return math.sqrt(sum((b - a)**2 for a, b in zip(self.first.get_pos(), end)))
+
+class Spring(Constraint):
+    """A Hookean spring, which pulls its objects together when stretched and pushes them apart when compressed: ::
+
+        force = stiffness*(length - rest length)
+
+    Springs change the velocities of their objects before they move each tick (like :class:`pysics.integrators.SemiImplicitEuler`),
+    which keeps them stable at much longer ticks than applying a spring :class:`pysics.force.Force` every tick.
+
+    Parameters
+    ----------
+    first: :class:`pysics.obj.PhysicsObject`
+        The first object.
+
+    second: :class:`pysics.obj.PhysicsObject`
+        The second object, or ``None`` to connect the first object to the ``anchor``.
+
+    rest_length: :class:`float`
+        The length of the spring when it is neither stretched nor compressed, in meters.
+        Defaults to ``None`` (the current distance between the objects).
+
+    stiffness: :class:`float`
+        The spring constant, in newtons per meter. Defaults to ``1.0``.
+
+    anchor: tuple(:class:`float`, :class:`float`, :class:`float`)
+        The fixed point the first object is connected to if there is no second object. Defaults to ``(0, 0, 0)``.
+
+    Attributes
+    ----------
+    rest_length: :class:`float`
+        The length of the spring when it is neither stretched nor compressed, in meters.
+
+    stiffness: :class:`float`
+        The spring constant, in newtons per meter.
+
+    """
+
+    damping = 0.0
+
+    def __init__(self, first, second=None, rest_length=None, stiffness=1.0, anchor=(0.0, 0.0, 0.0)):
+        super().__init__(first, second, anchor)
+        self.rest_length = self.get_length() if rest_length is None else rest_length
+        self.stiffness = stiffness
+
+class DampedSpring(Spring):
+    """A :class:`Spring` with a damper, which resists its objects moving towards or away from each other,
+    so that their bouncing dies down: ::
+
+        force = stiffness*(length - rest length) + damping*(speed at which the spring is stretching)
+
+    Parameters
+    ----------
+    first: :class:`pysics.obj.PhysicsObject`
+        The first object.
+
+    second: :class:`pysics.obj.PhysicsObject`
+        The second object, or ``None`` to connect the first object to the ``anchor``.
+
+    rest_length: :class:`float`
+        The length of the spring when it is neither stretched nor compressed, in meters.
+        Defaults to ``None`` (the current distance between the objects).
+
+    stiffness: :class:`float`
+        The spring constant, in newtons per meter. Defaults to ``1.0``.
+
+    damping: :class:`float`
+        The damping coefficient, in newton seconds per meter. Defaults to ``0.1``.
+
+    anchor: tuple(:class:`float`, :class:`float`, :class:`float`)
+        The fixed point the first object is connected to if there is no second object. Defaults to ``(0, 0, 0)``.
+
+    Attributes
+    ----------
+    damping: :class:`float`
+        The damping coefficient, in newton seconds per meter.
+
+    """
+
+    def __init__(self, first, second=None, rest_length=None, stiffness=1.0, damping=0.1, anchor=(0.0, 0.0, 0.0)):
+        super().__init__(first, second, rest_length, stiffness, anchor)
+        self.damping = damping
+
+class DistanceConstraint(Constraint):
+    """Keeps its objects exactly a certain distance apart, like a rigid rod between them.
+
+    After the objects move each tick they are moved back to the right distance (in proportion to their inverse masses),
+    and the parts of their velocities that would change the distance are removed.
+
+    Parameters
+    ----------
+    first: :class:`pysics.obj.PhysicsObject`
+        The first object.
+
+    second: :class:`pysics.obj.PhysicsObject`
+        The second object, or ``None`` to connect the first object to the ``anchor``.
+
+    length: :class:`float`
+        The distance to keep between the objects, in meters. Defaults to ``None`` (the current distance between the objects).
+
+    anchor: tuple(:class:`float`, :class:`float`, :class:`float`)
+        The fixed point the first object is connected to if there is no second object. Defaults to ``(0, 0, 0)``.
+
+    Attributes
+    ----------
+    length: :class:`float`
+        The distance to keep between the objects, in meters.
+
+    """
+
+    slack = False
+
+    def __init__(self, first, second=None, length=None, anchor=(0.0, 0.0, 0.0)):
+        super().__init__(first, second, anchor)
+        self.length = self.get_length() if length is None else length
+
+class Rope(DistanceConstraint):
+    """Keeps its objects at most a certain distance apart. The rope is slack (does nothing) when the objects are closer than that.
+
+    Parameters
+    ----------
+    first: :class:`pysics.obj.PhysicsObject`
+        The first object.
+
+    second: :class:`pysics.obj.PhysicsObject`
+        The second object, or ``None`` to connect the first object to the ``anchor``.
+
+    length: :class:`float`
+        The length of the rope, in meters. Defaults to ``None`` (the current distance between the objects).
+
+    anchor: tuple(:class:`float`, :class:`float`, :class:`float`)
+        The fixed point the first object is connected to if there is no second object. Defaults to ``(0, 0, 0)``.
+
+    """
+
+    slack = True
+
+def _ends(np, states, second, anchors):
+    """The positions and velocities of the second end of each constraint, using the anchors where ``second`` is ``-1``."""
+    anchored = second < 0
+    positions = np.where(anchored[:, None], anchors, states[second, POS:POS+3])
+    velocities = np.where(anchored[:, None], 0.0, states[second, VEL:VEL+3])
+    return positions, velocities
+
+def _directions(np, delta):
+    """The lengths of the vectors in ``delta`` and the unit vectors along them (``0`` for vectors of no length)."""
+    lengths = np.sqrt((delta*delta).sum(axis=1))
+    safe_lengths = np.where(lengths > 0, lengths, 1.0)
+    return lengths, delta/safe_lengths[:, None]
+
+def apply_springs(states, first, second, anchors, rest_lengths, stiffnesses, dampings, tick_length):
+    """
+    Change the velocities of the objects of many springs at once by the impulse of each spring over a tick.
+
+    Parameters
+    ----------
+    states: :class:`numpy.ndarray`
+        The state rows of the objects, shape ``(number of objects, NUM_FIELDS)``. The velocities are changed in place.
+
+    first: :class:`numpy.ndarray`
+        The index of the first object of each spring.
+
+    second: :class:`numpy.ndarray`
+        The index of the second object of each spring, or ``-1`` for springs connected to an anchor.
+
+    anchors: :class:`numpy.ndarray`
+        The anchor of each spring, shape ``(number of springs, 3)``.
+
+    rest_lengths: :class:`numpy.ndarray`
+        The rest length of each spring.
+
+    stiffnesses: :class:`numpy.ndarray`
+        The spring constant of each spring.
+
+    dampings: :class:`numpy.ndarray`
+        The damping coefficient of each spring.
+
+    tick_length: :class:`float`
+        The amount of time the springs act for.
+    """
+    np = require_numpy()
+    end_positions, end_velocities = _ends(np, states, second, anchors)
+    lengths, directions = _directions(np, end_positions - states[first, POS:POS+3])
+    stretching = ((end_velocities - states[first, VEL:VEL+3])*directions).sum(axis=1)
+    #Positive forces pull the objects together
+    forces = stiffnesses*(lengths - rest_lengths) + dampings*stretching
+    impulses = (forces*tick_length)[:, None]*directions
+
+    velocities = states[:, VEL:VEL+3] #A view
+    np.add.at(velocities, first, impulses/states[first, MASS][:, None])
+    attached = second >= 0
+    np.add.at(velocities, second[attached], -impulses[attached]/states[second[attached], MASS][:, None])
+
+def _batches(first, second):
+    """Split constraints into batches in which no object appears twice (greedy graph coloring).
+    Returns the indexes of the constraints in each batch."""
+    batches = []
+    used = {} #object index: the batches it already appears in
+    for constraint, (a, b) in enumerate(zip(first.tolist(), second.tolist())):
+        taken = used.setdefault(a, set())
+        if b >= 0: taken = taken | used.setdefault(b, set())
+        batch = 0
+        while batch in taken:
+            batch += 1
+        if batch == len(batches): batches.append([])
+        batches[batch].append(constraint)
+        used[a].add(batch)
+        if b >= 0: used[b].add(batch)
+    return batches
+
+def solve_distances(states, first, second, anchors, lengths, slack, iterations, tick_length):
+    """
+    Move the objects of many distance constraints (and ropes) back to their lengths, then change their velocities by
+    how far they were moved over the tick (position-based dynamics), which removes the parts of their velocities
+    that would change the lengths.
+
+    The constraints are split into batches in which no object appears twice. Each batch is solved at once,
+    and the batches are solved one after another (so that corrections spread along chains), ``iterations`` times.
+
+    Parameters
+    ----------
+    states: :class:`numpy.ndarray`
+        The state rows of the objects, shape ``(number of objects, NUM_FIELDS)``. The positions and velocities are changed in place.
+
+    first: :class:`numpy.ndarray`
+        The index of the first object of each constraint.
+
+    second: :class:`numpy.ndarray`
+        The index of the second object of each constraint, or ``-1`` for constraints connected to an anchor.
+
+    anchors: :class:`numpy.ndarray`
+        The anchor of each constraint, shape ``(number of constraints, 3)``.
+
+    lengths: :class:`numpy.ndarray`
+        The length of each constraint.
+
+    slack: :class:`numpy.ndarray`
+        Whether each constraint can be shorter than its length (a :class:`Rope`).
+
+    iterations: :class:`int`
+        How many times the constraints are solved. More iterations are more accurate for chains of constraints.
+
+    tick_length: :class:`float`
+        The length of the tick the objects just moved for.
+    """
+    np = require_numpy()
+    attached = second >= 0
+    inverse_mass_a = 1/states[first, MASS]
+    inverse_mass_b = np.where(attached, 1/states[np.where(attached, second, 0), MASS], 0.0)
+    total_inverse_mass = inverse_mass_a + inverse_mass_b
+    batches = [np.asarray(batch, dtype=np.intp) for batch in _batches(first, second)]
+
+    positions = states[:, POS:POS+3] #A view
+    start_positions = positions.copy()
+    for _ in range(iterations):
+        for batch in batches:
+            batch_first = first[batch]
+            batch_second = second[batch]
+            batch_attached = attached[batch]
+            end_positions, end_velocities = _ends(np, states, batch_second, anchors[batch])
+            current, directions = _directions(np, end_positions - positions[batch_first])
+            errors = current - lengths[batch]
+            errors = np.where(slack[batch], np.maximum(errors, 0.0), errors)
+            corrections = (errors/total_inverse_mass[batch])[:, None]*directions
+            positions[batch_first] += corrections*inverse_mass_a[batch][:, None]
+            positions[batch_second[batch_attached]] -= (corrections*inverse_mass_b[batch][:, None])[batch_attached]
+
+    moved = np.unique(np.concatenate((first, second[attached])))
+    states[moved, VEL:VEL+3] += (positions[moved] - start_positions[moved])/tick_length
@@ -12,3 +12,11 @@ class MassOfZeroError(Exception):
 class MomentOfInertiaZeroError(Exception):
     """Raised when the user attempts to use a moment of inertia of 0 for a PhysicsObject (prevents division by 0)."""
     pass
+
+class AlreadyBoundError(Exception):
+    """Raised when the user attempts to add a PhysicsObject to an array-backed universe while it is already stored in another array-backed universe."""
+    pass
+
+class UnsharedStateError(Exception):
+    """Raised when a universe run by a UniverseScheduler no longer stores its state in shared memory (because objects were added to it)."""
+    pass
@@ -0,0 +1,338 @@
+import math
+
+from .world import require_numpy
+from .force import EARTH_G
+
+class ForceField():
+    """The base class of every force field. A force field acts on every object of a universe at once, without a
+    :class:`pysics.force.Force` being applied to each object.
+
+    Force fields are given as accelerations, which are added to the acceleration from each object's own forces
+    every tick. Their accelerations always use each object's current mass, position and velocity. Integrators that look ahead
+    during the tick (see :mod:`pysics.integrators`) find the accelerations of the fields at the positions and velocities they try.
+
+    Every force field has two paths that give the same results: :meth:`acceleration` finds the acceleration of a single object,
+    and :meth:`accelerations` finds the accelerations of many objects at once with NumPy operations (used by array-backed universes).
+
+    Give force fields to a :class:`pysics.manager.PhysicsManager` with :meth:`pysics.manager.PhysicsManager.add_field`.
+
+    Attributes
+    ----------
+    mutual: :class:`bool`
+        Whether the field comes from the objects themselves (such as :class:`pysics.nbody.NBodyGravity`).
+        Mutual fields are found once per tick for every object at once with :meth:`mutual_accelerations`,
+        and stay the same during the tick. ``False`` for fields that act on each object alone.
+
+    """
+
+    mutual = False
+
+    def acceleration(self, position, velocity, mass) -> tuple:
+        """
+        Find the acceleration this field gives a single object.
+
+        Parameters
+        ----------
+        position: tuple(:class:`float`, :class:`float`, :class:`float`)
+            The position of the object.
+
+        velocity: tuple(:class:`float`, :class:`float`, :class:`float`)
+            The velocity of the object.
+
+        mass: :class:`float`
+            The mass of the object.
+
+        Returns
+        -------
+        tuple(:class:`float`, :class:`float`, :class:`float`)
+            The acceleration in m/s^2 in the form (x, y, z)
+        """
+        raise NotImplementedError
+
+    def accelerations(self, positions, velocities, masses):
+        """
+        Find the accelerations this field gives many objects at once.
+
+        Parameters
+        ----------
+        positions: :class:`numpy.ndarray`
+            The position of each object, shape ``(number of objects, 3)``.
+
+        velocities: :class:`numpy.ndarray`
+            The velocity of each object, shape ``(number of objects, 3)``.
+
+        masses: :class:`numpy.ndarray`
+            The mass of each object, shape ``(number of objects,)``.
+
+        Returns
+        -------
+        :class:`numpy.ndarray`
+            The acceleration of each object in m/s^2, shape ``(number of objects, 3)``.
+        """
+        raise NotImplementedError
+
+    def mutual_accelerations(self, positions, masses):
+        """
+        Find the accelerations this field gives every object of a universe at once, from where all of them are.
+        Only used by fields that are :attr:`mutual`.
+
+        Parameters
+        ----------
+        positions: :class:`numpy.ndarray`
+            The position of each object, shape ``(number of objects, 3)``.
+
+        masses: :class:`numpy.ndarray`
+            The mass of each object, shape ``(number of objects,)``.
+
+        Returns
+        -------
+        :class:`numpy.ndarray`
+            The acceleration of each object in m/s^2, shape ``(number of objects, 3)``.
+        """
+        raise NotImplementedError
+
+class _HeldAcceleration(ForceField):
+    """The acceleration of a single object from the mutual fields, held for the rest of the tick."""
+
+    def __init__(self, accel):
+        self.accel = accel
+
+    def acceleration(self, position, velocity, mass) -> tuple:
+        return self.accel
+
+def _unit(vector, name) -> tuple:
+    length = math.sqrt(sum(component*component for component in vector))
+    if length == 0:
+        raise ValueError("The {} of a force field cannot be (0, 0, 0).".format(name))
+    return tuple(component/length for component in vector)
+
+class UniformGravity(ForceField):
+    """The same gravitational acceleration for every object, no matter its mass, such as near the surface of a planet: ::
+
+        manager.add_field(UniformGravity(MOON_G))
+
+    This replaces applying a :class:`pysics.force.Force` of :func:`pysics.force.calculate_grav_force` to every object,
+    and stays right when the mass of an object changes.
+
+    Parameters
+    ----------
+    g: :class:`float`
+        The gravitational acceleration in m/s^2. Defaults to :attr:`pysics.force.EARTH_G` (9.80665 m/s^2)
+
+    direction: tuple(:class:`float`, :class:`float`, :class:`float`)
+        The direction gravity pulls in. It does not have to be a unit vector. Defaults to ``(0, -1, 0)`` (down).
+
+    Attributes
+    ----------
+    g: :class:`float`
+        The gravitational acceleration in m/s^2.
+
+    direction: tuple(:class:`float`, :class:`float`, :class:`float`)
+        The unit vector gravity pulls along.
+
+    """
+
+    def __init__(self, g=EARTH_G, direction=(0.0, -1.0, 0.0)):
+        self.g = g
+        self.direction = _unit(direction, "direction")
+
+    def acceleration(self, position, velocity, mass) -> tuple:
+        return tuple(self.g*component for component in self.direction)
+
+    def accelerations(self, positions, velocities, masses):
+        np = require_numpy()
+        return np.tile(np.asarray(self.acceleration(None, None, None), dtype=float), (len(positions), 1))
+
+class LinearDrag(ForceField):
+    """A drag force proportional to the velocity of each object (like slow movement through a thick fluid): ::
+
+        force = -coefficient*velocity
+
+    Parameters
+    ----------
+    coefficient: :class:`float`
+        The drag coefficient, in newton seconds per meter. Defaults to ``0.1``.
+
+    Attributes
+    ----------
+    coefficient: :class:`float`
+        The drag coefficient, in newton seconds per meter.
+
+    """
+
+    def __init__(self, coefficient=0.1):
+        self.coefficient = coefficient
+
+    def acceleration(self, position, velocity, mass) -> tuple:
+        return tuple(-self.coefficient*component/mass for component in velocity)
+
+    def accelerations(self, positions, velocities, masses):
+        return -self.coefficient*velocities/masses[:, None]
+
+class QuadraticDrag(ForceField):
+    """A drag force proportional to the square of the speed of each object (like fast movement through air): ::
+
+        force = -coefficient*speed*velocity
+
+    Parameters
+    ----------
+    coefficient: :class:`float`
+        The drag coefficient, in newton square seconds per square meter. This is ``1/2(air density)(drag coefficient)(area)``
+        for an object moving through air. Defaults to ``0.1``.
+
+    Attributes
+    ----------
+    coefficient: :class:`float`
+        The drag coefficient, in newton square seconds per square meter.
+
+    """
+
+    def __init__(self, coefficient=0.1):
+        self.coefficient = coefficient
+
+    def acceleration(self, position, velocity, mass) -> tuple:
+        speed = math.sqrt(sum(component*component for component in velocity))
+        return tuple(-self.coefficient*speed*component/mass for component in velocity)
+
+    def accelerations(self, positions, velocities, masses):
+        np = require_numpy()
+        speeds = np.sqrt((velocities*velocities).sum(axis=1))
+        return (-self.coefficient*speeds)[:, None]*velocities/masses[:, None] #In the same order as acceleration, so both give the same bits
+
+class Wind(ForceField):
+    """Moving air that pushes every object towards its own velocity, in proportion to how fast the object moves relative to it: ::
+
+        force = coefficient*(wind velocity - velocity)
+
+    Objects left in the wind end up moving along with it. Do not also add a :class:`LinearDrag` for the same air.
+
+    Parameters
+    ----------
+    velocity: tuple(:class:`float`, :class:`float`, :class:`float`)
+        The velocity of the air in m/s in the form (x, y, z)
+
+    coefficient: :class:`float`
+        The drag coefficient, in newton seconds per meter. Defaults to ``0.1``.
+
+    Attributes
+    ----------
+    velocity: tuple(:class:`float`, :class:`float`, :class:`float`)
+        The velocity of the air in m/s in the form (x, y, z)
+
+    coefficient: :class:`float`
+        The drag coefficient, in newton seconds per meter.
+
+    """
+
+    def __init__(self, velocity, coefficient=0.1):
+        self.velocity = tuple(velocity)
+        self.coefficient = coefficient
+
+    def acceleration(self, position, velocity, mass) -> tuple:
+        return tuple(self.coefficient*(wind - component)/mass for wind, component in zip(self.velocity, velocity))
+
+    def accelerations(self, positions, velocities, masses):
+        np = require_numpy()
+        return self.coefficient*(np.asarray(self.velocity, dtype=float) - velocities)/masses[:, None]
+
+class RadialAttractor(ForceField):
+    """Pulls every object towards a point with an acceleration that falls off with the square of the distance,
+    like the gravity of a planet or a star (and repels them if the strength is negative): ::
+
+        acceleration = strength/distance^2
+
+    Parameters
+    ----------
+    center: tuple(:class:`float`, :class:`float`, :class:`float`)
+        The point objects are pulled towards. Defaults to ``(0, 0, 0)``.
+
+    strength: :class:`float`
+        The acceleration at a distance of 1 meter, in m^3/s^2. For the gravity of a body, this is its mass times
+        :attr:`pysics.force.GRAVITATIONAL_CONSTANT`. Defaults to ``1.0``.
+
+    radius: :class:`float`
+        The radius of the attracting body, in meters. Closer than this, the pull shrinks towards the center
+        (as inside a planet of even density) instead of growing without limit. Defaults to ``0.0``.
+
+    Attributes
+    ----------
+    center: tuple(:class:`float`, :class:`float`, :class:`float`)
+        The point objects are pulled towards.
+
+    strength: :class:`float`
+        The acceleration at a distance of 1 meter, in m^3/s^2.
+
+    radius: :class:`float`
+        The radius of the attracting body, in meters.
+
+    """
+
+    def __init__(self, center=(0.0, 0.0, 0.0), strength=1.0, radius=0.0):
+        self.center = tuple(center)
+        self.strength = strength
+        self.radius = radius
+
+    def acceleration(self, position, velocity, mass) -> tuple:
+        offset = tuple(center - component for center, component in zip(self.center, position))
+        distance = max(math.sqrt(sum(component*component for component in offset)), self.radius)
+        if distance == 0: return (0.0, 0.0, 0.0) #At the center
+        scale = self.strength/(distance*distance*distance)
+        return tuple(scale*component for component in offset)
+
+    def accelerations(self, positions, velocities, masses):
+        np = require_numpy()
+        offsets = np.asarray(self.center, dtype=float) - positions
+        distances = np.maximum(np.sqrt((offsets*offsets).sum(axis=1)), self.radius)
+        safe_distances = np.where(distances > 0, distances, 1.0)
+        scales = np.where(distances > 0, self.strength/(safe_distances*safe_distances*safe_distances), 0.0)
+        return scales[:, None]*offsets
+
+def sum_acceleration(fields, position, velocity, mass) -> tuple:
+    """
+    Returns the total acceleration ``(x, y, z)`` that many force fields give a single object.
+
+    Parameters
+    ----------
+    fields: List[:class:`ForceField`]
+        The force fields.
+
+    position: tuple(:class:`float`, :class:`float`, :class:`float`)
+        The position of the object.
+
+    velocity: tuple(:class:`float`, :class:`float`, :class:`float`)
+        The velocity of the object.
+
+    mass: :class:`float`
+        The mass of the object.
+    """
+    x = y = z = 0.0
+    for field in fields:
+        accel = field.acceleration(position, velocity, mass)
+        x += accel[0]
+        y += accel[1]
+        z += accel[2]
+    return (x, y, z)
+
+def sum_accelerations(fields, positions, velocities, masses):
+    """
+    Returns the total acceleration that many force fields give each of many objects, shape ``(number of objects, 3)``.
+
+    Parameters
+    ----------
+    fields: List[:class:`ForceField`]
+        The force fields.
+
+    positions: :class:`numpy.ndarray`
+        The position of each object, shape ``(number of objects, 3)``.
+
+    velocities: :class:`numpy.ndarray`
+        The velocity of each object, shape ``(number of objects, 3)``.
+
+    masses: :class:`numpy.ndarray`
+        The mass of each object, shape ``(number of objects,)``.
+    """
+    np = require_numpy()
+    total = np.zeros((len(positions), 3))
+    for field in fields:
+        total += field.accelerations(positions, velocities, masses)
+    return total
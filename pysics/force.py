@@ -1,6 +1,9 @@
 from .errors import MassOfZeroError
 
+import copyreg
 import math
+import weakref
+from operator import attrgetter
 
 #The gravitational acceleration while on the surface of...
 EARTH_G = 9.80665 #m/s^2
@@ -12,6 +15,9 @@ MOON_G = 1.625 #m/s^2
 MARS_G = 3.72076 #m/2^2
 """The gravitational acceleration on the surface of Mars in m/s^2"""
 
+GRAVITATIONAL_CONSTANT = 6.6743e-11 #N*m^2/kg^2
+"""The gravitational constant (big G) in N*m^2/kg^2, used for the gravity between objects"""
+
 def calculate_grav_force(g=EARTH_G, parent_mass=1) -> float:
     """Calculate the gravitational force that would be applied to an object
     with the given mass given a gravitational acceleration.
@@ -20,6 +26,8 @@ def calculate_grav_force(g=EARTH_G, parent_mass=1) -> float:
         * ``m`` is the mass of the parent object.\n
         * ``g`` is the gravitational acceleration (the gravitational constant).
 
+    To apply gravity to every object in a universe, give the manager a :class:`pysics.fields.UniformGravity` instead.
+
     Parameters
     ----------
     g: :class:`float`
@@ -38,6 +46,18 @@ def calculate_grav_force(g=EARTH_G, parent_mass=1) -> float:
 
     return g*parent_mass
 
+def _force_field(name) -> property:
+    """Exposes an attribute of a :class:`Force` (stored in a private slot) and tells every object the force is applied to
+    when it changes, so that their cached net force and net torque are summed again. Reading it costs as much as reading the slot."""
+    private_name = "_" + name
+
+    def set_value(force, value):
+        setattr(force, private_name, value)
+        if force._parents: #Most forces are not applied to anything while they are being changed
+            for parent in force._parents:
+                parent._invalidate_forces()
+    return property(attrgetter(private_name), set_value)
+
 class Force():
     """A force that acts upon a :class:`PhysicsObject`.
 
@@ -152,34 +172,66 @@ class Force():
         The amount of torque on the z axis in newton meters.
         Vector quantity.
 
+    .. note::
+
+        Changing the components, distances or angles of a force that is already applied to objects is noticed by those objects
+        (they keep a cached net force that is summed again when a force changes).
+
+    .. note::
+
+        Forces use ``__slots__``, so they have no ``__dict__`` and new attributes cannot be added to them.
+        To attach your own data to forces, subclass :class:`Force`: a subclass that does not define ``__slots__`` itself
+        gets a ``__dict__`` again.
+
     """
 
+    __slots__ = ("name", "force_type", "x_torque", "y_torque", "z_torque", "_parents",
+            "_x", "_y", "_z",
+            "_x_rotation_axis_distance", "_y_rotation_axis_distance", "_z_rotation_axis_distance",
+            "_x_rot_angle", "_y_rot_angle", "_z_rot_angle",
+            "__weakref__")
+
+    ATTRIBUTES = ("x", "y", "z", "force_type", "x_rotation_axis_distance", "y_rotation_axis_distance", "z_rotation_axis_distance", "x_rot_angle", "y_rot_angle", "z_rot_angle")
+    """The attributes that can be given to :meth:`pysics.obj.PhysicsObject.replace_force`."""
+
+    x = _force_field("x")
+    y = _force_field("y")
+    z = _force_field("z")
+    x_rotation_axis_distance = _force_field("x_rotation_axis_distance")
+    y_rotation_axis_distance = _force_field("y_rotation_axis_distance")
+    z_rotation_axis_distance = _force_field("z_rotation_axis_distance")
+    x_rot_angle = _force_field("x_rot_angle")
+    y_rot_angle = _force_field("y_rot_angle")
+    z_rot_angle = _force_field("z_rot_angle")
+
     def __init__(self, name, x=0.0, y=0.0, z=0.0, force_type=0, x_rotation_axis_distance=0.0, y_rotation_axis_distance=0.0, z_rotation_axis_distance=0.0, x_rot_angle=0.0, y_rot_angle=0.0, z_rot_angle=0.0):
         """Create a force with the given name and horizontal and vertical forces in newtons. 
         Each dimension defaults to ``0`` so you only have to deal with what you want. force_type defaults to ``0`` to simply add an applied force.
         Force_type is not currently used."""
+        self._parents = weakref.WeakSet() #The objects this force is applied to, which it does not keep alive
         self.name = name
 
+        #The attributes are set through their private slots because no object can be notified yet
+
         #Translational
-        self.x = x #In newtons
-        self.y = y
-        self.z = z
+        self._x = x #In newtons
+        self._y = y
+        self._z = z
 
         #Rotational force variables
 
-        self.x_rotation_axis_distance = x_rotation_axis_distance
-        self.y_rotation_axis_distance = y_rotation_axis_distance
-        self.z_rotation_axis_distance = z_rotation_axis_distance
-
-        self.x_rot_angle = x_rot_angle
-        self.y_rot_angle = y_rot_angle
-        self.z_rot_angle = z_rot_angle
+        self._x_rotation_axis_distance = x_rotation_axis_distance
+        self._y_rotation_axis_distance = y_rotation_axis_distance
+        self._z_rotation_axis_distance = z_rotation_axis_distance
 
-        self.x_torque = 0.0
-        self.y_torque = 0.0
-        self.y_torque = 0.0
+        self._x_rot_angle = x_rot_angle
+        self._y_rot_angle = y_rot_angle
+        self._z_rot_angle = z_rot_angle
 
-        self.calculate_torque()
+        #The same as calculate_torque, without reading the attributes back
+        self.x_torque = x_rotation_axis_distance*x*math.sin(x_rot_angle)
+        self.y_torque = y_rotation_axis_distance*y*math.sin(y_rot_angle)
+        self.z_torque = z_rotation_axis_distance*z*math.sin(z_rot_angle)
 
         self.force_type = force_type
 
@@ -199,8 +251,22 @@ class Force():
 
         """
 
-        self.x_torque = self.x_rotation_axis_distance*self.x*math.sin(self.x_rot_angle)
-        self.y_torque = self.y_rotation_axis_distance*self.y*math.sin(self.y_rot_angle)
-        self.z_torque = self.z_rotation_axis_distance*self.z*math.sin(self.z_rot_angle)
+        self.x_torque = self._x_rotation_axis_distance*self._x*math.sin(self._x_rot_angle)
+        self.y_torque = self._y_rotation_axis_distance*self._y*math.sin(self._y_rot_angle)
+        self.z_torque = self._z_rotation_axis_distance*self._z*math.sin(self._z_rot_angle)
 
         return (self.x_torque, self.y_torque, self.z_torque)
+
+    def __getstate__(self):
+        #The objects a force is applied to are not part of it, so pickling or copying a force does not take them along.
+        #Unpickled and copied objects apply their forces to themselves again (see PhysicsObject.__setstate__)
+        slots = {name: getattr(self, name) for name in copyreg._slotnames(type(self)) if name != "_parents" and hasattr(self, name)}
+        return (getattr(self, "__dict__", None), slots)
+
+    def __setstate__(self, state):
+        attributes, slots = state
+        if attributes:
+            self.__dict__.update(attributes)
+        for name, value in slots.items():
+            setattr(self, name, value)
+        self._parents = weakref.WeakSet()
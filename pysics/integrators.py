@@ -0,0 +1,223 @@
+from .world import POS, VEL, ACCEL, ORIENTATION, ANGULAR_VEL, ANGULAR_ACCEL
+
+class Integrator():
+    """The base class of every integrator. An integrator moves objects forward in time by one tick,
+    from their positions, velocities and accelerations.
+
+    Every integrator has two paths that give the same results: :meth:`step` moves a single object's state row,
+    and :meth:`step_all` moves many state rows at once with NumPy operations (used by array-backed universes).
+
+    Both take an optional ``acceleration`` function, which integrators that look ahead during the tick use to find
+    the linear acceleration at other positions and velocities. Without one, the acceleration stored in the state
+    (calculated from the object's forces at the start of the tick) is used throughout the tick.
+    Angular acceleration is always the one stored in the state.
+
+    Give an integrator to a :class:`pysics.manager.PhysicsManager` to use it for every object in the universe,
+    or to a :class:`pysics.obj.PhysicsObject` to use it for that object only.
+
+    """
+
+    __slots__ = ()
+
+    def step(self, state, tick_length, acceleration=None):
+        """
+        Move a single object's state row forward by one tick, in place. The time passed is not updated.
+
+        Parameters
+        ----------
+        state: List[:class:`float`]
+            The object's state row (see :data:`pysics.world.STATE_FIELDS`).
+
+        tick_length: :class:`float`
+            The amount of time that passes this tick.
+
+        acceleration: Callable[[tuple, tuple], tuple]
+            Returns the linear acceleration ``(x, y, z)`` of the object at a position ``(x, y, z)`` and velocity ``(x, y, z)``.
+            Defaults to the acceleration stored in the state.
+        """
+        raise NotImplementedError
+
+    def step_all(self, states, tick_length, acceleration=None):
+        """
+        Move many state rows forward by one tick at once, in place. The time passed is not updated.
+
+        Parameters
+        ----------
+        states: :class:`numpy.ndarray`
+            The state rows, shape ``(number of objects, NUM_FIELDS)``.
+
+        tick_length: :class:`float`
+            The amount of time that passes this tick.
+
+        acceleration: Callable[[:class:`numpy.ndarray`, :class:`numpy.ndarray`], :class:`numpy.ndarray`]
+            Returns the linear acceleration of every object at positions and velocities of shape ``(number of objects, 3)``.
+            Defaults to the accelerations stored in the states.
+        """
+        raise NotImplementedError
+
+def _stored_acceleration(state):
+    """An acceleration function for :meth:`Integrator.step` that returns the acceleration stored in the state row."""
+    stored = (state[ACCEL], state[ACCEL+1], state[ACCEL+2])
+    return lambda position, velocity: stored
+
+def _stored_accelerations(states):
+    """An acceleration function for :meth:`Integrator.step_all` that returns the accelerations stored in the state rows."""
+    stored = states[:, ACCEL:ACCEL+3].copy()
+    return lambda positions, velocities: stored
+
+class ConstantAcceleration(Integrator):
+    """Moves objects as if their acceleration stays the same for the whole tick (the default): ::
+
+        x = x(initial) + v(initial)(t) + 1/2(a)(t^2)
+        v = v(initial) + (a)(t)
+
+    This is exact when forces do not change during a tick, but drifts when they depend on where objects are
+    (such as springs). The ``acceleration`` function is not used.
+
+    """
+
+    __slots__ = ()
+
+    def step(self, state, tick_length, acceleration=None):
+        #Translational axes first, then angular axes. Velocity is stored 3 fields after position, and acceleration 6 fields after position.
+        for p in (POS, POS+1, POS+2, ORIENTATION, ORIENTATION+1, ORIENTATION+2):
+            state[p] += state[p+3]*tick_length + (1/2)*(state[p+6])*(tick_length*tick_length)
+            state[p+3] += (state[p+6])*(tick_length)
+
+    def step_all(self, states, tick_length, acceleration=None):
+        for p in (POS, ORIENTATION):
+            states[:, p:p+3] += states[:, p+3:p+6]*tick_length + (1/2)*(states[:, p+6:p+9])*(tick_length*tick_length)
+            states[:, p+3:p+6] += (states[:, p+6:p+9])*(tick_length)
+
+class SemiImplicitEuler(Integrator):
+    """Updates the velocity first, then moves objects with their new velocity (also called symplectic Euler): ::
+
+        v = v(initial) + a(x, v)(t)
+        x = x(initial) + v(t)
+
+    Only one acceleration is needed per tick, and energy does not grow over time the way it does with the explicit
+    Euler method, so oscillating systems such as springs stay stable at much longer ticks. This includes springs made of
+    forces that are recalculated every tick, since the acceleration at the start of the tick is the one it uses.
+
+    """
+
+    __slots__ = ()
+
+    def step(self, state, tick_length, acceleration=None):
+        if acceleration is None: acceleration = _stored_acceleration(state)
+        accel = acceleration(tuple(state[POS:POS+3]), tuple(state[VEL:VEL+3]))
+        for axis in range(3):
+            state[VEL+axis] += accel[axis]*tick_length
+            state[POS+axis] += state[VEL+axis]*tick_length
+            state[ANGULAR_VEL+axis] += state[ANGULAR_ACCEL+axis]*tick_length
+            state[ORIENTATION+axis] += state[ANGULAR_VEL+axis]*tick_length
+
+    def step_all(self, states, tick_length, acceleration=None):
+        if acceleration is None: acceleration = _stored_accelerations(states)
+        states[:, VEL:VEL+3] += acceleration(states[:, POS:POS+3], states[:, VEL:VEL+3])*tick_length
+        states[:, POS:POS+3] += states[:, VEL:VEL+3]*tick_length
+        states[:, ANGULAR_VEL:ANGULAR_VEL+3] += states[:, ANGULAR_ACCEL:ANGULAR_ACCEL+3]*tick_length
+        states[:, ORIENTATION:ORIENTATION+3] += states[:, ANGULAR_VEL:ANGULAR_VEL+3]*tick_length
+
+class VelocityVerlet(Integrator):
+    """Moves objects with the acceleration at the start of the tick, then updates their velocity with the average
+    of the accelerations at the start and at the end of the tick: ::
+
+        x = x(initial) + v(initial)(t) + 1/2(a(initial))(t^2)
+        v = v(initial) + 1/2(a(initial) + a(x, v(initial) + a(initial)(t)))(t)
+
+    Second order accurate and symplectic, for two accelerations per tick. The acceleration at the end of the tick
+    is found with an estimate of the final velocity, which is exact for forces that only depend on position.
+
+    Only force fields are found at the end of the tick: the forces applied to an object stay the same during the tick,
+    so an object with forces alone is moved the same way as with :class:`ConstantAcceleration`.
+
+    """
+
+    __slots__ = ()
+
+    def step(self, state, tick_length, acceleration=None):
+        if acceleration is None: acceleration = _stored_acceleration(state)
+        start_accel = acceleration(tuple(state[POS:POS+3]), tuple(state[VEL:VEL+3]))
+        for axis in range(3):
+            state[POS+axis] += state[VEL+axis]*tick_length + (1/2)*start_accel[axis]*(tick_length*tick_length)
+        velocity_estimate = tuple(state[VEL+axis] + start_accel[axis]*tick_length for axis in range(3))
+        end_accel = acceleration(tuple(state[POS:POS+3]), velocity_estimate)
+        for axis in range(3):
+            state[VEL+axis] += (1/2)*(start_accel[axis] + end_accel[axis])*tick_length
+            #Angular acceleration is constant during the tick
+            state[ORIENTATION+axis] += state[ANGULAR_VEL+axis]*tick_length + (1/2)*state[ANGULAR_ACCEL+axis]*(tick_length*tick_length)
+            state[ANGULAR_VEL+axis] += state[ANGULAR_ACCEL+axis]*tick_length
+
+    def step_all(self, states, tick_length, acceleration=None):
+        if acceleration is None: acceleration = _stored_accelerations(states)
+        positions = states[:, POS:POS+3]
+        velocities = states[:, VEL:VEL+3]
+        start_accel = acceleration(positions, velocities)
+        positions += velocities*tick_length + (1/2)*start_accel*(tick_length*tick_length)
+        end_accel = acceleration(positions, velocities + start_accel*tick_length)
+        velocities += (1/2)*(start_accel + end_accel)*tick_length
+        states[:, ORIENTATION:ORIENTATION+3] += (states[:, ANGULAR_VEL:ANGULAR_VEL+3]*tick_length
+                + (1/2)*states[:, ANGULAR_ACCEL:ANGULAR_ACCEL+3]*(tick_length*tick_length))
+        states[:, ANGULAR_VEL:ANGULAR_VEL+3] += states[:, ANGULAR_ACCEL:ANGULAR_ACCEL+3]*tick_length
+
+class RK4(Integrator):
+    """The classic fourth order Runge-Kutta method. The acceleration is found at four points during the tick,
+    and the object is moved with a weighted average of them.
+
+    Fourth order accurate: the most accurate integrator here for smooth forces (such as springs and drag) at a
+    given tick length, for four accelerations per tick. It is not symplectic, so very long simulations of
+    oscillating systems slowly lose energy.
+
+    Like :class:`VelocityVerlet`, only force fields are found at the four points, and the forces applied to an object
+    stay the same during the tick.
+
+    """
+
+    __slots__ = ()
+
+    def step(self, state, tick_length, acceleration=None):
+        if acceleration is None: acceleration = _stored_acceleration(state)
+        half = tick_length/2
+        position = tuple(state[POS:POS+3])
+        velocity = tuple(state[VEL:VEL+3])
+
+        def offset(base, rate, time):
+            return tuple(base[axis] + rate[axis]*time for axis in range(3))
+
+        k1_velocity = velocity
+        k1_accel = acceleration(position, velocity)
+        k2_velocity = offset(velocity, k1_accel, half)
+        k2_accel = acceleration(offset(position, k1_velocity, half), k2_velocity)
+        k3_velocity = offset(velocity, k2_accel, half)
+        k3_accel = acceleration(offset(position, k2_velocity, half), k3_velocity)
+        k4_velocity = offset(velocity, k3_accel, tick_length)
+        k4_accel = acceleration(offset(position, k3_velocity, tick_length), k4_velocity)
+
+        for axis in range(3):
+            state[POS+axis] += tick_length/6*(k1_velocity[axis] + 2*k2_velocity[axis] + 2*k3_velocity[axis] + k4_velocity[axis])
+            state[VEL+axis] += tick_length/6*(k1_accel[axis] + 2*k2_accel[axis] + 2*k3_accel[axis] + k4_accel[axis])
+            #Angular acceleration is constant during the tick, for which RK4 is exact
+            state[ORIENTATION+axis] += state[ANGULAR_VEL+axis]*tick_length + (1/2)*state[ANGULAR_ACCEL+axis]*(tick_length*tick_length)
+            state[ANGULAR_VEL+axis] += state[ANGULAR_ACCEL+axis]*tick_length
+
+    def step_all(self, states, tick_length, acceleration=None):
+        if acceleration is None: acceleration = _stored_accelerations(states)
+        half = tick_length/2
+        position = states[:, POS:POS+3].copy()
+        velocity = states[:, VEL:VEL+3].copy()
+
+        k1_velocity = velocity
+        k1_accel = acceleration(position, velocity)
+        k2_velocity = velocity + k1_accel*half
+        k2_accel = acceleration(position + k1_velocity*half, k2_velocity)
+        k3_velocity = velocity + k2_accel*half
+        k3_accel = acceleration(position + k2_velocity*half, k3_velocity)
+        k4_velocity = velocity + k3_accel*tick_length
+        k4_accel = acceleration(position + k3_velocity*tick_length, k4_velocity)
+
+        states[:, POS:POS+3] += tick_length/6*(k1_velocity + 2*k2_velocity + 2*k3_velocity + k4_velocity)
+        states[:, VEL:VEL+3] += tick_length/6*(k1_accel + 2*k2_accel + 2*k3_accel + k4_accel)
+        states[:, ORIENTATION:ORIENTATION+3] += (states[:, ANGULAR_VEL:ANGULAR_VEL+3]*tick_length
+                + (1/2)*states[:, ANGULAR_ACCEL:ANGULAR_ACCEL+3]*(tick_length*tick_length))
+        states[:, ANGULAR_VEL:ANGULAR_VEL+3] += states[:, ANGULAR_ACCEL:ANGULAR_ACCEL+3]*tick_length
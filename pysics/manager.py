@@ -1,6 +1,24 @@
+import hashlib
+import itertools
+import math
+import os
+import struct
+import sys
+from array import array
+from concurrent.futures import ThreadPoolExecutor, wait
+from fractions import Fraction
+
 from .obj import PhysicsObject
 
 from .errors import NameUsedError
+from .errors import AlreadyBoundError
+from .world import ArrayWorld, require_numpy, NUM_FIELDS, POS, VEL, ACCEL, MASS, EXTENTS, SHAPE, CCD, PREVIOUS_POS, TIME_PASSED, ANGULAR_VEL, NET_FORCE, SLEEP_TIMER, ASLEEP
+from .shapes import NO_SHAPE
+from .collision import Contacts, ContactSolver, find_contacts
+from .integrators import ConstantAcceleration
+from .constraints import Spring, apply_springs, solve_distances
+from .fields import sum_accelerations, _HeldAcceleration
+from . import snapshot as snapshots
 
 class PhysicsManager():
     """Represents a universe in which physics works the way it does in that universe.
@@ -15,11 +33,70 @@ class PhysicsManager():
     time_passed: :class:`float`
         The amount of time, in seconds, that has passed in this manager's universe.
 
+    array_backed: :class:`bool`
+        If ``True``, the state of every object in this universe is stored in contiguous NumPy buffers owned by this manager
+        (a :class:`pysics.world.ArrayWorld`) instead of in each object. Requires ``numpy``. Defaults to ``False``.
+
+    broad_phase: :class:`pysics.broadphase.BroadPhase`
+        Finds the pairs of objects whose bounding boxes overlap after every tick (such as a :class:`pysics.broadphase.SpatialHashGrid`).
+        Defaults to ``None`` (no collision detection).
+
+    contact_solver: :class:`pysics.collision.ContactSolver`
+        Resolves the collisions between objects found by the ``broad_phase`` every tick with impulses. Defaults to ``None``.
+
+    colliders: List[:class:`pysics.colliders.StaticCollider`]
+        Static geometry (floors, walls, platforms) that objects bounce off. Requires ``numpy``. Defaults to no colliders.
+
+    max_ticks_per_advance: :class:`int`
+        The most ticks a single call to :meth:`advance` can run. Defaults to ``5``.
+
+    integrator: :class:`pysics.integrators.Integrator`
+        Moves the objects each tick. Defaults to ``None`` (constant acceleration during each tick).
+
+    max_step_distance: :class:`float`
+        Turns on adaptive ticks: the farthest, in meters, any object may move in one substep. Defaults to ``None``.
+
+    error_tolerance: :class:`float`
+        Turns on adaptive ticks: the largest estimated error in position, in meters, allowed in one substep. Requires ``numpy``. Defaults to ``None``.
+
+    max_substeps: :class:`int`
+        The most substeps a single adaptive tick can be split into. Defaults to ``64``.
+
+    sleep_ticks: :class:`int`
+        Turns on sleeping: how many ticks in a row an object has to stay still before it falls asleep. Requires ``numpy``. Defaults to ``None``.
+
+    sleep_velocity: :class:`float`
+        The fastest, in meters per second, an object can move and still count as still. Defaults to ``0.1``.
+
+    sleep_angular_velocity: :class:`float`
+        The fastest, in radians per second, an object can spin and still count as still. Defaults to ``0.1``.
+
+    sleep_force: :class:`float`
+        The largest net force, in newtons, that can act on an object that counts as still. Defaults to ``None`` (any net force).
+
+    constraints: List[:class:`pysics.constraints.Constraint`]
+        Springs, distance constraints and ropes between the objects. Requires ``numpy``. Defaults to no constraints.
+
+    constraint_iterations: :class:`int`
+        How many times the distance constraints and ropes are solved each tick. Defaults to ``4``.
+
+    fields: List[:class:`pysics.fields.ForceField`]
+        Force fields (such as gravity and drag) acting on every object. Defaults to no force fields.
+
+    threads: :class:`int`
+        The number of threads to move objects on. Defaults to ``None`` (move every object on the calling thread).
+
+    deterministic: :class:`bool`
+        Keep :attr:`time_passed` exactly, for lockstep simulations. Defaults to ``False``.
+
     Attributes
     ----------
-    objects: List[:class:`pysics.physics_obj.PhysicsObject`]
-        All the objects within this universe. 
+    objects: tuple(:class:`pysics.physics_obj.PhysicsObject`)
+        All the objects within this universe, in the order they were added.
         Ticks pass for all objects when :meth:`tick` is called.
+        It cannot be changed in place: use :meth:`add_object` and :meth:`remove_object` to change the objects in this universe.
+        Objects are indexed by name, so adding, finding (:meth:`get_object`) and removing an object takes the same
+        amount of time no matter how many objects are in the universe.
 
     tick_length: :class:`float`
         The configured value of how many seconds a tick is.
@@ -30,18 +107,209 @@ class PhysicsManager():
         The amount of time, in seconds, that has passed in this universe.
         Not necessarily the same for all objects within this universe (in case objects are within multiple universes, or an object is ticked individually)
 
+    tick_count: :class:`int`
+        The number of ticks that have passed in this universe (every call to :meth:`tick`, whatever its length).
+        An exact time base for lockstep simulations, which can number their ticks (and the inputs for each tick) with it.
+
+    deterministic: :class:`bool`
+        If ``True``, the ticks are summed exactly (as fractions) and :attr:`time_passed` is the exact total rounded once,
+        so it does not drift from rounding errors: ten ticks of ``0.1`` give exactly ``1.0``, and ticking forwards and then backwards
+        returns to exactly the same time. :attr:`time_passed` can still be set by hand, and is summed exactly from then on.
+
+        Ticks give bit-identical results on every machine (with the same versions of Python and NumPy) whether or not this is on,
+        as long as every machine starts from the same objects, added in the same order, and runs the same ticks (see :meth:`checksum`): net forces are summed exactly
+        (with :func:`math.fsum`), and only operations that IEEE 754 rounds the same way everywhere (``+``, ``-``, ``*``, ``/`` and
+        square roots, in a fixed order) move objects and resolve collisions. The sines and cosines of the rotation angles of forces
+        come from the platform's math library, which can differ in the last bit between platforms.
+
+    world: :class:`pysics.world.ArrayWorld`
+        The buffers holding the state of every object if this universe is array-backed, otherwise ``None``.
+        An object can only be stored in one array-backed universe at a time.
+
+    broad_phase: :class:`pysics.broadphase.BroadPhase`
+        The broad phase used to find :attr:`candidate_pairs`, or ``None``. Can be changed at any time.
+
+    candidate_pairs: List[tuple(:class:`pysics.physics_obj.PhysicsObject`, :class:`pysics.physics_obj.PhysicsObject`)]
+        The pairs of objects (with shapes) whose bounding boxes overlapped at the end of the last tick,
+        found by the :attr:`broad_phase`. Exact (narrow phase) collision tests only need to be run on these pairs.
+        Empty if there is no broad phase.
+
+    contact_solver: :class:`pysics.collision.ContactSolver`
+        Resolves the collisions between objects after every tick, or ``None``. Only used if there is a :attr:`broad_phase`.
+
+    contacts: :class:`pysics.collision.Contacts`
+        The objects that were found overlapping (and resolved) during the last tick. Empty if there is no contact solver.
+
+    colliders: tuple(:class:`pysics.colliders.StaticCollider`)
+        The static geometry of this universe, in the order it was added.
+        It cannot be changed in place: use :meth:`add_collider` and :meth:`remove_collider` to change the colliders of this universe.
+
+    max_ticks_per_advance: :class:`int`
+        The most ticks a single call to :meth:`advance` can run. If a frame took so long that more ticks are owed,
+        the rest of the time is dropped and the universe runs in slow motion for that frame, instead of falling further
+        and further behind as each frame takes longer to simulate than the last (the "spiral of death").
+
+    integrator: :class:`pysics.integrators.Integrator`
+        Moves the objects each tick (such as :class:`pysics.integrators.VelocityVerlet`), or ``None`` to move them as if their
+        acceleration is constant during each tick. Objects with their own :attr:`pysics.obj.PhysicsObject.integrator` use that instead.
+        Can be changed at any time.
+
+    max_step_distance: :class:`float`
+        If not ``None``, each tick is split into as many equal substeps as are needed for no object to move farther
+        than this many meters in one substep (a CFL condition), estimated from the speed and acceleration of every object
+        at the start of the tick. Fast objects then cannot jump over each other, and collisions are resolved after every substep.
+
+    error_tolerance: :class:`float`
+        If not ``None``, each tick is split into substeps until the difference between one substep and two half substeps
+        (step doubling, an estimate of the integrator's error) is at most this many meters for every object.
+        Only forces that change during a tick (such as springs and drag) cause errors to estimate.
+
+    max_substeps: :class:`int`
+        The most substeps a single adaptive tick can be split into.
+
+    last_substeps: :class:`int`
+        How many substeps the last tick was split into (``1`` if adaptive ticks are off).
+
+    sleep_ticks: :class:`int`
+        If not ``None``, objects that stay still (see :attr:`sleep_velocity`, :attr:`sleep_angular_velocity` and :attr:`sleep_force`)
+        for this many ticks in a row fall asleep (see :attr:`pysics.obj.PhysicsObject.asleep`). Sleeping objects are not moved,
+        and pairs of sleeping objects are not tested for collisions, so universes full of resting objects tick much faster.
+
+        Objects that were touching each other during the tick (an island, such as a pile of boxes) fall asleep together, once all
+        of them have been still for long enough, and wake up together when any of them starts moving.
+        Objects also wake up when a force acting on them changes, or when :meth:`pysics.obj.PhysicsObject.wake` is called.
+
+    sleep_velocity: :class:`float`
+        The fastest, in meters per second, an object can move and still count as still.
+
+    sleep_angular_velocity: :class:`float`
+        The fastest, in radians per second, an object can spin and still count as still.
+
+    sleep_force: :class:`float`
+        The largest net force, in newtons, that can act on an object that counts as still, or ``None`` to allow any net force
+        (objects resting on the ground are held up by contacts, not forces, so gravity alone would keep them awake).
+
+    constraints: tuple(:class:`pysics.constraints.Constraint`)
+        The constraints between the objects of this universe, in the order they were added.
+        It cannot be changed in place: use :meth:`add_constraint` and :meth:`remove_constraint` to change the constraints of this universe.
+        Every tick, all springs push and pull their objects in one batched operation before the objects move, and all distance
+        constraints and ropes are solved together after they move (see :mod:`pysics.constraints`).
+
+    constraint_iterations: :class:`int`
+        How many times the distance constraints and ropes are solved each tick. Long chains need more iterations to stay tight.
+
+    fields: tuple(:class:`pysics.fields.ForceField`)
+        The force fields acting on every object of this universe, in the order they were added.
+        It cannot be changed in place: use :meth:`add_field` and :meth:`remove_field` to change the force fields of this universe.
+        Every tick, their accelerations are added to the acceleration from each object's own forces (for every object
+        at once in an array-backed universe). Sleeping objects are not affected.
+
+    recorders: tuple(:class:`pysics.recording.Recorder`)
+        The recorders that record the state of objects after every tick, in the order they were added.
+        It cannot be changed in place: use :meth:`add_recorder` and :meth:`remove_recorder` to change the recorders of this universe.
+
+    threads: :class:`int`
+        The number of threads objects are moved on each tick, or ``None`` to move every object on the calling thread.
+        The objects are split into consecutive ranges of at least 1024 objects, one per thread, and each range is moved
+        (and has the accelerations of the force fields found) on its own thread. Objects are moved independently of each other,
+        so the results are identical to moving them on one thread. NumPy releases the GIL during its batched operations,
+        so array-backed universes with many objects are moved faster; universes that are not array-backed are only
+        moved faster on free-threaded builds of Python. Collisions and constraints are always resolved on the calling thread.
+        The threads are started by the first tick that needs them, and stopped by :meth:`close`.
+
+    alpha: :class:`float`
+        How far, from ``0`` to ``1``, the real time not yet simulated by :meth:`advance` is into the next tick.
+        Draw objects at :meth:`pysics.obj.PhysicsObject.get_interpolated_pos` with this value (or use :meth:`interpolated_positions`)
+        to keep movement smooth when frames are drawn more often than ticks pass.
+
     """
 
-    def __init__(self, objects=[], tick_length=1.0, time_passed=0.0):
-        self.objects = objects.copy()
+    def __init__(self, objects=[], tick_length=1.0, time_passed=0.0, array_backed=False, broad_phase=None, contact_solver=None, colliders=[], max_ticks_per_advance=5, integrator=None, max_step_distance=None, error_tolerance=None, max_substeps=64,
+            sleep_ticks=None, sleep_velocity=0.1, sleep_angular_velocity=0.1, sleep_force=None, constraints=[], constraint_iterations=4, fields=[], threads=None, deterministic=False):
+        self._objects = {} #name: PhysicsObject, in the order they were added
         self.tick_length = tick_length
         self.time_passed = time_passed #seconds
+        self.tick_count = 0
+        self.deterministic = deterministic
+        self._exact_time = None #The exact time passed as a Fraction, if deterministic
+        self.world = ArrayWorld() if array_backed else None
+        self.broad_phase = broad_phase
+        self.candidate_pairs = []
+        self.contact_solver = contact_solver
+        self.contacts = Contacts([], (), (), (), ())
+        self._colliders = []
+        self._static_solver = None #Resolves collisions with colliders if there is no contact solver
+        self.max_ticks_per_advance = max_ticks_per_advance
+        self.integrator = integrator
+        self.max_step_distance = max_step_distance
+        self.error_tolerance = error_tolerance
+        self.max_substeps = max_substeps
+        self.last_substeps = 1
+        self.sleep_ticks = sleep_ticks
+        self.sleep_velocity = sleep_velocity
+        self.sleep_angular_velocity = sleep_angular_velocity
+        self.sleep_force = sleep_force
+        self._constraints = []
+        self.constraint_iterations = constraint_iterations
+        self._fields = list(fields)
+        self._recorders = []
+        self.threads = threads
+        self._thread_pool = None
+        self._thread_pool_owner = None #The process and number of threads the thread pool was made for
+        self.alpha = 0.0
+        self._unsimulated_time = 0.0 #Real time given to advance that has not been simulated yet, in seconds
+        self._last_snapshot = None #The snapshot new snapshots share their unchanged pages with
+        self.add_objects(objects)
+        for collider in colliders:
+            self.add_collider(collider)
+        for constraint in constraints:
+            self.add_constraint(constraint)
+
+    @property
+    def objects(self) -> tuple:
+        """The objects within this universe, in the order they were added."""
+        return tuple(self._objects.values())
+
+    @property
+    def colliders(self) -> tuple:
+        """The static colliders of this universe, in the order they were added."""
+        return tuple(self._colliders)
+
+    @property
+    def constraints(self) -> tuple:
+        """The constraints of this universe, in the order they were added."""
+        return tuple(self._constraints)
+
+    @property
+    def fields(self) -> tuple:
+        """The force fields of this universe, in the order they were added."""
+        return tuple(self._fields)
+
+    @property
+    def recorders(self) -> tuple:
+        """The recorders of this universe, in the order they were added."""
+        return tuple(self._recorders)
 
     def tick(self, tick_length=None):
         """Make a single physics tick pass for all objects in this universe. 
 
         If tick_length is not supplied, then use the universe's tick length.
 
+        In an array-backed universe, accelerations are recalculated for every object and then every object is moved
+        in one batched operation (:meth:`pysics.world.ArrayWorld.calculate_accels` and :meth:`pysics.world.ArrayWorld.integrate`,
+        or :meth:`pysics.integrators.Integrator.step_all` for each integrator in use).
+        The results are identical to ticking each object individually.
+
+        If this universe has :attr:`colliders`, objects that hit them are then bounced off them.
+        Objects with :attr:`pysics.obj.PhysicsObject.ccd` turned on are stopped where their path during the tick first
+        hits a collider, bounced, and moved for the rest of the tick, so that they cannot pass through thin colliders.
+        If this universe has a :attr:`broad_phase`, :attr:`candidate_pairs` is updated after the objects move.
+        If it also has a :attr:`contact_solver`, the overlapping pairs are then resolved (see :meth:`resolve_collisions`).
+
+        If :attr:`max_step_distance` or :attr:`error_tolerance` is set, the tick is split into equal substeps (at most
+        :attr:`max_substeps`) and all of the above happens for each substep. The number of substeps is stored in :attr:`last_substeps`.
+        Quiet ticks take a single step, and only violent moments (launches, impacts) pay for more.
+
         Parameters
         ----------
         tick_length: :class:`float`
@@ -54,10 +322,613 @@ class PhysicsManager():
         """
         
         if tick_length is None: tick_length = self.tick_length #If tick length is None, that means no tick length was given
-        for obj in self.objects:
-            obj.tick(tick_length)
+        substeps = 1
+        if tick_length != 0 and (self.max_step_distance is not None or self.error_tolerance is not None):
+            substeps = self._choose_substeps(tick_length)
+        self.last_substeps = substeps
+        for _ in range(substeps):
+            self._step(tick_length/substeps if substeps > 1 else tick_length)
+
+        self.tick_count += 1
+        if not self.deterministic:
+            self.time_passed += tick_length
+        else:
+            if self._exact_time is None or float(self._exact_time) != self.time_passed:
+                self._exact_time = Fraction(self.time_passed) #First tick, or time_passed was set by hand
+            self._exact_time += Fraction(tick_length)
+            self.time_passed = float(self._exact_time)
+
+        for recorder in self._recorders:
+            recorder.record(self.time_passed)
+
+    def _step(self, tick_length):
+        """Move every object and resolve collisions, without updating the time passed in this universe."""
+        sweep = self._start_sweep(tick_length) if self._colliders else None
+        if self._constraints and tick_length != 0:
+            self._solve_constraints(tick_length, springs=True)
+        if self.world is not None:
+            if tick_length != 0:
+                self.world.calculate_accels()
+                self._integrate_world(tick_length)
+        elif tick_length != 0:
+            integrator = self.integrator
+            sleeping = self.sleep_ticks is not None
+            fields, mutual = self._split_fields()
+            held = self._mutual_accels(mutual).tolist() if mutual else None
+            objects = list(self._objects.values())
+
+            def tick_objects(start, stop):
+                for index in range(start, stop):
+                    obj = objects[index]
+                    if sleeping and obj._state[ASLEEP]:
+                        obj.time_passed += tick_length #Time still passes for sleeping objects
+                        continue
+                    obj.tick(tick_length, integrator, fields if held is None else fields + [_HeldAcceleration(tuple(held[index]))])
+            self._map_chunks(tick_objects, len(objects))
+
+        if self._constraints and tick_length != 0:
+            self._solve_constraints(tick_length, springs=False)
+        if self.broad_phase is not None or self._colliders or self.sleep_ticks is not None:
+            self._resolve_collisions(sweep, update_sleep=True)
+
+    def _solve_constraints(self, tick_length, springs):
+        """Apply the impulses of every spring (if ``springs`` is ``True``), or solve every distance constraint and rope."""
+        np = require_numpy()
+        constraints = [constraint for constraint in self._constraints if isinstance(constraint, Spring) == springs]
+        objects, first, second, constraints = self._constraint_objects(constraints)
+        if not constraints: return
+        if self.world is not None:
+            rows = np.fromiter((obj._row for obj in objects), dtype=np.intp, count=len(objects))
+            states = self.world.state[rows]
+        else:
+            states = np.array([obj._state for obj in objects], dtype=float).reshape(-1, NUM_FIELDS)
+        first = np.asarray(first, dtype=np.intp)
+        second = np.asarray(second, dtype=np.intp)
+        anchors = np.array([constraint.anchor for constraint in constraints], dtype=float).reshape(-1, 3)
+
+        if springs:
+            apply_springs(states, first, second, anchors,
+                    np.array([spring.rest_length for spring in constraints], dtype=float),
+                    np.array([spring.stiffness for spring in constraints], dtype=float),
+                    np.array([spring.damping for spring in constraints], dtype=float), tick_length)
+        else:
+            solve_distances(states, first, second, anchors,
+                    np.array([constraint.length for constraint in constraints], dtype=float),
+                    np.array([constraint.slack for constraint in constraints], dtype=bool), self.constraint_iterations, tick_length)
+
+        if self.world is not None:
+            self.world.state[rows, POS:VEL+3] = states[:, POS:VEL+3]
+        else:
+            self._write_states(objects, states, np.arange(len(objects)))
+
+    def _constraint_objects(self, constraints) -> tuple:
+        """Returns the objects the constraints act on, the index (into those objects) of the first and second object of each constraint
+        (``-1`` for an anchor), and the constraints themselves. Constraints whose objects are not in this universe or are all asleep are left out."""
+        sleeping = self.sleep_ticks is not None
+        objects = []
+        indexes = {} #id(obj): index into objects
+        first = []
+        second = []
+        kept = []
+        for constraint in constraints:
+            a = constraint.first
+            b = constraint.second
+            if self._objects.get(a.name) is not a or (b is not None and self._objects.get(b.name) is not b): continue
+            if sleeping and a._state[ASLEEP] and (b is None or b._state[ASLEEP]): continue
+            for obj in (a, b):
+                if obj is not None and id(obj) not in indexes:
+                    indexes[id(obj)] = len(objects)
+                    objects.append(obj)
+            first.append(indexes[id(a)])
+            second.append(-1 if b is None else indexes[id(b)])
+            kept.append(constraint)
+        return objects, first, second, kept
+
+    def _choose_substeps(self, tick_length) -> int:
+        """Returns how many substeps a tick should be split into, from :attr:`max_step_distance` and :attr:`error_tolerance`."""
+        self._calculate_accels()
+        substeps = 1
+        if self.max_step_distance is not None:
+            distance = self._max_distance(tick_length)
+            substeps = max(int(math.ceil(distance/self.max_step_distance)), 1)
+        if self.error_tolerance is not None and substeps < self.max_substeps:
+            substeps = self._substeps_for_error(tick_length, substeps)
+        return min(substeps, self.max_substeps)
+
+    def _calculate_accels(self):
+        """Bring the acceleration of every object up to date."""
+        fields, mutual = self._split_fields()
+        if self.world is not None:
+            self.world.calculate_accels()
+            states = self.world.state[:self.world.count]
+            if mutual:
+                states[:, ACCEL:ACCEL+3] += self._mutual_accels(mutual)
+            if fields:
+                self._add_field_accels(states, fields)
+            return
+        held = self._mutual_accels(mutual).tolist() if mutual else None
+        for index, obj in enumerate(self._objects.values()):
+            obj.calculate_accel()
+            if held is not None:
+                obj._add_field_accel(fields + [_HeldAcceleration(tuple(held[index]))])
+            elif fields:
+                obj._add_field_accel(fields)
+
+    def _max_distance(self, tick_length) -> float:
+        """Returns the farthest any object would move during a tick, from its current speed and acceleration."""
+        duration = abs(tick_length)
+        if self.world is not None:
+            np = require_numpy()
+            states = self.world.state[:self.world.count]
+            if len(states) == 0: return 0.0
+            speeds = np.sqrt((states[:, VEL:VEL+3]**2).sum(axis=1))
+            accels = np.sqrt((states[:, ACCEL:ACCEL+3]**2).sum(axis=1))
+            return float((speeds*duration + (1/2)*accels*duration*duration).max())
+        distance = 0.0
+        for obj in self._objects.values():
+            state = obj._state
+            speed = math.sqrt(state[VEL]**2 + state[VEL+1]**2 + state[VEL+2]**2)
+            accel = math.sqrt(state[ACCEL]**2 + state[ACCEL+1]**2 + state[ACCEL+2]**2)
+            distance = max(distance, speed*duration + (1/2)*accel*duration*duration)
+        return distance
+
+    def _substeps_for_error(self, tick_length, substeps) -> int:
+        """Double the number of substeps until one substep and two half substeps of this universe's integrator
+        end up within :attr:`error_tolerance` of each other for every object."""
+        objects, states, in_place = self._collision_states()
+        if len(states) == 0: return substeps
+        integrator = self.integrator if self.integrator is not None else ConstantAcceleration()
+        fields = self._split_fields()[0]
+        acceleration = None
+        if fields:
+            #The accelerations are already up to date (see _choose_substeps), with the force fields added
+            force_accels = states[:, ACCEL:ACCEL+3] - sum_accelerations(fields, states[:, POS:POS+3], states[:, VEL:VEL+3], states[:, MASS])
+            acceleration = self._field_acceleration(states, force_accels, fields)
+        while substeps < self.max_substeps:
+            step = tick_length/substeps
+            whole = states.copy()
+            integrator.step_all(whole, step, acceleration)
+            halves = states.copy()
+            integrator.step_all(halves, step/2, acceleration)
+            if acceleration is not None: #The force fields are found again at the start of every substep
+                halves[:, ACCEL:ACCEL+3] = acceleration(halves[:, POS:POS+3], halves[:, VEL:VEL+3])
+            integrator.step_all(halves, step/2, acceleration)
+            if abs(whole[:, POS:POS+3] - halves[:, POS:POS+3]).max() <= self.error_tolerance: break
+            substeps *= 2
+        return substeps
+
+    def _integrate_world(self, tick_length):
+        """Move every object of an array-backed universe, batching the objects that use the same integrator together."""
+        world = self.world
+        np = require_numpy()
+        count = world.count
+        awake = None #The rows to move, if some objects are asleep
+        if self.sleep_ticks is not None:
+            asleep = world.state[:count, ASLEEP] != 0
+            if asleep.any():
+                awake = np.flatnonzero(~asleep)
+        fields, mutual = self._split_fields()
+        if mutual:
+            world.state[:count, ACCEL:ACCEL+3] += self._mutual_accels(mutual)
+        force_accels = self._add_field_accels(world.state[:count], fields) if fields else None
+        if awake is None and self.integrator is None and not world.own_integrators:
+            self._map_chunks(lambda start, stop: world.integrate(tick_length, start, stop), count)
+            return
+
+        default = self.integrator if self.integrator is not None else ConstantAcceleration()
+        if awake is None and not world.own_integrators:
+            def step(start, stop):
+                states = world.state[start:stop]
+                default.step_all(states, tick_length, self._field_acceleration(states, None if force_accels is None else force_accels[start:stop], fields))
+            self._map_chunks(step, count)
+        else:
+            groups = {} #id(integrator): (integrator, rows)
+            for obj in world.own_integrators:
+                groups.setdefault(id(obj._integrator), (obj._integrator, []))[1].append(obj._row)
+            moving = np.arange(count) if awake is None else awake
+            batches = []
+            for integrator, rows in groups.values():
+                rows = np.asarray(rows, dtype=np.intp)
+                batches.append((integrator, rows if awake is None else np.intersect1d(rows, awake)))
+            own_rows = np.concatenate([rows for integrator, rows in batches]) if batches else np.empty(0, dtype=np.intp)
+            batches.insert(0, (default, np.setdiff1d(moving, own_rows)))
+            for integrator, rows in batches:
+                if len(rows) == 0: continue
+                self._map_chunks(lambda start, stop: self._step_rows(integrator, rows[start:stop], tick_length, force_accels, fields), len(rows))
+        world.state[:count, TIME_PASSED] += tick_length
+
+    def _step_rows(self, integrator, rows, tick_length, force_accels, fields):
+        """Move some rows of an array-backed universe with an integrator."""
+        world = self.world
+        states = world.state[rows]
+        integrator.step_all(states, tick_length, self._field_acceleration(states, None if force_accels is None else force_accels[rows], fields))
+        world.state[rows] = states
+
+    #The fewest objects moved on a thread of their own
+    _MIN_CHUNK_SIZE = 1024
+
+    def _map_chunks(self, function, count):
+        """Call ``function(start, stop)`` for consecutive ranges of ``count`` objects, one range per thread (see :attr:`threads`),
+        and wait for all of them. The ranges never overlap, so the results do not depend on the order the threads finish in."""
+        chunks = 1 if self.threads is None else min(self.threads, count//self._MIN_CHUNK_SIZE)
+        if chunks <= 1:
+            function(0, count)
+            return
+        owner = (os.getpid(), self.threads)
+        if self._thread_pool is None or self._thread_pool_owner != owner:
+            #Threads are not copied into forked processes (see pysics.scheduler), so those get a thread pool of their own
+            self._thread_pool = ThreadPoolExecutor(max_workers=self.threads)
+            self._thread_pool_owner = owner
+        bounds = [count*chunk//chunks for chunk in range(chunks + 1)]
+        futures = [self._thread_pool.submit(function, start, stop) for start, stop in zip(bounds, bounds[1:])]
+        wait(futures)
+        for future in futures:
+            future.result() #Raises the error of the first range that failed
+
+    def _split_fields(self) -> tuple:
+        """Returns the force fields that act on each object alone, and the mutual force fields (see :attr:`pysics.fields.ForceField.mutual`)."""
+        fields = []
+        mutual = []
+        for field in self._fields:
+            (mutual if field.mutual else fields).append(field)
+        return fields, mutual
+
+    def _mutual_accels(self, mutual):
+        """Returns the accelerations the mutual force fields give every object (in the order of :meth:`_collision_states`),
+        from where all of them are now."""
+        objects, states, in_place = self._collision_states()
+        positions = states[:, POS:POS+3]
+        masses = states[:, MASS]
+        total = mutual[0].mutual_accelerations(positions, masses)
+        for field in mutual[1:]:
+            total = total + field.mutual_accelerations(positions, masses)
+        return total
+
+    def _add_field_accels(self, states, fields):
+        """Add the accelerations of the force fields to the accelerations of the state rows, in place.
+        Returns the accelerations from the objects' own forces (and the mutual force fields) alone."""
+        force_accels = states[:, ACCEL:ACCEL+3].copy()
 
-        self.time_passed += tick_length
+        def add(start, stop):
+            chunk = states[start:stop]
+            chunk[:, ACCEL:ACCEL+3] += sum_accelerations(fields, chunk[:, POS:POS+3], chunk[:, VEL:VEL+3], chunk[:, MASS])
+        self._map_chunks(add, len(states))
+        return force_accels
+
+    def _field_acceleration(self, states, force_accels, fields):
+        """Returns a function giving the accelerations of the state rows at other positions and velocities, for integrators
+        (see :meth:`pysics.integrators.Integrator.step_all`), or ``None`` if there are no force fields."""
+        if force_accels is None: return None
+        masses = states[:, MASS].copy()
+        return lambda positions, velocities: force_accels + sum_accelerations(fields, positions, velocities, masses)
+
+    def advance(self, real_elapsed:float) -> int:
+        """
+        Run as many ticks of :attr:`tick_length` as fit in the real time that has passed, for games that draw frames
+        at a different rate than physics runs. Time that does not fill a whole tick is kept for the next call,
+        so physics runs at the same speed no matter how fast frames are drawn: ::
+
+            manager = PhysicsManager(tick_length=1/30) #Physics runs at 30 ticks per second
+            while True:
+                manager.advance(clock.tick(144)/1000) #Frames are drawn up to 144 times per second
+                for obj, (x, y, z) in zip(*manager.interpolated_positions()):
+                    ... #Draw obj at (x, y)
+
+        At most :attr:`max_ticks_per_advance` ticks are run per call. :attr:`alpha` is updated after every call.
+
+        Parameters
+        ----------
+        real_elapsed: :class:`float`
+            The real time, in seconds, that has passed since the last call (such as the time since the last frame).
+
+        Returns
+        -------
+        :class:`int`
+            The number of ticks that were run.
+
+        Raises
+        ------
+        :exc:`ValueError`
+            The :attr:`tick_length` is not positive, or ``real_elapsed`` is negative.
+
+        """
+        if self.tick_length <= 0:
+            raise ValueError("Advancing a universe requires a positive tick length.")
+        if real_elapsed < 0:
+            raise ValueError("Real time cannot pass backwards.")
+
+        self._unsimulated_time += real_elapsed
+        ticks = min(int(self._unsimulated_time // self.tick_length), self.max_ticks_per_advance)
+        for tick in range(ticks):
+            if tick == ticks - 1:
+                self._save_previous_positions()
+            self.tick()
+        self._unsimulated_time -= ticks*self.tick_length
+        if self._unsimulated_time >= self.tick_length:
+            #Too far behind: drop the ticks that could not be run, but keep the fraction of a tick towards the next one
+            self._unsimulated_time = math.fmod(self._unsimulated_time, self.tick_length)
+
+        self.alpha = self._unsimulated_time/self.tick_length
+        return ticks
+
+    def _save_previous_positions(self):
+        """Remember where every object is before a tick, so that :meth:`interpolated_positions` can blend from it."""
+        if self.world is not None:
+            state = self.world.state[:self.world.count]
+            state[:, PREVIOUS_POS:PREVIOUS_POS+3] = state[:, POS:POS+3]
+            return
+        for obj in self._objects.values():
+            state = obj._state
+            state[PREVIOUS_POS:PREVIOUS_POS+3] = state[POS:POS+3]
+
+    def interpolated_positions(self) -> tuple:
+        """
+        Returns every object and where to draw it, between its position before the last tick run by :meth:`advance`
+        and its current position (see :attr:`alpha`). Requires ``numpy``.
+
+        Returns
+        -------
+        tuple(List[:class:`pysics.physics_obj.PhysicsObject`], :class:`numpy.ndarray`)
+            The objects, and their interpolated positions in the same order, shape ``(number of objects, 3)``.
+
+        """
+        objects, states, in_place = self._collision_states()
+        return list(objects), (1 - self.alpha)*states[:, PREVIOUS_POS:PREVIOUS_POS+3] + self.alpha*states[:, POS:POS+3]
+
+    def find_candidate_pairs(self) -> list:
+        """
+        Use the :attr:`broad_phase` to find the pairs of objects whose bounding boxes currently overlap.
+        Objects without a shape are ignored.
+
+        Returns
+        -------
+        List[tuple(:class:`pysics.physics_obj.PhysicsObject`, :class:`pysics.physics_obj.PhysicsObject`)]
+            The pairs of objects whose bounding boxes overlap, in a consistent order. Empty if there is no broad phase.
+
+        """
+        if self.broad_phase is None: return []
+        objects, states, in_place = self._collision_states()
+        pairs = self._find_pairs(objects, states)
+        return [(objects[a], objects[b]) for a, b in pairs.tolist()]
+
+    def resolve_collisions(self):
+        """
+        Find the objects that are colliding and resolve the collisions. Updates :attr:`candidate_pairs` and :attr:`contacts`.
+
+        Every object is first tested against every one of the :attr:`colliders` in bulk, and bounced off the ones it hits.
+        Then the :attr:`broad_phase` (if any) finds candidate pairs, exact collision tests find which of them overlap
+        (:func:`pysics.collision.find_contacts`), and the :attr:`contact_solver` (if any) applies impulses to them.
+
+        This is called at the end of every :meth:`tick`, and can be called manually after moving objects.
+
+        """
+        self._resolve_collisions(None)
+
+    def _resolve_collisions(self, sweep, update_sleep=False):
+        """Resolve collisions, first sweeping the objects using continuous collision detection if ``sweep`` is given (see :meth:`_start_sweep`).
+        Then put still objects to sleep and wake moving ones if ``update_sleep`` is ``True`` and sleeping is turned on."""
+        update_sleep = update_sleep and self.sleep_ticks is not None
+        if self.broad_phase is None and not self._colliders and not update_sleep: return
+        np = require_numpy()
+        objects, states, in_place = self._collision_states()
+        sleeping = None #Which objects were asleep at the start of the tick, if sleeping is turned on
+        if self.sleep_ticks is not None:
+            sleeping = states[:, ASLEEP] != 0
+        changed = []
+
+        if self._colliders:
+            solver = self.contact_solver
+            if solver is None:
+                if self._static_solver is None: self._static_solver = ContactSolver()
+                solver = self._static_solver
+            if sweep is not None:
+                changed.append(self._sweep(states, solver, *sweep))
+            for collider in self._colliders:
+                indexes, normals, depths = collider.find_contacts(states)
+                if sleeping is not None: #Sleeping objects stay where they came to rest
+                    awake = ~sleeping[indexes]
+                    indexes, normals, depths = indexes[awake], normals[awake], depths[awake]
+                solver.solve_static(states, indexes, normals, depths, collider.restitution, collider.friction)
+                changed.append(indexes)
+
+        if self.broad_phase is not None:
+            pairs = self._find_pairs(objects, states, sleeping)
+            self.candidate_pairs = [(objects[a], objects[b]) for a, b in pairs.tolist()]
+            if self.contact_solver is not None:
+                self.contacts = find_contacts(objects, states, pairs)
+                changed.append(self.contact_solver.solve(self.contacts, states))
+
+        if update_sleep:
+            changed.append(self._update_sleep(states, sleeping))
+            if not in_place: #Every object's sleep timer may have changed
+                self._write_states(objects, states, np.arange(len(states)), SLEEP_TIMER, ASLEEP+1)
+
+        if not in_place and changed:
+            self._write_states(objects, states, np.unique(np.concatenate(changed)))
+
+    def _update_sleep(self, states, sleeping):
+        """Count how long each object has been still for, put the islands of objects that have been still for long enough
+        to sleep and wake up the islands that have a moving object. Returns the indexes of the objects that fell asleep
+        (their velocities are set to 0)."""
+        np = require_numpy()
+        quiet = ((states[:, VEL:VEL+3]**2).sum(axis=1) <= self.sleep_velocity**2) & \
+                ((states[:, ANGULAR_VEL:ANGULAR_VEL+3]**2).sum(axis=1) <= self.sleep_angular_velocity**2)
+        if self.sleep_force is not None:
+            quiet &= (states[:, NET_FORCE:NET_FORCE+3]**2).sum(axis=1) <= self.sleep_force**2
+        timers = states[:, SLEEP_TIMER]
+        timers = np.where(quiet, np.where(sleeping, timers, timers + 1), 0.0)
+        ready = timers >= self.sleep_ticks
+
+        #An island sleeps only once all of its objects are ready, and wakes up as soon as one of them moves
+        labels = self._islands(len(states), *self._constraint_edges(len(states)))
+        restless = np.zeros(len(states), dtype=bool)
+        restless[labels[~ready]] = True
+        moving = np.zeros(len(states), dtype=bool)
+        moving[labels[~quiet]] = True
+        asleep = (sleeping & ~moving[labels]) | (ready & ~restless[labels])
+
+        timers[sleeping & ~asleep] = 0.0
+        falling_asleep = np.flatnonzero(asleep & ~sleeping)
+        states[falling_asleep, VEL:VEL+3] = 0.0
+        states[falling_asleep, ANGULAR_VEL:ANGULAR_VEL+3] = 0.0
+        states[:, SLEEP_TIMER] = timers
+        states[:, ASLEEP] = asleep
+        if len(falling_asleep) and self.world is None:
+            self._write_states(self.objects, states, falling_asleep, ANGULAR_VEL, ANGULAR_VEL+3)
+        return falling_asleep
+
+    def _constraint_edges(self, count) -> tuple:
+        """Returns the indexes (see :meth:`_collision_states`) of the two objects of every constraint between two objects."""
+        np = require_numpy()
+        first = []
+        second = []
+        if self._constraints:
+            if self.world is not None:
+                index = lambda obj: obj._row
+            else:
+                indexes = {id(obj): position for position, obj in enumerate(self._objects.values())}
+                index = lambda obj: indexes[id(obj)]
+            for constraint in self._constraints:
+                a = constraint.first
+                b = constraint.second
+                if b is None or self._objects.get(a.name) is not a or self._objects.get(b.name) is not b: continue
+                first.append(index(a))
+                second.append(index(b))
+        return np.asarray(first, dtype=np.intp), np.asarray(second, dtype=np.intp)
+
+    def _islands(self, count, first, second):
+        """Returns a label for each object, shared by all the objects that touched each other (directly or through others)
+        in the last tick's :attr:`contacts`, or are connected by the given pairs of indexes (constraints)."""
+        np = require_numpy()
+        labels = np.arange(count)
+        if len(self.contacts.objects) == count:
+            first = np.concatenate((first, np.asarray(self.contacts.first, dtype=np.intp)))
+            second = np.concatenate((second, np.asarray(self.contacts.second, dtype=np.intp)))
+        if len(first) == 0:
+            return labels
+        #Spread the lowest label across every contact until nothing changes
+        while True:
+            lowest = np.minimum(labels[first], labels[second])
+            new_labels = labels.copy()
+            np.minimum.at(new_labels, first, lowest)
+            np.minimum.at(new_labels, second, lowest)
+            new_labels = new_labels[new_labels] #Follow labels to the root of their island
+            if (new_labels == labels).all():
+                return labels
+            labels = new_labels
+
+    def _start_sweep(self, tick_length):
+        """Returns the indexes (see :meth:`_collision_states`) and positions of the objects using continuous collision detection,
+        before they move this tick, and the tick length. Returns ``None`` if no object uses it."""
+        if tick_length <= 0: return None
+        np = require_numpy()
+        if self.world is not None:
+            states = self.world.state[:self.world.count]
+            fast = np.flatnonzero(states[:, CCD] != 0)
+            starts = states[fast, POS:POS+3]
+        else:
+            fast = []
+            starts = []
+            for index, obj in enumerate(self._objects.values()):
+                if obj._state[CCD]:
+                    fast.append(index)
+                    starts.append(obj._state[POS:POS+3])
+            fast = np.asarray(fast, dtype=np.intp)
+            starts = np.asarray(starts, dtype=float).reshape(-1, 3)
+        if len(fast) == 0: return None
+        return fast, starts, tick_length
+
+    #How many times one object can hit colliders during a single tick (such as in a corner) before it is stopped where it is
+    _MAX_IMPACTS = 4
+
+    def _sweep(self, states, solver, fast, starts, tick_length):
+        """Continuous collision detection: move the given objects back to the first point where their path from ``starts``
+        hits a collider, bounce them with the solver, and move them for the rest of the tick. Returns the indexes of the objects moved."""
+        np = require_numpy()
+        ends = states[fast, POS:POS+3]
+        accels = states[fast, ACCEL:ACCEL+3]
+        remaining = np.full(len(fast), tick_length) #Seconds of the tick left for each object
+        moved = []
+        for _ in range(self._MAX_IMPACTS):
+            #The earliest impact of each object over every collider
+            times = np.full(len(fast), np.inf)
+            normals = np.zeros((len(fast), 3))
+            hit_colliders = np.full(len(fast), -1)
+            for index, collider in enumerate(self._colliders):
+                collider_times, collider_normals = collider.time_of_impact(states[fast], starts, ends)
+                earlier = collider_times < times
+                times[earlier] = collider_times[earlier]
+                normals[earlier] = collider_normals[earlier]
+                hit_colliders[earlier] = index
+            hit = np.flatnonzero(np.isfinite(times))
+            if len(hit) == 0: break
+
+            #Only the objects that hit something need to be swept again
+            fast, starts, ends, accels, remaining = fast[hit], starts[hit], ends[hit], accels[hit], remaining[hit]
+            times, normals, hit_colliders = times[hit], normals[hit], hit_colliders[hit]
+            moved.append(fast)
+
+            #Move each object back to the point of impact, with the velocity it had at that moment
+            left = (1 - times)*remaining
+            states[fast, POS:POS+3] = starts + times[:, None]*(ends - starts)
+            states[fast, VEL:VEL+3] -= accels*left[:, None]
+            for index, collider in enumerate(self._colliders):
+                hitting = hit_colliders == index
+                if not hitting.any(): continue
+                solver.solve_static(states, fast[hitting], normals[hitting], np.zeros(int(hitting.sum())), collider.restitution, collider.friction)
+
+            #Then move it (with its new velocity) for the rest of the tick
+            starts = states[fast, POS:POS+3]
+            velocities = states[fast, VEL:VEL+3]
+            ends = starts + velocities*left[:, None] + (1/2)*accels*(left*left)[:, None]
+            states[fast, POS:POS+3] = ends
+            states[fast, VEL:VEL+3] = velocities + accels*left[:, None]
+            remaining = left
+
+        if not moved:
+            return np.empty(0, dtype=np.intp)
+        return np.concatenate(moved)
+
+    def _find_pairs(self, objects, states, sleeping=None):
+        """Returns the candidate pairs of the broad phase (between objects that have a shape) as indexes into objects.
+        If ``sleeping`` is given, pairs of sleeping objects are left out, and the broad phase is only given the sleeping objects
+        that are within the bounding box around every awake object."""
+        np = require_numpy()
+        shaped = states[:, SHAPE] != NO_SHAPE
+        positions = states[:, POS:POS+3]
+        extents = states[:, EXTENTS:EXTENTS+3]
+        if sleeping is not None and sleeping.any():
+            awake = shaped & ~sleeping
+            if not awake.any():
+                return np.empty((0, 2), dtype=np.intp)
+            low = (positions[awake] - extents[awake]).min(axis=0)
+            high = (positions[awake] + extents[awake]).max(axis=0)
+            near = ((positions - extents <= high) & (positions + extents >= low)).all(axis=1)
+            shaped = awake | (shaped & sleeping & near)
+
+        shaped = np.flatnonzero(shaped)
+        positions = positions[shaped]
+        extents = extents[shaped]
+        pairs = shaped[self.broad_phase.find_pairs([objects[index] for index in shaped.tolist()], positions - extents, positions + extents)]
+        if sleeping is not None:
+            pairs = pairs[~(sleeping[pairs[:, 0]] & sleeping[pairs[:, 1]])]
+        return pairs
+
+    def _collision_states(self) -> tuple:
+        """Returns every object, their state rows as an array, and whether changing that array changes the objects.
+
+        In an array-backed universe the array is a view of the world's buffer, otherwise it is a copy."""
+        np = require_numpy()
+        if self.world is not None:
+            return self.world.objects, self.world.state[:self.world.count], True
+        objects = list(self._objects.values())
+        states = np.array([obj._state for obj in objects], dtype=float).reshape(-1, NUM_FIELDS)
+        return objects, states, False
+
+    def _write_states(self, objects, states, changed, start=POS, stop=VEL+3):
+        """Copy fields (by default the positions and velocities) of the changed objects from a copy of their state rows back into the objects."""
+        for index, values in zip(changed.tolist(), states[changed, start:stop].tolist()):
+            objects[index]._state[start:stop] = values
 
     def tick_object(self, obj: PhysicsObject):
         """
@@ -73,6 +944,23 @@ class PhysicsManager():
         """
         obj.tick(self.tick_length)
 
+    def get_object(self, name:str):
+        """
+        Find an object in this universe by its name.
+
+        Parameters
+        ----------
+        name: :class:`str`
+            The name of the object.
+
+        Returns
+        -------
+        :class:`pysics.physics_obj.PhysicsObject`
+            The object with the given name, or ``None`` if there is no object with that name in this universe.
+
+        """
+        return self._objects.get(name)
+
     def add_object(self, ph_obj:PhysicsObject):
         """
 
@@ -89,11 +977,41 @@ class PhysicsManager():
             There cannot be two objects in one universe with the same name.
 
         """
-        for obj in self.objects: #Make sure its name is not already used
-            if obj.name == ph_obj.name:
-                raise NameUsedError("There cannot be two objects within the same universe with the same name.")
+        if ph_obj.name in self._objects: #Make sure its name is not already used
+            raise NameUsedError("There cannot be two objects within the same universe with the same name.")
 
-        self.objects.append(ph_obj)
+        if self.world is not None:
+            self.world.bind(ph_obj)
+        self._objects[ph_obj.name] = ph_obj
+
+    def add_objects(self, objects, states=None):
+        """
+
+        Add many objects to this universe at once, in order. Either all of the objects are added, or none of them are.
+
+        Parameters
+        ----------
+        objects: Iterable[:class:`pysics.physics_obj.PhysicsObject`]
+            The objects to be added to this universe.
+
+        states: :class:`numpy.ndarray`
+            The state rows to give the objects of an array-backed universe instead of their own, shape ``(number of objects, NUM_FIELDS)``
+            (see :meth:`pysics.world.ArrayWorld.bind_all`). Defaults to ``None`` (the objects' own state).
+
+        Raises
+        ------
+        :exc:`pysics.errors.NameUsedError`
+            There cannot be two objects in one universe with the same name (including two of the given objects).
+
+        """
+        objects = list(objects)
+        added = {obj.name: obj for obj in objects}
+        if len(added) != len(objects) or not self._objects.keys().isdisjoint(added): #Make sure no name is already used
+            raise NameUsedError("There cannot be two objects within the same universe with the same name.")
+
+        if self.world is not None:
+            self.world.bind_all(objects, states)
+        self._objects.update(added)
 
     def remove_object(self, obj:PhysicsObject):
         """
@@ -104,10 +1022,19 @@ class PhysicsManager():
         obj: :class:`pysics.physics_obj.PhysicsObject`
             The object to remove from this universe (the instance itself).
 
+        Raises
+        ------
+        :exc:`ValueError`
+            The object is not in this universe.
+
         """
-        self.objects.remove(obj)
+        if self._objects.get(obj.name) is not obj:
+            raise ValueError("The object is not within this universe.")
+        del self._objects[obj.name]
+        if self.world is not None:
+            self.world.unbind(obj)
 
-    def remove_object_by_name(name:str):
+    def remove_object_by_name(self, name:str):
         """
 
         Remove a physics object using its name.
@@ -120,9 +1047,183 @@ class PhysicsManager():
             The name of the object to be removed.
 
         """
-        for obj in self.objects:
-            if obj.name == name:
-                self.objects.remove(obj)
+        obj = self._objects.pop(name, None)
+        if obj is not None and self.world is not None:
+            self.world.unbind(obj)
+
+    def remove_objects(self, objects):
+        """
+
+        Remove many objects from this universe at once. Either all of the objects are removed, or none of them are.
+
+        Parameters
+        ----------
+        objects: Iterable[:class:`pysics.physics_obj.PhysicsObject`]
+            The objects to remove from this universe (the instances themselves).
+
+        Raises
+        ------
+        :exc:`ValueError`
+            One of the objects is not in this universe.
+
+        """
+        objects = list(objects)
+        for obj in objects: #Make sure every object can be removed, in one pass
+            if self._objects.get(obj.name) is not obj:
+                raise ValueError("The object is not within this universe.")
+
+        for obj in objects:
+            self._objects.pop(obj.name, None)
+            if self.world is not None:
+                self.world.unbind(obj)
+
+    def add_collider(self, collider):
+        """
+
+        Add static geometry to this universe. Every object is bounced off it from the next tick on.
+
+        Parameters
+        ----------
+        collider: :class:`pysics.colliders.StaticCollider`
+            The collider to add, such as a :class:`pysics.colliders.HalfSpace` or a :class:`pysics.colliders.StaticBox`.
+
+        """
+        self._colliders.append(collider)
+
+    def remove_collider(self, collider):
+        """
+
+        Remove static geometry from this universe.
+
+        Parameters
+        ----------
+        collider: :class:`pysics.colliders.StaticCollider`
+            The collider to remove (the instance itself).
+
+        Raises
+        ------
+        :exc:`ValueError`
+            The collider is not in this universe.
+
+        """
+        for index, existing in enumerate(self._colliders):
+            if existing is collider:
+                del self._colliders[index]
+                return
+        raise ValueError("The collider is not within this universe.")
+
+    def add_constraint(self, constraint):
+        """
+
+        Add a constraint between objects of this universe (such as a :class:`pysics.constraints.Spring` or a :class:`pysics.constraints.Rope`).
+
+        Parameters
+        ----------
+        constraint: :class:`pysics.constraints.Constraint`
+            The constraint to add.
+
+        Raises
+        ------
+        :exc:`ValueError`
+            One of the constraint's objects is not in this universe.
+
+        """
+        for obj in (constraint.first, constraint.second):
+            if obj is not None and self._objects.get(obj.name) is not obj:
+                raise ValueError("The objects of a constraint must be within the universe.")
+        self._constraints.append(constraint)
+
+    def remove_constraint(self, constraint):
+        """
+
+        Remove a constraint from this universe.
+
+        Parameters
+        ----------
+        constraint: :class:`pysics.constraints.Constraint`
+            The constraint to remove (the instance itself).
+
+        Raises
+        ------
+        :exc:`ValueError`
+            The constraint is not in this universe.
+
+        """
+        for index, existing in enumerate(self._constraints):
+            if existing is constraint:
+                del self._constraints[index]
+                return
+        raise ValueError("The constraint is not within this universe.")
+
+    def add_field(self, field):
+        """
+
+        Add a force field acting on every object of this universe (such as a :class:`pysics.fields.UniformGravity`).
+
+        Parameters
+        ----------
+        field: :class:`pysics.fields.ForceField`
+            The force field to add.
+
+        """
+        self._fields.append(field)
+
+    def remove_field(self, field):
+        """
+
+        Remove a force field from this universe.
+
+        Parameters
+        ----------
+        field: :class:`pysics.fields.ForceField`
+            The force field to remove (the instance itself).
+
+        Raises
+        ------
+        :exc:`ValueError`
+            The force field is not in this universe.
+
+        """
+        for index, existing in enumerate(self._fields):
+            if existing is field:
+                del self._fields[index]
+                return
+        raise ValueError("The force field is not within this universe.")
+
+    def add_recorder(self, recorder):
+        """
+
+        Add a recorder, which records the state of its objects after every tick from now on.
+
+        Parameters
+        ----------
+        recorder: :class:`pysics.recording.Recorder`
+            The recorder to add, or a :class:`pysics.replay.ReplayWriter`.
+
+        """
+        self._recorders.append(recorder)
+
+    def remove_recorder(self, recorder):
+        """
+
+        Stop a recorder from recording this universe. The recorder is not closed.
+
+        Parameters
+        ----------
+        recorder: :class:`pysics.recording.Recorder`
+            The recorder to remove (the instance itself).
+
+        Raises
+        ------
+        :exc:`ValueError`
+            The recorder is not in this universe.
+
+        """
+        for index, existing in enumerate(self._recorders):
+            if existing is recorder:
+                del self._recorders[index]
+                return
+        raise ValueError("The recorder is not within this universe.")
 
     def clear(self) -> tuple:
         """
@@ -136,6 +1237,136 @@ class PhysicsManager():
             Useful for transferring all objects to a different universe.
 
         """
-        objects_copy = self.objects
-        self.objects.clear()
+        objects_copy = list(self._objects.values())
+        self._objects.clear()
+        if self.world is not None:
+            self.world.clear()
         return objects_copy
+
+    def snapshot(self):
+        """
+
+        Save the state of this universe, to be brought back later with :meth:`restore` (such as to roll back and
+        re-simulate the last few ticks when late input arrives in a networked game).
+
+        The state rows of every object, the forces acting on every object, which objects are in this universe and the time passed
+        are saved. Static colliders, constraints, force fields and the settings of this universe (such as :attr:`tick_length`) are not.
+        Each snapshot shares the parts that did not change with the previous snapshot (see :class:`pysics.snapshot.Snapshot`),
+        so taking one every tick is cheap.
+
+        Returns
+        -------
+        :class:`pysics.snapshot.Snapshot`
+            The saved state of this universe.
+
+        """
+        rows = tuple(self.world.objects) if self.world is not None else None
+        manager_state = (self.time_passed, self.tick_count, self._exact_time, self._unsimulated_time, self.alpha, self.last_substeps, self.contacts, tuple(self.candidate_pairs))
+        snapshot = snapshots.take(tuple(self._objects.values()), rows, self.world, self._last_snapshot, manager_state)
+        self._last_snapshot = snapshot
+        return snapshot
+
+    def restore(self, snapshot):
+        """
+
+        Bring this universe back to the moment a snapshot of it was taken with :meth:`snapshot`. Objects added since are removed,
+        objects removed since are added back, and every object gets back its state and the forces that were acting on it.
+        Ticking afterwards gives exactly the same results as ticking right after the snapshot was taken.
+
+        Only the objects and forces that changed since the snapshot are touched, and the state rows are written back in one copy.
+        A snapshot can be restored any number of times.
+
+        Parameters
+        ----------
+        snapshot: :class:`pysics.snapshot.Snapshot`
+            A snapshot taken of this universe.
+
+        Raises
+        ------
+        :exc:`pysics.errors.AlreadyBoundError`
+            An object removed since the snapshot was taken has been stored in another array-backed universe.
+            This universe is left as it was.
+
+        """
+        world = self.world
+        if tuple(self._objects.values()) != snapshot.objects or (world is not None and tuple(world.objects) != snapshot._rows):
+            #Checked before anything is changed, so that a snapshot that cannot be restored leaves this universe as it was
+            if any(obj._world is not None and obj._world is not world for obj in snapshot.objects):
+                raise AlreadyBoundError("A PhysicsObject can only be stored in one array-backed universe at a time.")
+            if world is not None:
+                world.clear()
+                world.bind_all(list(snapshot._rows))
+            self._objects = {obj.name: obj for obj in snapshot.objects}
+
+        #Forces first, since changing them wakes their objects up (changing their state rows)
+        restored = snapshots.restore_forces(snapshot)
+        snapshots.restore_states(snapshot, world)
+        for obj, version in restored:
+            #The restored state rows hold the net force and net torque of the restored forces
+            obj._forces_dirty = False
+            obj._forces_version = version
+            if world is not None:
+                world.dirty.discard(obj)
+
+        self.time_passed, self.tick_count, self._exact_time, self._unsimulated_time, self.alpha, self.last_substeps, self.contacts, candidate_pairs = snapshot._manager_state
+        self.candidate_pairs = list(candidate_pairs)
+        self._last_snapshot = snapshot
+
+    def checksum(self) -> int:
+        """
+
+        Returns a 64-bit checksum of the state of every object in this universe (in the order they were added),
+        :attr:`time_passed` and :attr:`tick_count`.
+
+        Lockstep multiplayer games only send each other their inputs, and every machine runs the same ticks itself.
+        Comparing checksums of the same tick finds the moment two machines stopped agreeing (a desync). Universes with the same
+        state have the same checksum on every machine, whether they are array-backed or not.
+
+        Returns
+        -------
+        :class:`int`
+            The checksum.
+
+        """
+        objects = list(self._objects.values())
+        if self.world is not None:
+            np = require_numpy()
+            rows = np.fromiter((obj._row for obj in objects), dtype=np.intp, count=len(objects))
+            data = self.world.state[rows].astype("<f8", copy=False).tobytes(order="C") #One object after another
+        else:
+            states = array("d", itertools.chain.from_iterable(obj._state for obj in objects))
+            if sys.byteorder == "big": states.byteswap()
+            data = states.tobytes()
+        digest = hashlib.blake2b(data, digest_size=8)
+        digest.update(struct.pack("<dq", self.time_passed, self.tick_count))
+        return int.from_bytes(digest.digest(), "little")
+
+    def close(self):
+        """
+
+        Stop the threads objects are moved on (see :attr:`threads`), and wait for them to finish.
+        The universe can still be ticked afterwards, which starts new threads if they are needed.
+        Universes can also be used in a ``with`` statement, which closes them at the end: ::
+
+            with PhysicsManager(objects, array_backed=True, threads=4) as manager:
+                for _ in range(1000):
+                    manager.tick()
+
+        """
+        if self._thread_pool is not None and self._thread_pool_owner[0] == os.getpid():
+            self._thread_pool.shutdown(wait=True) #The thread pool of another process has no threads in this one
+        self._thread_pool = None
+        self._thread_pool_owner = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def __getstate__(self):
+        #Threads cannot be copied or pickled, so copies start their own when they need them
+        state = self.__dict__.copy()
+        state["_thread_pool"] = None
+        state["_thread_pool_owner"] = None
+        return state
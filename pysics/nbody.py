@@ -0,0 +1,198 @@
+from .world import require_numpy
+from .force import GRAVITATIONAL_CONSTANT
+from .fields import ForceField
+
+#Octree cells are found from Morton codes of 21 bits per axis (63 bits in all), so the tree is at most 21 levels deep
+_MAX_DEPTH = 21
+
+#How many objects have their accelerations found at once, which limits the memory used while walking the tree
+_CHUNK_SIZE = 2048
+
+#How many pairs of objects are summed at once by the direct sum
+_PAIRS_PER_CHUNK = 1 << 22
+
+def _spread_bits(np, values):
+    """Spread the lowest 21 bits of each value out so that there are two zero bits between each of them."""
+    values = values.astype(np.uint64) & np.uint64(0x1fffff)
+    for shift, mask in ((32, 0x1f00000000ffff), (16, 0x1f0000ff0000ff), (8, 0x100f00f00f00f00f), (4, 0x10c30c30c30c30c3), (2, 0x1249249249249249)):
+        values = (values | (values << np.uint64(shift))) & np.uint64(mask)
+    return values
+
+class _Octree():
+    """A Barnes-Hut octree, stored one level at a time.
+
+    Objects are sorted by the Morton codes of their positions, so the objects in every cell (at every level)
+    are next to each other, and so are the children of every cell."""
+
+    def __init__(self, np, positions, masses):
+        low = positions.min(axis=0)
+        size = float((positions.max(axis=0) - low).max())
+        if size == 0: size = 1.0 #Every object is in the same place
+        self.size = size
+
+        cells_per_axis = 1 << _MAX_DEPTH
+        coordinates = np.clip(((positions - low)/size*cells_per_axis).astype(np.int64), 0, cells_per_axis - 1)
+        codes = (_spread_bits(np, coordinates[:, 0]) << np.uint64(2)) | (_spread_bits(np, coordinates[:, 1]) << np.uint64(1)) | _spread_bits(np, coordinates[:, 2])
+        self.order = np.argsort(codes, kind="stable")
+        self.codes = codes[self.order]
+        self.positions = positions[self.order]
+        self.masses = masses[self.order]
+
+        #For each level: the cell of each object, and the index of the first object, number of objects, mass and center of mass of each cell
+        self.cells = []
+        self.starts = []
+        self.counts = []
+        self.cell_masses = []
+        self.centers = []
+        weighted = self.positions*self.masses[:, None]
+        for level in range(_MAX_DEPTH + 1):
+            keys = self.codes >> np.uint64(3*(_MAX_DEPTH - level))
+            starts = np.flatnonzero(np.concatenate(([True], keys[1:] != keys[:-1])))
+            counts = np.diff(np.append(starts, len(keys)))
+            cell_masses = np.add.reduceat(self.masses, starts)
+            self.cells.append(np.repeat(np.arange(len(starts)), counts))
+            self.starts.append(starts)
+            self.counts.append(counts)
+            self.cell_masses.append(cell_masses)
+            self.centers.append(np.add.reduceat(weighted, starts)/cell_masses[:, None])
+            if counts.max() == 1: break #Every cell holds a single object, so there is nothing left to split
+
+        #The range of the children of each cell in the next level
+        self.first_children = []
+        self.last_children = []
+        for level in range(len(self.starts) - 1):
+            ends = np.append(self.starts[level][1:], len(self.codes))
+            self.first_children.append(np.searchsorted(self.starts[level + 1], self.starts[level]))
+            self.last_children.append(np.searchsorted(self.starts[level + 1], ends))
+
+    def accelerations(self, np, bodies, theta, softening):
+        """The accelerations (without the gravitational constant) of the objects at the given indexes into the sorted objects."""
+        accels = np.zeros((len(bodies), 3))
+        pair_bodies = np.arange(len(bodies)) #Into bodies
+        pair_cells = np.zeros(len(bodies), dtype=np.intp)
+        deepest = len(self.starts) - 1
+        for level in range(deepest + 1):
+            if len(pair_bodies) == 0: break
+            body_indexes = bodies[pair_bodies]
+            positions = self.positions[body_indexes]
+            masses = self.cell_masses[level][pair_cells]
+            centers = self.centers[level][pair_cells]
+            offsets = centers - positions
+            distances_squared = (offsets*offsets).sum(axis=1)
+            cell_size = self.size/(1 << level)
+
+            inside = self.cells[level][body_indexes] == pair_cells
+            leaf = self.counts[level][pair_cells] == 1
+            far = ~inside & (cell_size*cell_size < theta*theta*distances_squared)
+            #Cells that are close (or hold the object itself) are opened, unless they cannot be split any more
+            opened = (inside | ~far) & ~leaf & (level != deepest)
+            used = ~opened & ~(inside & leaf)
+
+            if (used & inside).any():
+                #The deepest cells can hold several objects in (nearly) the same place: leave the object itself out of them
+                own = used & inside
+                own_masses = self.masses[body_indexes[own]]
+                remaining = masses[own] - own_masses
+                with np.errstate(invalid="ignore", divide="ignore"):
+                    centers[own] = (centers[own]*masses[own][:, None] - positions[own]*own_masses[:, None])/remaining[:, None]
+                centers[own] = np.where((remaining > 0)[:, None], centers[own], positions[own])
+                masses = masses.copy()
+                masses[own] = np.maximum(remaining, 0.0)
+                offsets[own] = centers[own] - positions[own]
+                distances_squared[own] = (offsets[own]*offsets[own]).sum(axis=1)
+
+            scales = distances_squared[used] + softening*softening
+            safe_scales = np.where(scales > 0, scales, 1.0)
+            strengths = np.where(scales > 0, masses[used]/(safe_scales*np.sqrt(safe_scales)), 0.0)
+            pulls = offsets[used]*strengths[:, None]
+            for axis in range(3):
+                accels[:, axis] += np.bincount(pair_bodies[used], weights=pulls[:, axis], minlength=len(bodies))
+
+            if level == deepest: break
+            first_children = self.first_children[level][pair_cells[opened]]
+            child_counts = self.last_children[level][pair_cells[opened]] - first_children
+            pair_bodies = np.repeat(pair_bodies[opened], child_counts)
+            pair_cells = np.repeat(first_children - np.cumsum(child_counts) + child_counts, child_counts) + np.arange(child_counts.sum())
+        return accels
+
+class NBodyGravity(ForceField):
+    """The gravity of every object pulling on every other object, such as for planets, moons and orbital debris: ::
+
+        acceleration of an object = sum of (gravitational constant)(mass of other object)/distance^2
+
+    By default, the pull of distant groups of objects is approximated by the pull of their total mass at their center of mass,
+    found with a Barnes-Hut octree of the objects' 3D positions. This takes about ``n log n`` time for ``n`` objects,
+    instead of the ``n^2`` of summing the pull of every pair of objects (which is done instead if ``direct`` is ``True``).
+
+    The accelerations are found from where every object is at the start of each tick (for every object at once),
+    and stay the same during the tick. :class:`pysics.integrators.SemiImplicitEuler` keeps orbits stable over long simulations.
+    Requires ``numpy``.
+
+    Parameters
+    ----------
+    gravitational_constant: :class:`float`
+        The strength of gravity in N*m^2/kg^2. Defaults to :attr:`pysics.force.GRAVITATIONAL_CONSTANT`.
+        Simulations in other units (such as astronomical units and solar masses) can use their own.
+
+    theta: :class:`float`
+        The opening angle. A group of objects is approximated by its center of mass when its size divided by its distance
+        is less than this. ``0`` sums every pair exactly (slowly); larger values are faster and less accurate. Defaults to ``0.5``.
+
+    softening: :class:`float`
+        A length added to every distance (as ``sqrt(distance^2 + softening^2)``), in meters, which stops objects that pass
+        very close to each other from being flung apart by huge accelerations. Defaults to ``0.0``.
+
+    direct: :class:`bool`
+        Sum the pull of every pair of objects exactly instead of using the octree. Faster for a few hundred objects or less,
+        and useful for checking the accuracy of a ``theta``. Defaults to ``False``.
+
+    Attributes
+    ----------
+    gravitational_constant: :class:`float`
+        The strength of gravity in N*m^2/kg^2.
+
+    theta: :class:`float`
+        The opening angle.
+
+    softening: :class:`float`
+        A length added to every distance, in meters.
+
+    direct: :class:`bool`
+        Whether the pull of every pair of objects is summed exactly.
+
+    """
+
+    mutual = True
+
+    def __init__(self, gravitational_constant=GRAVITATIONAL_CONSTANT, theta=0.5, softening=0.0, direct=False):
+        self.gravitational_constant = gravitational_constant
+        self.theta = theta
+        self.softening = softening
+        self.direct = direct
+
+    def mutual_accelerations(self, positions, masses):
+        np = require_numpy()
+        positions = np.asarray(positions, dtype=float)
+        masses = np.asarray(masses, dtype=float)
+        accels = np.zeros((len(positions), 3))
+        if len(positions) < 2: return accels
+        if self.direct:
+            chunk_size = max(_PAIRS_PER_CHUNK//len(positions), 1)
+            for start in range(0, len(positions), chunk_size):
+                accels[start:start+chunk_size] = self._direct_sum(np, positions[start:start+chunk_size], positions, masses)
+        else:
+            tree = _Octree(np, positions, masses)
+            for start in range(0, len(positions), _CHUNK_SIZE):
+                bodies = np.arange(start, min(start + _CHUNK_SIZE, len(positions)))
+                accels[tree.order[bodies]] = tree.accelerations(np, bodies, self.theta, self.softening)
+        return accels*self.gravitational_constant
+
+    def _direct_sum(self, np, targets, positions, masses):
+        """The accelerations (without the gravitational constant) of objects at the target positions from every object.
+        Objects in the exact same place as a target (such as the target itself) do not pull on it."""
+        offsets = positions[None, :, :] - targets[:, None, :]
+        distances_squared = (offsets*offsets).sum(axis=2)
+        scales = distances_squared + self.softening*self.softening
+        safe_scales = np.where(distances_squared > 0, scales, 1.0)
+        strengths = np.where(distances_squared > 0, masses[None, :]/(safe_scales*np.sqrt(safe_scales)), 0.0)
+        return (offsets*strengths[:, :, None]).sum(axis=1)
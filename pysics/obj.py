@@ -1,16 +1,39 @@
 from .force import Force
+from .shapes import NO_SHAPE
+from .fields import sum_acceleration
 import pysics
 
 from .errors import MassOfZeroError
 from .errors import NameUsedError
 from .errors import MomentOfInertiaZeroError
+from .world import POS, VEL, ACCEL, ORIENTATION, ANGULAR_VEL, ANGULAR_ACCEL, MASS, MOMENT_OF_INERTIA, TIME_PASSED, NET_FORCE, NET_TORQUE, EXTENTS, SHAPE, CCD, PREVIOUS_POS, SLEEP_TIMER, ASLEEP
 
+import copyreg
+import itertools
 import math
 
+#Every change to the forces of any object gets a new number, so that snapshots can tell whether an object's forces changed since
+_force_versions = itertools.count()
+
+class _StateField():
+    """Exposes one field of a :class:`PhysicsObject`'s state row as a regular attribute."""
+
+    def __init__(self, index):
+        self.index = index
+
+    def __get__(self, obj, objtype=None):
+        if obj is None: return self
+        if obj._world is None: return obj._state[self.index]
+        return float(obj._state[self.index]) #A Python float, not a NumPy scalar
+
+    def __set__(self, obj, value):
+        obj._state[self.index] = value
+
 class PhysicsObject():
     """Represents an object in space that will react as forces are applied on it over ticks (time).
     Acceleration is only calculated when the object moves (at the beginning of each tick).
     Acceleration can be manually calculated with :meth:`PhysicsObject.calculate_accel()`.
+    The net force and net torque are cached and only summed again after the forces acting on the object change.
     Objects have a mass of 1 kilogram by default.
 
     Parameters
@@ -79,14 +102,26 @@ class PhysicsObject():
     time_passed: :class:`float`
         The total amount of time, in seconds, that has passed for this object.
 
+    shape: :class:`pysics.shapes.Shape`
+        The shape of this object, used for collisions (such as a :class:`pysics.shapes.Sphere`). Defaults to ``None``.
+
+    ccd: :class:`bool`
+        Whether this object uses continuous collision detection against static colliders. Defaults to ``False``.
+
+    integrator: :class:`pysics.integrators.Integrator`
+        The integrator that moves this object each tick, instead of the one of its universe. Defaults to ``None``.
 
     Attributes
     ----------
     name: :class:`str`
         The name of this physics object. It cannot be the same as another object's name in the same universe.
 
-    forces: list[:class:`pysics.force.Force`]
-        All the forces that act on this object each tick.
+    forces: tuple(:class:`pysics.force.Force`)
+        All the forces that act on this object each tick, in the order they were applied.
+        It cannot be changed in place: use :meth:`apply_force`, :meth:`replace_force` and :meth:`remove_force` to change the forces,
+        or assign a new list of forces to it.
+        Forces are indexed by name, so applying, replacing, removing and finding (:meth:`get_force`) a force by name
+        takes the same amount of time no matter how many forces act on the object.
 
     mass: :class:`float`
         This object's mass.
@@ -160,6 +195,40 @@ class PhysicsObject():
     time_passed: :class:`float`
         The amount of time, in seconds, that has passed for this object (total time over all ticks).
 
+    shape: :class:`pysics.shapes.Shape`
+        The shape of this object, or ``None`` if it has no shape (objects without a shape are ignored by collision detection).
+        Assign a new shape to change the object's size.
+
+    ccd: :class:`bool`
+        Whether this object uses continuous collision detection (CCD) against the static colliders of its universe
+        (see :class:`pysics.colliders.StaticCollider`).
+        Normally an object jumps from where it was to where it ends up each tick, so a fast object can pass straight
+        through a thin wall without ever overlapping it. With CCD, the path the object travelled during the tick is
+        tested instead, and the object is stopped at the point of impact, bounced, and moved for the rest of the tick.
+        Only turn this on for fast objects (projectiles): the rest of the universe can keep a long tick length.
+
+    integrator: :class:`pysics.integrators.Integrator`
+        The integrator that moves this object each tick (such as :class:`pysics.integrators.RK4`), or ``None`` to use the
+        integrator of its universe (or :class:`pysics.integrators.ConstantAcceleration` when ticked on its own).
+
+    asleep: :class:`bool`
+        Whether this object is asleep. Sleeping objects are not moved, and are not tested for collisions with other sleeping objects.
+        Objects fall asleep when their universe has :attr:`pysics.manager.PhysicsManager.sleep_ticks` set and they stay still
+        for that many ticks, and wake up when a force acting on them changes, when something moves them, or when :meth:`wake` is called.
+
+    .. note::
+
+        The kinematic attributes (positions, velocities, accelerations, orientations, mass, moment of inertia and time passed)
+        are stored together in a state row. When the object is added to an array-backed
+        :class:`pysics.manager.PhysicsManager`, that row lives in the manager's :class:`pysics.world.ArrayWorld`
+        and the attributes read and write the shared buffer directly.
+
+    .. note::
+
+        PhysicsObjects use ``__slots__``, so they have no ``__dict__`` and new attributes cannot be added to them.
+        To give objects your own attributes, subclass :class:`PhysicsObject` (like the ``BodyPart`` in the stickman example):
+        a subclass that does not define ``__slots__`` itself gets a ``__dict__`` again.
+
     Raises
     ------
     :exc:`MassOfZeroError` 
@@ -167,56 +236,115 @@ class PhysicsObject():
 
     """
 
-    def __init__(self, name, xpos=0.0, ypos=0.0, zpos=0.0, xvel=0.0, yvel=0.0, zvel=0.0, x_orientation=0.0, y_orientation=0.0, z_orientation=0.0, x_angular_vel=0.0, y_angular_vel=0.0, z_angular_vel=0.0, forces=[], mass=1.0, moment_of_inertia=1.0, time_passed=0.0):
+    __slots__ = ("name", "_state", "_world", "_row", "_forces", "_forces_dirty", "_forces_version", "_shape", "_integrator", "__weakref__")
+
+    #Kinematic state (see pysics.world.STATE_FIELDS for the layout of the state row)
+    xpos = _StateField(POS)
+    ypos = _StateField(POS+1)
+    zpos = _StateField(POS+2)
+    xvel = _StateField(VEL)
+    yvel = _StateField(VEL+1)
+    zvel = _StateField(VEL+2)
+    xaccel = _StateField(ACCEL)
+    yaccel = _StateField(ACCEL+1)
+    zaccel = _StateField(ACCEL+2)
+    x_orientation = _StateField(ORIENTATION)
+    y_orientation = _StateField(ORIENTATION+1)
+    z_orientation = _StateField(ORIENTATION+2)
+    x_angular_vel = _StateField(ANGULAR_VEL)
+    y_angular_vel = _StateField(ANGULAR_VEL+1)
+    z_angular_vel = _StateField(ANGULAR_VEL+2)
+    x_angular_accel = _StateField(ANGULAR_ACCEL)
+    y_angular_accel = _StateField(ANGULAR_ACCEL+1)
+    z_angular_accel = _StateField(ANGULAR_ACCEL+2)
+    mass = _StateField(MASS)
+    moment_of_inertia = _StateField(MOMENT_OF_INERTIA)
+    time_passed = _StateField(TIME_PASSED)
+
+    def __init__(self, name, xpos=0.0, ypos=0.0, zpos=0.0, xvel=0.0, yvel=0.0, zvel=0.0, x_orientation=0.0, y_orientation=0.0, z_orientation=0.0, x_angular_vel=0.0, y_angular_vel=0.0, z_angular_vel=0.0, forces=[], mass=1.0, moment_of_inertia=1.0, time_passed=0.0, shape=None, ccd=False, integrator=None):
         if mass == 0:
             raise MassOfZeroError("PhysicsObjects cannot have a mass of 0.")
         if moment_of_inertia == 0:
             raise MomentOfInertiaZeroError("Physics Objects cannot have a moment of inertia of 0.")
+        #The whole state row at once, in the layout of pysics.world.STATE_FIELDS.
+        #Replaced by a view of a row when added to an array-backed universe.
+        self._state = [
+            xpos, ypos, zpos, #In meters
+            xvel, yvel, zvel, #In meters per second
+            0.0, 0.0, 0.0, #Acceleration in m/s^2
+            x_orientation, y_orientation, z_orientation, #In radians
+            x_angular_vel, y_angular_vel, z_angular_vel, #In radians per second
+            0.0, 0.0, 0.0, #Angular acceleration in radians per second^2
+            mass, #Having altered mass may not be desired in some games, so mass is defaulted to 1 kilogram
+            moment_of_inertia, #In kg*m^2
+            time_passed, #seconds
+            0.0, 0.0, 0.0, #Net force
+            0.0, 0.0, 0.0, #Net torque
+            0.0, 0.0, 0.0, NO_SHAPE, #Extents and shape
+            1.0 if ccd else 0.0,
+            xpos, ypos, zpos, #Not interpolated until the object is advanced
+            0.0, 0.0, #Sleep timer, asleep
+        ]
+        self._world = None
+        self._row = None
+        self._integrator = integrator
+        self._forces_dirty = False #No forces, so the net force and net torque of 0 are up to date
+        self._forces_version = next(_force_versions)
+        self._shape = None
         self.name = name
 
-        self.xvel = xvel #Initial velocity in meters per second
-        self.yvel = yvel #Initial velocity in meters per second
-        self.zvel = zvel #Initial velocity in meters per second
-
-        self.xpos = xpos #in meters
-        self.ypos = ypos #in meters
-        self.zpos = zpos #in meters
-
-        self.xaccel = 0.0 #In m/s^2
-        self.yaccel = 0.0 #In m/s^2
-        self.zaccel = 0.0 #In m/s^2
-
-        #Rotational
-        self.x_orientation = x_orientation #In radians
-        self.y_orientation = y_orientation #In radians
-        self.z_orientation = z_orientation #In radians
-
-        self.x_angular_vel = x_angular_vel #In m/s
-        self.y_angular_vel = y_angular_vel #In m/s
-        self.z_angular_vel = z_angular_vel #In m/s
-
-        self.x_angular_accel = 0.0 #In m/s^2
-        self.y_angular_accel = 0.0 #In m/s^2
-        self.z_angular_accel = 0.0 #In m/s^2
-
-
-        self.forces = forces.copy()
-        self.mass = mass #Having altered mass may not be desired in some games, so mass is defaulted to 1 kilogram
-        self.moment_of_inertia = moment_of_inertia #In kg*m^2
-
-        self.time_passed = time_passed #seconds
-
-        self.calculate_accel()
-        self.calculate_angular_accel()
-
-    def tick(self, tick_length:float):
+        if shape is not None:
+            self.shape = shape
+        self._forces = {} #name: Force, in the order they were applied
+        if forces:
+            for force in forces:
+                self.apply_force(force)
+            self.calculate_accel()
+            self.calculate_angular_accel()
+
+    @classmethod
+    def _from_state(cls, name, state, shape, integrator):
+        """Make an object from a whole state row at once (``None`` for an object about to be bound to an
+        :class:`pysics.world.ArrayWorld` with its state), without setting each attribute. Its net force is taken to be up to date."""
+        obj = cls.__new__(cls)
+        obj.name = name
+        obj._state = state
+        obj._world = None
+        obj._row = None
+        obj._forces = {}
+        obj._forces_dirty = False
+        obj._forces_version = next(_force_versions)
+        obj._shape = shape
+        obj._integrator = integrator
+        return obj
+
+    def __getstate__(self):
+        #The state row of an object in an array-backed universe is pickled with the world, which gives the object a view of it again
+        slots = {name: getattr(self, name) for name in copyreg._slotnames(type(self)) if hasattr(self, name)}
+        if self._world is not None:
+            slots["_state"] = None
+        return (getattr(self, "__dict__", None), slots)
+
+    def __setstate__(self, state):
+        attributes, slots = state
+        if attributes:
+            self.__dict__.update(attributes)
+        for name, value in slots.items():
+            setattr(self, name, value)
+        for force in self._forces.values():
+            force._parents.add(self)
+        world_state = getattr(self._world, "state", None)
+        if world_state is not None: #Otherwise the world is unpickled afterwards, and gives this object its row then
+            self._state = world_state[self._row]
+
+    def tick(self, tick_length:float, integrator=None, fields=()):
         """
 
         Time passes for this object. 
         
         Forces will be applied and the object will move based on velocity and acceleration.
 
-        Acceleration is recalculated just before the position and velocity are updated.
+        Acceleration is recalculated just before the position and velocity are updated, from the cached net force and net torque.
 
         Translational position/velocity is calculated first.
 
@@ -225,33 +353,55 @@ class PhysicsObject():
         tick_length: :class:`float`
             The amount of time that passes this tick.
 
+        integrator: :class:`pysics.integrators.Integrator`
+            The integrator to use if this object does not have its own :attr:`integrator`.
+            Defaults to ``None`` (constant acceleration during the tick).
+
+        fields: List[:class:`pysics.fields.ForceField`]
+            Force fields acting on this object, whose accelerations are added to the acceleration from its forces.
+            Defaults to no force fields.
+
         """
 
         if tick_length == 0: return #Literally no time passes.
         self.calculate_accel()
-        #x = x(initial) + v(initial)(t) + 1/2(a)(t) - on a single axis
-        self.xpos += self.xvel*tick_length + (1/2)*(self.xaccel)*(pow(tick_length,2))
-        self.ypos += self.yvel*tick_length + (1/2)*(self.yaccel)*(pow(tick_length,2))
-        self.zpos += self.zvel*tick_length + (1/2)*(self.zaccel)*(pow(tick_length,2))
-
-        #v = v(initial) + (a)(t) - on a single axis
-        self.xvel += (self.xaccel)*(tick_length)
-        self.yvel += (self.yaccel)*(tick_length)
-        self.zvel += (self.zaccel)*(tick_length)
-
         self.calculate_angular_accel()
-        #Now for angular stuff (Uses same equations as translational, except uses angular versions of variables)
-        self.x_orientation += self.x_angular_vel*tick_length + (1/2)*(self.x_angular_accel)*(pow(tick_length,2))
-        self.y_orientation += self.y_angular_vel*tick_length + (1/2)*(self.y_angular_accel)*(pow(tick_length,2))
-        self.z_orientation += self.z_angular_vel*tick_length + (1/2)*(self.z_angular_accel)*(pow(tick_length,2))
+        acceleration = self._add_field_accel(fields) if fields else None
+
+        if self._integrator is not None: integrator = self._integrator
+        if integrator is not None:
+            integrator.step(self._state, tick_length, acceleration)
+            self._state[TIME_PASSED] += tick_length
+            return
 
-        self.x_angular_vel += (self.x_angular_accel)*(tick_length)
-        self.y_angular_vel += (self.y_angular_accel)*(tick_length)
-        self.z_angular_vel += (self.z_angular_accel)*(tick_length)
+        #Translational axes first, then angular axes (Uses same equations as translational, except uses angular versions of variables)
+        #Velocity is stored 3 fields after position, and acceleration 6 fields after position.
+        state = self._state
+        for p in (POS, POS+1, POS+2, ORIENTATION, ORIENTATION+1, ORIENTATION+2):
+            #x = x(initial) + v(initial)(t) + 1/2(a)(t^2) - on a single axis
+            state[p] += state[p+3]*tick_length + (1/2)*(state[p+6])*(tick_length*tick_length)
+            #v = v(initial) + (a)(t) - on a single axis
+            state[p+3] += (state[p+6])*(tick_length)
 
-        self.time_passed += tick_length #Time has passed
+        state[TIME_PASSED] += tick_length #Time has passed
 
         #acceleration does not change until the net force (or net torque for angular acceleration) changes
+        #(or the mass or moment of inertia changes, which is why it is always divided again from the cached sums)
+
+    def _add_field_accel(self, fields):
+        """Add the acceleration of the force fields to this object's acceleration. Returns a function giving the acceleration
+        at other positions and velocities, for integrators (see :meth:`pysics.integrators.Integrator.step`)."""
+        state = self._state
+        mass = state[MASS]
+        force_accel = (state[ACCEL], state[ACCEL+1], state[ACCEL+2])
+        field_accel = sum_acceleration(fields, tuple(state[POS:POS+3]), tuple(state[VEL:VEL+3]), mass)
+        for axis in range(3):
+            state[ACCEL+axis] += field_accel[axis]
+
+        def acceleration(position, velocity):
+            field_accel = sum_acceleration(fields, position, velocity, mass)
+            return (force_accel[0] + field_accel[0], force_accel[1] + field_accel[1], force_accel[2] + field_accel[2])
+        return acceleration
 
     def get_pos(self) -> tuple:
         """
@@ -264,6 +414,26 @@ class PhysicsObject():
         """
         return(self.xpos, self.ypos, self.zpos)
 
+    def get_interpolated_pos(self, alpha:float) -> tuple:
+        """
+        Returns a position between where this object was before the last tick of :meth:`pysics.manager.PhysicsManager.advance`
+        and where it is now, in the form (x, y, z). Drawing objects at their interpolated positions keeps their movement smooth
+        when frames are drawn more often than ticks pass.
+
+        Parameters
+        ----------
+        alpha: :class:`float`
+            How far between the two positions, from ``0`` (the previous position) to ``1`` (the current position).
+            Usually :attr:`pysics.manager.PhysicsManager.alpha`.
+
+        Returns
+        -------
+        tuple(:class:`float`, :class:`float`, :class:`float`)
+            The interpolated position on the 3 dimensions (x, y, z)
+        """
+        state = self._state
+        return tuple(float((1 - alpha)*state[PREVIOUS_POS+axis] + alpha*state[POS+axis]) for axis in range(3))
+
     def get_orientation(self) -> tuple:
         """
         Returns the object's current orientation on each axis in the form (x, y, z)
@@ -319,11 +489,143 @@ class PhysicsObject():
         """
         return(self.x_angular_accel, self.y_angular_accel, self.z_angular_accel)
 
+    def _vector(self, start) -> tuple:
+        """Three fields of the state row, from ``start``, as Python floats."""
+        state = self._state
+        if self._world is None:
+            return (state[start], state[start+1], state[start+2])
+        return tuple(state[start:start+3].tolist())
+
+    @property
+    def shape(self):
+        """The shape of this object used for collisions, or ``None``."""
+        return self._shape
+
+    @shape.setter
+    def shape(self, shape):
+        self._shape = shape
+        #The bounding box and kind of shape are kept in the state row so that they can be read in bulk
+        state = self._state
+        x_extent, y_extent, z_extent = (0.0, 0.0, 0.0) if shape is None else shape.half_extents()
+        state[EXTENTS] = x_extent
+        state[EXTENTS+1] = y_extent
+        state[EXTENTS+2] = z_extent
+        state[SHAPE] = NO_SHAPE if shape is None else shape.kind
+
+    @property
+    def ccd(self) -> bool:
+        """Whether this object uses continuous collision detection against static colliders."""
+        return bool(self._state[CCD])
+
+    @ccd.setter
+    def ccd(self, value):
+        self._state[CCD] = 1.0 if value else 0.0
+
+    @property
+    def integrator(self):
+        """The integrator that moves this object, or ``None`` to use the integrator of its universe."""
+        return self._integrator
+
+    @integrator.setter
+    def integrator(self, integrator):
+        self._integrator = integrator
+        if self._world is not None: #Array-backed universes move objects with their own integrator separately
+            if integrator is None:
+                self._world.own_integrators.discard(self)
+            else:
+                self._world.own_integrators.add(self)
+
+    def get_aabb(self) -> tuple:
+        """
+        Returns the axis-aligned bounding box around this object's shape in the form ((min x, min y, min z), (max x, max y, max z))
+
+        An object without a shape has a bounding box of a single point (its position).
+
+        Returns
+        -------
+        tuple(tuple(:class:`float`, :class:`float`, :class:`float`), tuple(:class:`float`, :class:`float`, :class:`float`))
+            Returns the lowest and highest corners of the bounding box.
+        """
+        state = self._state if self._world is None else self._state.tolist()
+        return ((state[POS]-state[EXTENTS], state[POS+1]-state[EXTENTS+1], state[POS+2]-state[EXTENTS+2]),
+                (state[POS]+state[EXTENTS], state[POS+1]+state[EXTENTS+1], state[POS+2]+state[EXTENTS+2]))
+
+    def get_net_force(self) -> tuple:
+        """
+        Returns the sum of all the forces acting on this object on each axis in the form (x, y, z)
+
+        Returns
+        -------
+        tuple(:class:`float`, :class:`float`, :class:`float`)
+            Returns a tuple of the net force, in newtons, on the 3 dimensions (x, y, z)
+        """
+        if self._forces_dirty: self._sum_forces()
+        return self._vector(NET_FORCE)
+
+    def get_net_torque(self) -> tuple:
+        """
+        Returns the sum of the torques of all the forces acting on this object on each axis in the form (x, y, z)
+
+        Returns
+        -------
+        tuple(:class:`float`, :class:`float`, :class:`float`)
+            Returns a tuple of the net torque, in newton meters, on the 3 dimensions (x, y, z)
+        """
+        if self._forces_dirty: self._sum_forces()
+        return self._vector(NET_TORQUE)
+
+    def _invalidate_forces(self):
+        """Mark the cached net force and net torque as out of date, and wake this object up. Called whenever a force acting on this object changes."""
+        self._forces_dirty = True
+        self._forces_version = next(_force_versions)
+        if self._world is not None:
+            self._world.dirty.add(self)
+        self.wake()
+
+    @property
+    def asleep(self) -> bool:
+        """Whether this object is asleep."""
+        return bool(self._state[ASLEEP])
+
+    def wake(self):
+        """
+        Wake this object up, so that it moves again from the next tick on. Restarts the count of ticks it has been still for.
+
+        Objects wake up on their own when a force acting on them changes or something moves them,
+        but changing an object's position or velocity directly does not wake it up.
+        """
+        state = self._state
+        state[ASLEEP] = 0.0
+        state[SLEEP_TIMER] = 0.0
+
+    def _sum_forces(self):
+        """Sum all the forces (and their torques) acting on this object into the cached net force and net torque."""
+        #fsum rounds the exact sum once, so the net force is the same no matter the order the forces were applied in
+        forces = self._forces.values()
+        x = math.fsum([force.x*math.cos(force.x_rot_angle) for force in forces])
+        y = math.fsum([force.y*math.cos(force.y_rot_angle) for force in forces])
+        z = math.fsum([force.z*math.cos(force.z_rot_angle) for force in forces])
+        for force in forces:
+            force.calculate_torque()
+        x_torque = math.fsum([force.x_torque for force in forces])
+        y_torque = math.fsum([force.y_torque for force in forces])
+        z_torque = math.fsum([force.z_torque for force in forces])
+
+        state = self._state
+        state[NET_FORCE] = x
+        state[NET_FORCE+1] = y
+        state[NET_FORCE+2] = z
+        state[NET_TORQUE] = x_torque
+        state[NET_TORQUE+1] = y_torque
+        state[NET_TORQUE+2] = z_torque
+        self._forces_dirty = False
+
     def calculate_accel(self) -> tuple:
         """
         Calculates and sets the object's translational (linear) acceleration for each dimension.
 
         Adds all the newtons of force for each dimension from :attr:`forces`, then divides each result by the :attr:`mass`.
+        The sum is cached, and is only recalculated after a force is applied, removed or changed.
 
         This is called when a :meth:`tick` is called. Translational acceleration can be updated manually by calling this function.
 
@@ -338,26 +640,23 @@ class PhysicsObject():
             PhysicsObjects cannot have a mass of ``0``. Prevents from dividing by ``0``.
         """
 
-        if self.mass == 0:
+        state = self._state
+        mass = state[MASS]
+        if mass == 0:
             raise MassOfZeroError("PhysicsObjects cannot have a mass of 0.")
 
-        self.xaccel = 0
-        self.yaccel = 0
-        self.zaccel = 0
-        for force in self.forces:
-            self.xaccel += force.x*math.cos(force.x_rot_angle)
-            self.yaccel += force.y*math.cos(force.y_rot_angle)
-            self.zaccel += force.z*math.cos(force.z_rot_angle)
-        self.xaccel /= self.mass
-        self.yaccel /= self.mass
-        self.zaccel /= self.mass
-        return (self.xaccel, self.yaccel, self.zaccel)
+        if self._forces_dirty: self._sum_forces()
+        state[ACCEL] = state[NET_FORCE]/mass
+        state[ACCEL+1] = state[NET_FORCE+1]/mass
+        state[ACCEL+2] = state[NET_FORCE+2]/mass
+        return self._vector(ACCEL)
 
     def calculate_angular_accel(self) -> tuple:
         """
         Calculates and sets the object's angular acceleration for each dimension.
 
-        Adds all the newtons of force for each dimension from :attr:`forces`, then divides each result by the :attr:`moment_of_inertia`.
+        Adds the torque of all the forces for each dimension from :attr:`forces`, then divides each result by the :attr:`moment_of_inertia`.
+        The sum is cached, and is only recalculated after a force is applied, removed or changed.
 
         This is called when a :meth:`tick` is called. Angular acceleration can be updated manually by calling this function.
 
@@ -372,28 +671,51 @@ class PhysicsObject():
             PhysicsObjects cannot have a moment of inertia of ``0``. Prevents from dividing by ``0``.
         """
 
-        if self.moment_of_inertia == 0:
+        state = self._state
+        moment_of_inertia = state[MOMENT_OF_INERTIA]
+        if moment_of_inertia == 0:
             raise MomentOfInertiaZeroError("PhysicsObjects cannot have a moment of inertia of 0.")
 
-        self.x_angular_accel = 0
-        self.y_angular_accel = 0
-        self.z_angular_accel = 0
-        for force in self.forces:
-            force.calculate_torque()
-            self.x_angular_accel =+ force.x_torque
-            self.y_angular_accel =+ force.y_torque
-            self.z_angular_accel =+ force.z_torque
+        if self._forces_dirty: self._sum_forces()
+        state[ANGULAR_ACCEL] = state[NET_TORQUE]/moment_of_inertia
+        state[ANGULAR_ACCEL+1] = state[NET_TORQUE+1]/moment_of_inertia
+        state[ANGULAR_ACCEL+2] = state[NET_TORQUE+2]/moment_of_inertia
+        return self._vector(ANGULAR_ACCEL)
+
+    @property
+    def forces(self) -> tuple:
+        """The forces acting on this object, in the order they were applied."""
+        return tuple(self._forces.values())
+
+    @forces.setter
+    def forces(self, forces):
+        self.clear_forces()
+        for force in forces:
+            self.apply_force(force)
 
-        self.x_angular_accel /= self.moment_of_inertia
-        self.y_angular_accel /= self.moment_of_inertia
-        self.z_angular_accel /= self.moment_of_inertia
+    def get_force(self, name:str):
+        """
+        Find a force acting on this object by its name.
+
+        Parameters
+        ----------
+        name: :class:`str`
+            The name of the force.
 
-        return (self.x_angular_accel, self.y_angular_accel, self.z_angular_accel)
+        Returns
+        -------
+        :class:`pysics.force.Force`
+            The force with the given name, or ``None`` if there is no force with that name acting on this object.
+        """
+        return self._forces.get(name)
 
     def apply_force(self, new_force):
         """
         Applies another force on this object. 
 
+        Changing the attributes of the force afterwards (such as :attr:`pysics.force.Force.x`) is noticed by this object.
+        Its name should not be changed while it is applied.
+
         Parameters
         ----------
         new_force: :class:`new_force`
@@ -404,11 +726,72 @@ class PhysicsObject():
         :exc:`pysics.errors.NameUsedError`
             You cannot use the same name twice for a force on the same object.
         """
-        for force in self.forces: #Make sure its name is not already used
-            if force.name == new_force.name:
-                raise NameUsedError("You cannot use the same name twice for a force on the same object.")
+        if new_force.name in self._forces: #Make sure its name is not already used
+            raise NameUsedError("You cannot use the same name twice for a force on the same object.")
+
+        self._forces[new_force.name] = new_force
+        new_force._parents.add(self)
+        self._invalidate_forces()
 
-        self.forces.append(new_force)
+    def replace_force(self, name:str, new_force=None, **attributes):
+        """
+        Change the force with the given name, keeping its place among this object's forces.
+
+        If attributes are given, the existing force is updated in place (no new :class:`pysics.force.Force` is created),
+        which is the cheapest way to change a force every tick: ::
+
+            obj.replace_force("air resistance", x=-drag*obj.xvel, y=-drag*obj.yvel)
+
+        If there is no force with the given name, one is created and applied.
+
+        Parameters
+        ----------
+        name: :class:`str`
+            The name of the force to replace.
+
+        new_force: :class:`pysics.force.Force`
+            A force instance to put in place of the existing force. Its name must be ``name``.
+            Defaults to ``None`` (update the existing force instead).
+
+        attributes:
+            Attributes of the force to set, such as ``x``, ``y``, ``z``, ``x_rot_angle`` or ``force_type``.
+
+        Returns
+        -------
+        :class:`pysics.force.Force`
+            The force now acting on this object with the given name.
+
+        Raises
+        ------
+        :exc:`ValueError`
+            ``new_force`` does not have the given name.
+
+        :exc:`AttributeError`
+            One of the given attributes is not an attribute of a :class:`pysics.force.Force`.
+        """
+        for attribute in attributes:
+            if attribute not in Force.ATTRIBUTES:
+                raise AttributeError("Force has no attribute '" + attribute + "'.")
+
+        old_force = self._forces.get(name)
+        if new_force is not None:
+            if new_force.name != name:
+                raise ValueError("The replacement force must have the name of the force it replaces.")
+            if old_force is not new_force:
+                if old_force is not None:
+                    old_force._parents.discard(self)
+                self._forces[name] = new_force #Keeps the existing key's position
+                new_force._parents.add(self)
+                self._invalidate_forces()
+        elif old_force is None:
+            new_force = Force(name)
+            self.apply_force(new_force)
+        else:
+            new_force = old_force
+
+        for attribute, value in attributes.items():
+            setattr(new_force, attribute, value)
+        return new_force
 
     def remove_force(self, force):
         """
@@ -421,8 +804,10 @@ class PhysicsObject():
             The instance of the force to remove.
         """
 
-        if force not in self.forces: return
-        self.forces.remove(force)
+        if self._forces.get(force.name) is not force: return
+        del self._forces[force.name]
+        force._parents.discard(self)
+        self._invalidate_forces()
 
     def remove_force_by_name(self, name:str):
         """
@@ -436,9 +821,10 @@ class PhysicsObject():
 
         """
 
-        for force in self.forces:
-            if force.name == name:
-                self.forces.remove(force)
+        force = self._forces.pop(name, None)
+        if force is None: return
+        force._parents.discard(self)
+        self._invalidate_forces()
 
     def clear_forces(self) -> list:
         """
@@ -450,6 +836,9 @@ class PhysicsObject():
             All the forces cleared. Useful for transferring forces to another object.
 
         """
-        forces_copy = self.forces
-        self.forces.clear()
+        forces_copy = list(self._forces.values())
+        for force in forces_copy:
+            force._parents.discard(self)
+        self._forces.clear()
+        self._invalidate_forces()
         return forces_copy
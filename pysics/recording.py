@@ -0,0 +1,263 @@
+import json
+import struct
+from operator import attrgetter
+
+from .world import require_numpy, STATE_FIELDS
+
+#The file starts with a fixed header: magic bytes, format version, header length (including the names and padding),
+#number of objects, number of fields per object, capacity (ticks the file has room for) and ticks recorded so far
+MAGIC = b"PYSICSRC"
+VERSION = 1
+_HEADER = struct.Struct("<8sIIIIQQ")
+
+#The recorded ticks start on a multiple of this many bytes
+_ALIGNMENT = 64
+
+DEFAULT_FIELDS = ("xpos", "ypos", "zpos", "xvel", "yvel", "zvel")
+"""The fields recorded if none are given: the position and velocity of each object."""
+
+def _field_indexes(np, fields):
+    """The indexes of fields in a state row."""
+    for field in fields:
+        if field not in STATE_FIELDS:
+            raise ValueError("{!r} is not a field of a state row.".format(field))
+    return np.array([STATE_FIELDS.index(field) for field in fields], dtype=np.intp)
+
+def _gather(np, objects, field_indexes):
+    """Gather some fields of objects, shape ``(number of objects, number of fields)``."""
+    if not objects: return np.zeros((0, len(field_indexes)))
+    world = objects[0]._world
+    if world is not None and world.objects == objects:
+        return world.state[:world.count][:, field_indexes] #Every object of the world, in the order of its rows
+    if world is not None and all(obj._world is world for obj in objects):
+        rows = np.fromiter(map(attrgetter("_row"), objects), dtype=np.intp, count=len(objects))
+        return world.state[rows[:, None], field_indexes]
+    #Objects stored in different places (or not in an array-backed universe)
+    return np.array([obj._state for obj in objects], dtype=float).reshape(len(objects), -1)[:, field_indexes]
+
+def _data_shape(capacity, objects, fields) -> tuple:
+    return (capacity, 1 + objects*fields) #The time passed, then the fields of every object
+
+class Recorder():
+    """Records the state of objects after every tick into a binary file, for replays and analytics.
+
+    Give a recorder to a universe with :meth:`pysics.manager.PhysicsManager.add_recorder`, and it records the chosen fields
+    of every chosen object after each tick: ::
+
+        with Recorder("match.rec", manager.objects) as recorder:
+            manager.add_recorder(recorder)
+            for _ in range(10000):
+                manager.tick()
+
+    The file is preallocated and memory-mapped, so each tick is copied straight into it (one gather from an array-backed universe),
+    and the operating system writes it out in bulk. It doubles in size when it fills up. A header at the start of the file holds
+    the names of the objects and fields and the number of ticks recorded, which is brought up to date every ``flush_interval``
+    ticks and when the recorder is closed. Read recordings with :func:`open_recording`. Requires ``numpy``.
+
+    Parameters
+    ----------
+    path: :class:`str`
+        The file to record into. An existing file is overwritten.
+
+    objects: List[:class:`pysics.obj.PhysicsObject`]
+        The objects to record, such as :attr:`pysics.manager.PhysicsManager.objects` for every object of a universe.
+        Their names are stored as text (or JSON numbers), and should be unique.
+
+    fields: List[:class:`str`]
+        The fields of each object to record, from :data:`pysics.world.STATE_FIELDS`. Defaults to :data:`DEFAULT_FIELDS`.
+
+    capacity: :class:`int`
+        The number of ticks to make room for up front. Room that is not used is given back when the recorder is closed. Defaults to ``1024``.
+
+    flush_interval: :class:`int`
+        How many ticks to record between flushes. Defaults to ``64``.
+
+    Attributes
+    ----------
+    path: :class:`str`
+        The file being recorded into.
+
+    names: List
+        The names of the recorded objects, in order.
+
+    fields: List[:class:`str`]
+        The recorded fields of each object, in order.
+
+    ticks: :class:`int`
+        The number of ticks recorded so far.
+
+    Raises
+    ------
+    :exc:`ValueError`
+        A field is not in :data:`pysics.world.STATE_FIELDS`.
+
+    """
+
+    def __init__(self, path, objects, fields=DEFAULT_FIELDS, capacity=1024, flush_interval=64):
+        np = require_numpy()
+        self.path = path
+        self._objects = list(objects)
+        self.names = [obj.name for obj in self._objects]
+        self.fields = list(fields)
+        self._field_indexes = _field_indexes(np, self.fields)
+        self.flush_interval = flush_interval
+        self.ticks = 0
+
+        names = json.dumps({"objects": self.names, "fields": self.fields}, default=str).encode("utf-8")
+        self._header_length = -(-(_HEADER.size + len(names))//_ALIGNMENT)*_ALIGNMENT
+        self._capacity = max(int(capacity), 1)
+        with open(path, "wb") as file:
+            file.write(_HEADER.pack(MAGIC, VERSION, self._header_length, len(self._objects), len(self.fields), self._capacity, 0))
+            file.write(names)
+            file.truncate(self._header_length + self._data_bytes(self._capacity))
+        self._data = self._map()
+
+    def _data_bytes(self, capacity) -> int:
+        rows, columns = _data_shape(capacity, len(self._objects), len(self.fields))
+        return rows*columns*8
+
+    def _map(self):
+        return require_numpy().memmap(self.path, dtype="<f8", mode="r+", offset=self._header_length,
+                shape=_data_shape(self._capacity, len(self._objects), len(self.fields)))
+
+    def record(self, time_passed):
+        """
+        Record the current state of the objects as the next tick. Called by the universe after each of its ticks.
+
+        Parameters
+        ----------
+        time_passed: :class:`float`
+            The time passed in the universe, recorded with the tick.
+
+        Raises
+        ------
+        :exc:`ValueError`
+            The recorder is closed.
+        """
+        if self._data is None:
+            raise ValueError("The recorder is closed.")
+        if self.ticks == self._capacity:
+            self._grow()
+        row = self._data[self.ticks]
+        row[0] = time_passed
+        row[1:].reshape(len(self._objects), len(self.fields))[...] = _gather(require_numpy(), self._objects, self._field_indexes)
+        self.ticks += 1
+        if self.ticks % self.flush_interval == 0:
+            self.flush()
+
+    def _grow(self):
+        """Double the capacity of the file."""
+        self._data.flush()
+        self._data = None #Unmap before resizing
+        self._capacity *= 2
+        with open(self.path, "r+b") as file:
+            file.truncate(self._header_length + self._data_bytes(self._capacity))
+        self._data = self._map()
+
+    def flush(self):
+        """Write the recorded ticks out to the file and bring the header up to date,
+        so that :func:`open_recording` sees every tick recorded so far."""
+        if self._data is None: return
+        self._data.flush()
+        with open(self.path, "r+b") as file:
+            file.write(_HEADER.pack(MAGIC, VERSION, self._header_length, len(self._objects), len(self.fields), self._capacity, self.ticks))
+
+    def close(self):
+        """Flush the recording and close the file, giving back the room left over for more ticks.
+        Recording more ticks afterwards raises :exc:`ValueError`."""
+        if self._data is None: return
+        self._data.flush()
+        self._data = None #Unmap before resizing
+        self._capacity = self.ticks
+        with open(self.path, "r+b") as file:
+            file.truncate(self._header_length + self._data_bytes(self.ticks))
+            file.write(_HEADER.pack(MAGIC, VERSION, self._header_length, len(self._objects), len(self.fields), self._capacity, self.ticks))
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+class Recording():
+    """A recording made by a :class:`Recorder`, opened with :func:`open_recording`.
+
+    The recorded ticks are memory-mapped from the file, not loaded: :attr:`states` and :attr:`times` are read-only NumPy views
+    of it, and only the parts that are used are read from the disk. ::
+
+        recording = open_recording("match.rec")
+        ball = recording.object_states("ball") #Every tick of the ball, shape (ticks, fields)
+        heights = ball[:, recording.fields.index("ypos")]
+
+    Attributes
+    ----------
+    names: List
+        The names of the recorded objects, in order.
+
+    fields: List[:class:`str`]
+        The recorded fields of each object, in order.
+
+    times: :class:`numpy.ndarray`
+        The time passed in the universe at each tick, shape ``(ticks,)``.
+
+    states: :class:`numpy.ndarray`
+        The recorded fields of every object at each tick, shape ``(ticks, number of objects, number of fields)``.
+
+    """
+
+    def __init__(self, names, fields, data):
+        self.names = names
+        self.fields = fields
+        self.times = data[:, 0]
+        self.states = data[:, 1:].reshape(len(data), len(names), len(fields))
+        self._indexes = {name: index for index, name in enumerate(names)}
+
+    def __len__(self):
+        return len(self.times)
+
+    def object_states(self, name):
+        """
+        Returns the recorded fields of one object at each tick, shape ``(ticks, number of fields)``.
+
+        Parameters
+        ----------
+        name
+            The name of the object.
+
+        Raises
+        ------
+        :exc:`KeyError`
+            No object with that name was recorded.
+        """
+        return self.states[:, self._indexes[name]]
+
+def open_recording(path) -> Recording:
+    """
+    Open a recording made by a :class:`Recorder`, without loading it (see :class:`Recording`).
+    Recordings that are still being recorded can be opened, and hold the ticks recorded up to the last flush.
+
+    Parameters
+    ----------
+    path: :class:`str`
+        The file of the recording.
+
+    Raises
+    ------
+    :exc:`ValueError`
+        The file is not a recording, or was recorded by a newer version of pysics.
+    """
+    np = require_numpy()
+    with open(path, "rb") as file:
+        header = file.read(_HEADER.size)
+        if len(header) < _HEADER.size or header[:len(MAGIC)] != MAGIC:
+            raise ValueError("{} is not a pysics recording.".format(path))
+        magic, version, header_length, objects, fields, capacity, ticks = _HEADER.unpack(header)
+        if version > VERSION:
+            raise ValueError("{} was recorded by a newer version of pysics.".format(path))
+        names = json.loads(file.read(header_length - _HEADER.size).rstrip(b"\0").decode("utf-8"))
+    shape = _data_shape(ticks, objects, fields)
+    if ticks == 0:
+        data = np.zeros(shape)
+    else:
+        data = np.memmap(path, dtype="<f8", mode="r", offset=header_length, shape=shape)
+    return Recording(names["objects"], names["fields"], data)
@@ -0,0 +1,307 @@
+import json
+import mmap
+import struct
+import zlib
+
+from .world import require_numpy
+from .recording import DEFAULT_FIELDS, _field_indexes, _gather
+
+#The file starts with a fixed header: magic bytes, format version, header length (including the names and padding),
+#number of objects, number of fields per object, keyframe interval, ticks recorded and where the index of the ticks starts
+MAGIC = b"PYSICSRP"
+VERSION = 1
+_HEADER = struct.Struct("<8sIIIIIQQ")
+
+def _index_dtype(np):
+    """Where each tick is stored in the file, how many bytes it takes, and the time passed at it."""
+    return np.dtype([("offset", "<u8"), ("length", "<u8"), ("time", "<f8")])
+
+def _encode(np, values, keyframe, level) -> bytes:
+    """Compress the values of a tick, as the bits that changed since its keyframe if there is one."""
+    bits = np.ascontiguousarray(values, dtype="<f8").view("<u8")
+    if keyframe is not None:
+        bits = bits ^ keyframe.view("<u8")
+    #The first byte of every value, then the second byte of every value... Values that change little only differ in their
+    #lowest bytes, so the highest bytes of their changes are long runs of zeros.
+    shuffled = bits.reshape(-1).view(np.uint8).reshape(-1, 8).T
+    return zlib.compress(shuffled.tobytes(), level)
+
+def _decode(np, data, shape, keyframe):
+    """Decompress the values of a tick, given the values of its keyframe if it was stored as changes."""
+    count = shape[0]*shape[1]
+    bits = np.frombuffer(zlib.decompress(data), dtype=np.uint8).reshape(8, count).T.copy().view("<u8").reshape(shape)
+    if keyframe is not None:
+        bits ^= keyframe.view("<u8")
+    return bits.view("<f8")
+
+class ReplayWriter():
+    """Records the state of objects after every tick into a compact replay file, which :func:`open_replay` can jump around in.
+
+    Give a replay writer to a universe with :meth:`pysics.manager.PhysicsManager.add_recorder`, just like a
+    :class:`pysics.recording.Recorder`: ::
+
+        with ReplayWriter("match.replay", manager.objects) as writer:
+            manager.add_recorder(writer)
+            for _ in range(10000):
+                manager.tick()
+
+    Every ``keyframe_interval`` ticks, the chosen fields of every object are stored in full (a keyframe). Every other tick only
+    stores which bits changed since its keyframe. Both are compressed, so replays are much smaller than recordings,
+    and any tick can be found again by decompressing just itself and its keyframe, however long the replay is.
+    Ticks are written out in bulk, and the index of the ticks is written when the writer is closed.
+    Requires ``numpy``.
+
+    Parameters
+    ----------
+    path: :class:`str`
+        The file to write the replay into. An existing file is overwritten.
+
+    objects: List[:class:`pysics.obj.PhysicsObject`]
+        The objects to record, such as :attr:`pysics.manager.PhysicsManager.objects` for every object of a universe.
+        Their names are stored as text (or JSON numbers), and should be unique.
+
+    fields: List[:class:`str`]
+        The fields of each object to record, from :data:`pysics.world.STATE_FIELDS`.
+        Defaults to :data:`pysics.recording.DEFAULT_FIELDS` (the position and velocity of each object).
+
+    keyframe_interval: :class:`int`
+        How many ticks there are from one keyframe to the next. Shorter intervals store more keyframes, which are larger,
+        but the ticks between them have fewer bits that changed. Defaults to ``60``.
+
+    compression: :class:`int`
+        The :mod:`zlib` compression level, from ``0`` (none) to ``9`` (smallest and slowest). Defaults to ``1``.
+
+    Attributes
+    ----------
+    path: :class:`str`
+        The file the replay is written into.
+
+    names: List
+        The names of the recorded objects, in order.
+
+    fields: List[:class:`str`]
+        The recorded fields of each object, in order.
+
+    ticks: :class:`int`
+        The number of ticks recorded so far.
+
+    Raises
+    ------
+    :exc:`ValueError`
+        A field is not in :data:`pysics.world.STATE_FIELDS`.
+
+    """
+
+    def __init__(self, path, objects, fields=DEFAULT_FIELDS, keyframe_interval=60, compression=1):
+        np = require_numpy()
+        self.path = path
+        self._objects = list(objects)
+        self.names = [obj.name for obj in self._objects]
+        self.fields = list(fields)
+        self._field_indexes = _field_indexes(np, self.fields)
+        self.keyframe_interval = max(int(keyframe_interval), 1)
+        self.compression = compression
+        self.ticks = 0
+        self._index = [] #(offset, length, time) of each tick
+        self._keyframe = None #The values of the last keyframe
+
+        names = json.dumps({"objects": self.names, "fields": self.fields}, default=str).encode("utf-8")
+        self._header_length = -(-(_HEADER.size + len(names))//8)*8
+        self._file = open(path, "wb")
+        self._file.write(self._header(0))
+        self._file.write(names.ljust(self._header_length - _HEADER.size, b"\0"))
+        self._file.flush()
+        self._offset = self._header_length
+
+    def _header(self, index_offset) -> bytes:
+        return _HEADER.pack(MAGIC, VERSION, self._header_length, len(self._objects), len(self.fields), self.keyframe_interval, self.ticks, index_offset)
+
+    def record(self, time_passed):
+        """
+        Record the current state of the objects as the next tick. Called by the universe after each of its ticks.
+
+        Parameters
+        ----------
+        time_passed: :class:`float`
+            The time passed in the universe, recorded with the tick.
+
+        Raises
+        ------
+        :exc:`ValueError`
+            The writer is closed.
+        """
+        if self._file is None:
+            raise ValueError("The replay writer is closed.")
+        np = require_numpy()
+        values = np.array(_gather(np, self._objects, self._field_indexes), dtype="<f8", order="C")
+        if self.ticks % self.keyframe_interval == 0:
+            data = _encode(np, values, None, self.compression)
+            self._keyframe = values
+        else:
+            data = _encode(np, values, self._keyframe, self.compression)
+        self._file.write(data)
+        self._index.append((self._offset, len(data), time_passed))
+        self._offset += len(data)
+        self.ticks += 1
+
+    def close(self):
+        """Write the index of the ticks and close the file. Recording more ticks afterwards raises :exc:`ValueError`."""
+        if self._file is None: return
+        np = require_numpy()
+        index = np.array(self._index, dtype=_index_dtype(np))
+        self._file.write(index.tobytes())
+        self._file.seek(0)
+        self._file.write(self._header(self._offset))
+        self._file.close()
+        self._file = None
+        self._index = []
+        self._keyframe = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+class Replay():
+    """A replay written by a :class:`ReplayWriter`, opened with :func:`open_replay`.
+
+    The file is memory-mapped, not loaded, and ticks are only decompressed when they are asked for. Any tick can be found
+    (:meth:`frame`) by decompressing just itself and its keyframe, no matter how long the replay is,
+    and :meth:`frames` plays the replay forwards or backwards from any tick: ::
+
+        replay = open_replay("match.replay")
+        for time, states in replay.frames(start=len(replay) - 1, stop=len(replay) - 300, step=-1): #A kill-cam, backwards
+            draw(states[:, :3])
+
+    The last keyframe decompressed is kept, so playing a replay in either direction decompresses one tick at a time.
+
+    Attributes
+    ----------
+    names: List
+        The names of the recorded objects, in order.
+
+    fields: List[:class:`str`]
+        The recorded fields of each object, in order.
+
+    keyframe_interval: :class:`int`
+        How many ticks there are from one keyframe to the next.
+
+    times: :class:`numpy.ndarray`
+        The time passed in the universe at each tick, shape ``(ticks,)``.
+
+    """
+
+    def __init__(self, buffer, names, fields, keyframe_interval, index):
+        self._buffer = buffer
+        self.names = names
+        self.fields = fields
+        self.keyframe_interval = keyframe_interval
+        self._index = index
+        self.times = index["time"]
+        self._shape = (len(names), len(fields))
+        self._keyframe = (None, None) #The tick and values of the last keyframe decompressed
+
+    def __len__(self):
+        return len(self._index)
+
+    def _tick(self, tick) -> int:
+        if tick < 0: tick += len(self)
+        if not 0 <= tick < len(self):
+            raise IndexError("The replay has no tick {}.".format(tick))
+        return tick
+
+    def frame(self, tick):
+        """
+        Returns the recorded fields of every object at a tick, shape ``(number of objects, number of fields)``.
+
+        Parameters
+        ----------
+        tick: :class:`int`
+            The tick, from ``0`` (the first recorded tick). Negative ticks count back from the end.
+
+        Raises
+        ------
+        :exc:`IndexError`
+            The replay has no such tick.
+        """
+        tick = self._tick(tick)
+        keyframe = tick - tick % self.keyframe_interval
+        if self._keyframe[0] != keyframe:
+            self._keyframe = (keyframe, self._read(keyframe, None))
+        if tick == keyframe:
+            return self._keyframe[1].copy()
+        return self._read(tick, self._keyframe[1])
+
+    def _read(self, tick, keyframe):
+        offset, length, time = self._index[tick]
+        return _decode(require_numpy(), self._buffer[offset:offset+length], self._shape, keyframe)
+
+    def frames(self, start=0, stop=None, step=1):
+        """
+        Play the replay from a tick, yielding the time passed and the recorded fields of every object
+        (see :meth:`frame`) at each tick, one at a time.
+
+        Parameters
+        ----------
+        start: :class:`int`
+            The first tick. Negative ticks count back from the end. Defaults to ``0``.
+
+        stop: :class:`int`
+            The tick to stop before. Negative ticks count back from the end, and ticks past either end of the replay stop at it,
+            as in a slice. Defaults to ``None`` (the end of the replay in the direction of ``step``).
+
+        step: :class:`int`
+            How many ticks to move each time. Negative steps play the replay backwards. Defaults to ``1``.
+        """
+        if len(self) == 0: return
+        for tick in range(*slice(self._tick(start), stop, step).indices(len(self))):
+            yield self.times[tick], self.frame(tick)
+
+    def object_frame(self, name, tick):
+        """
+        Returns the recorded fields of one object at a tick, shape ``(number of fields,)``.
+
+        Parameters
+        ----------
+        name
+            The name of the object.
+
+        tick: :class:`int`
+            The tick, from ``0``. Negative ticks count back from the end.
+
+        Raises
+        ------
+        :exc:`ValueError`
+            No object with that name was recorded.
+        """
+        return self.frame(tick)[self.names.index(name)]
+
+def open_replay(path) -> Replay:
+    """
+    Open a replay written by a :class:`ReplayWriter`, without loading it (see :class:`Replay`).
+
+    Parameters
+    ----------
+    path: :class:`str`
+        The file of the replay.
+
+    Raises
+    ------
+    :exc:`ValueError`
+        The file is not a replay, was not closed by its writer, or was written by a newer version of pysics.
+    """
+    np = require_numpy()
+    with open(path, "rb") as file:
+        header = file.read(_HEADER.size)
+        if len(header) < _HEADER.size or header[:len(MAGIC)] != MAGIC:
+            raise ValueError("{} is not a pysics replay.".format(path))
+        magic, version, header_length, objects, fields, keyframe_interval, ticks, index_offset = _HEADER.unpack(header)
+        if version > VERSION:
+            raise ValueError("{} was written by a newer version of pysics.".format(path))
+        if index_offset == 0:
+            raise ValueError("{} was not closed by its writer.".format(path))
+        names = json.loads(file.read(header_length - _HEADER.size).rstrip(b"\0").decode("utf-8"))
+        buffer = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+    index = np.frombuffer(buffer, dtype=_index_dtype(np), count=ticks, offset=index_offset)
+    return Replay(buffer, names["objects"], names["fields"], keyframe_interval, index)
@@ -0,0 +1,173 @@
+import mmap
+import multiprocessing
+import os
+
+from .errors import UnsharedStateError
+
+def _run_worker(connection, managers):
+    """Tick the managers given to a worker process whenever the scheduler asks, until it is told to stop."""
+    while True:
+        message = connection.recv()
+        if message is None: break
+        tick_length, ticks = message
+        try:
+            for manager in managers:
+                for _ in range(ticks):
+                    manager.tick(tick_length)
+            connection.send([(manager.time_passed, manager.tick_count, manager._exact_time, manager.last_substeps) for manager in managers])
+        except Exception as error:
+            connection.send(error)
+    connection.close()
+
+class UniverseScheduler():
+    """Runs many independent universes (such as one per match of a game) in parallel, across a pool of worker processes.
+
+    The state of every object of every universe is moved into shared memory, and the universes are split between the
+    worker processes. Each tick, the workers tick their own universes in place, so the objects in this process
+    see their new positions and velocities without any objects being copied between processes: ::
+
+        managers = [PhysicsManager(create_match_objects(), tick_length=1/60, array_backed=True) for match in range(1000)]
+        scheduler = UniverseScheduler(managers)
+        while True:
+            scheduler.tick()
+            ... #Read positions from the objects as usual
+
+    Worker processes are started (with the ``fork`` start method) when the scheduler is created, and each one works with
+    a copy of its universes as they were at that moment. Only the state of the objects is shared after that:
+    positions, velocities and masses can be changed between ticks, but other changes (such as applying forces, or adding
+    objects, colliders or constraints) are not seen by the workers. To make such changes, :meth:`close` the scheduler,
+    change the universes and create a new scheduler.
+
+    If there is only one process to use, or the ``fork`` start method is not available (such as on Windows),
+    the universes are ticked one after another in this process instead, with the same results.
+
+    Parameters
+    ----------
+    managers: List[:class:`pysics.manager.PhysicsManager`]
+        The universes to run. Every universe must be array-backed (``array_backed=True``) to be run in parallel.
+
+    processes: :class:`int`
+        The number of worker processes to start. Defaults to ``None`` (the number of CPUs).
+        No more processes are started than there are universes.
+
+    Attributes
+    ----------
+    parallel: :class:`bool`
+        Whether the universes are ticked by worker processes, or one after another in this process.
+
+    Raises
+    ------
+    :exc:`ValueError`
+        A universe is not array-backed (and the universes would be run in parallel).
+
+    """
+
+    def __init__(self, managers, processes=None):
+        self._managers = list(managers)
+        if processes is None: processes = os.cpu_count() or 1
+        processes = min(processes, len(self._managers))
+        self.parallel = processes > 1 and "fork" in multiprocessing.get_all_start_methods()
+        self._buffers = [] #(world, shared memory, state array in the shared memory) of each universe
+        self._workers = [] #(process, connection, managers) of each worker process
+        if not self.parallel: return
+
+        for manager in self._managers:
+            if manager.world is None:
+                raise ValueError("Universes must be array-backed to be run in parallel.")
+        for manager in self._managers:
+            world = manager.world
+            buffer = mmap.mmap(-1, world.state.nbytes) #Anonymous memory, shared with the processes forked from this one
+            world.use_buffer(buffer)
+            self._buffers.append((world, buffer, world.state))
+
+        #The largest universes first, each to the process with the fewest objects so far
+        groups = [[] for _ in range(processes)]
+        loads = [0]*processes
+        for manager in sorted(self._managers, key=lambda manager: manager.world.count, reverse=True):
+            least = loads.index(min(loads))
+            groups[least].append(manager)
+            loads[least] += manager.world.count + 1
+
+        context = multiprocessing.get_context("fork")
+        for group in groups:
+            connection, worker_connection = context.Pipe()
+            process = context.Process(target=_run_worker, args=(worker_connection, group), daemon=True)
+            process.start()
+            worker_connection.close()
+            self._workers.append((process, connection, group))
+
+    @property
+    def managers(self) -> list:
+        """A copy of the universes run by this scheduler, in the order they were given."""
+        return list(self._managers)
+
+    def tick(self, tick_length=None, ticks=1):
+        """
+        Make ticks pass for every universe, and wait for all of them to finish.
+
+        Parameters
+        ----------
+        tick_length: :class:`float`
+            The amount of time each tick lasts. Defaults to ``None`` (the :attr:`pysics.manager.PhysicsManager.tick_length`
+            of each universe).
+
+        ticks: :class:`int`
+            The number of ticks to run for every universe. Running several ticks at once saves waiting for the
+            slowest worker after every tick. Defaults to ``1``.
+
+        Raises
+        ------
+        :exc:`pysics.errors.UnsharedStateError`
+            Objects were added to a universe since the scheduler was created, so its state is no longer shared.
+        """
+        if not self.parallel:
+            for manager in self._managers:
+                for _ in range(ticks):
+                    manager.tick(tick_length)
+            return
+
+        for world, buffer, state in self._buffers:
+            if world.state is not state:
+                raise UnsharedStateError("A universe run by a UniverseScheduler can not grow. Close the scheduler before adding objects.")
+        for process, connection, group in self._workers:
+            connection.send((tick_length, ticks))
+        error = None
+        for process, connection, group in self._workers:
+            reply = connection.recv()
+            if isinstance(reply, Exception):
+                error = reply
+                continue
+            for manager, (time_passed, tick_count, exact_time, last_substeps) in zip(group, reply):
+                manager.time_passed = time_passed
+                manager.tick_count = tick_count
+                manager._exact_time = exact_time
+                manager.last_substeps = last_substeps
+        if error is not None:
+            raise error
+
+    def close(self):
+        """Stop the worker processes and move the state of every universe back out of shared memory.
+        Afterwards, :meth:`tick` ticks the universes one after another in this process."""
+        for process, connection, group in self._workers:
+            connection.send(None)
+            connection.close()
+        for process, connection, group in self._workers:
+            process.join()
+        self._workers = []
+
+        for world in [world for world, buffer, state in self._buffers if world.state is state]:
+            world.use_buffer(None)
+        buffers = [buffer for world, buffer, state in self._buffers]
+        self._buffers = [] #No views of the shared memory are left, so it can be closed
+        for buffer in buffers:
+            try:
+                buffer.close()
+            except BufferError:
+                pass #Something still holds a view of the shared memory, which is freed once it is gone
+        self.parallel = False
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
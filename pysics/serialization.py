@@ -0,0 +1,323 @@
+import itertools
+import json
+import struct
+import sys
+import zlib
+from array import array
+from fractions import Fraction
+from operator import attrgetter, itemgetter
+
+from .world import require_numpy, NUM_FIELDS, ACCEL, ANGULAR_ACCEL, MASS, MOMENT_OF_INERTIA, NET_FORCE, NET_TORQUE, EXTENTS, SHAPE
+from .obj import PhysicsObject
+from .force import Force
+from .shapes import NO_SHAPE, SPHERE, Sphere, Box
+from .integrators import ConstantAcceleration, SemiImplicitEuler, VelocityVerlet, RK4
+from .manager import PhysicsManager
+
+#Every save starts with these magic bytes, the format version and whether the rest of the save is compressed with zlib
+MAGIC = b"PYSICSSV"
+VERSION = 1
+_HEADER = struct.Struct("<8sHB")
+
+#The settings of a universe, in the order they are saved. Settings that can be None are saved as NaN (floats) or -1 (integers).
+_SETTINGS = (
+    ("tick_length", "d"), ("time_passed", "d"), ("tick_count", "q"), ("_unsimulated_time", "d"), ("alpha", "d"),
+    ("max_ticks_per_advance", "q"), ("max_step_distance", "d"), ("error_tolerance", "d"), ("max_substeps", "q"),
+    ("sleep_ticks", "q"), ("sleep_velocity", "d"), ("sleep_angular_velocity", "d"), ("sleep_force", "d"),
+    ("constraint_iterations", "q"), ("threads", "q"), ("deterministic", "?"),
+)
+_OPTIONAL_SETTINGS = {"max_step_distance", "error_tolerance", "sleep_ticks", "sleep_force", "threads"}
+_SETTINGS_STRUCT = struct.Struct("<" + "".join(code for name, code in _SETTINGS) + "?B") #Then whether it is array-backed, and its integrator
+
+#Integrators are saved as their index in this tuple (0 for none)
+_INTEGRATORS = (None, ConstantAcceleration, SemiImplicitEuler, VelocityVerlet, RK4)
+_INTEGRATOR_CODES = {type(None) if cls is None else cls: code for code, cls in enumerate(_INTEGRATORS)}
+
+_SHAPE_TYPES = {type(None), Sphere, Box}
+
+#The attributes of a Force saved in columns, in the order Force takes them after its name
+_FORCE_ATTRIBUTES = ("x", "y", "z", "force_type", "x_rotation_axis_distance", "y_rotation_axis_distance", "z_rotation_axis_distance",
+        "x_rot_angle", "y_rot_angle", "z_rot_angle")
+
+_BLOCK_LENGTH = struct.Struct("<Q")
+
+#The fields of a state row that are saved. The accelerations, net forces and net torques are calculated again from the forces when loading.
+_DERIVED_FIELDS = set(range(ACCEL, ACCEL+3)) | set(range(ANGULAR_ACCEL, ANGULAR_ACCEL+3)) | set(range(NET_FORCE, NET_TORQUE+3))
+_SAVED_FIELDS = [field for field in range(NUM_FIELDS) if field not in _DERIVED_FIELDS]
+
+def _column(typecode, values) -> bytes:
+    """Pack values into a little-endian column."""
+    column = values if isinstance(values, array) else array(typecode, values)
+    if sys.byteorder == "big": column.byteswap()
+    return column.tobytes()
+
+def _read_column(typecode, data) -> array:
+    column = array(typecode)
+    column.frombytes(data)
+    if sys.byteorder == "big": column.byteswap()
+    return column
+
+def _integrator_codes(integrators) -> array:
+    try:
+        return array("B", map(_INTEGRATOR_CODES.__getitem__, map(type, integrators)))
+    except KeyError:
+        raise ValueError("Only the integrators of pysics.integrators can be saved.")
+
+def _shapes(kinds, x_extents, y_extents, z_extents) -> list:
+    """The shape of every object from the kinds and half extents of their shapes. Objects with the same shape share it
+    (shapes are never changed)."""
+    keys = list(zip(kinds, x_extents, y_extents, z_extents))
+    shapes = dict.fromkeys(keys)
+    for kind, x_extent, y_extent, z_extent in shapes:
+        if kind == SPHERE:
+            shape = Sphere(x_extent)
+        elif kind == NO_SHAPE:
+            shape = None
+        else:
+            shape = Box(2*x_extent, 2*y_extent, 2*z_extent)
+        shapes[kind, x_extent, y_extent, z_extent] = shape
+    return list(map(shapes.__getitem__, keys))
+
+def dumps(manager, compression=None) -> bytes:
+    """
+    Save a universe (:class:`pysics.manager.PhysicsManager`) into compact bytes, such as to write into a file
+    or to send over a network. :func:`loads` makes an identical universe from them.
+
+    Saves are versioned, little-endian on every platform, and stored in columns: the state rows of every object
+    are saved field by field in one block (a single copy from an array-backed universe), then the integrator of every object,
+    every force that is acting on an object (forces shared by several objects are saved once), and which forces act on each object.
+    The names of objects and forces are saved as JSON, and should be text or numbers. The accelerations, net forces and net torques
+    of objects are not saved, since :func:`loads` calculates them again from the forces, masses and moments of inertia.
+
+    The settings of the universe are saved along with its objects, but not its broad phase, contact solver, colliders,
+    constraints, force fields or recorders (give them to :func:`loads` instead). Objects are saved as
+    :class:`pysics.obj.PhysicsObject` and forces as :class:`pysics.force.Force`, even if they are instances of subclasses.
+
+    Parameters
+    ----------
+    manager: :class:`pysics.manager.PhysicsManager`
+        The universe to save.
+
+    compression: :class:`int`
+        The :mod:`zlib` compression level, from ``1`` (fastest) to ``9`` (smallest), or ``None`` not to compress. Defaults to ``None``.
+
+    Raises
+    ------
+    :exc:`ValueError`
+        An object has a shape or integrator that is not part of pysics.
+    """
+    objects = list(manager._objects.values())
+    world = manager.world
+
+    if not set(map(type, map(attrgetter("_shape"), objects))) <= _SHAPE_TYPES:
+        raise ValueError("Only spheres and boxes can be saved.")
+    integrator_codes = _integrator_codes(map(attrgetter("_integrator"), objects))
+
+    force_counts = array("I", map(len, map(attrgetter("_forces"), objects)))
+    force_indexes = array("I")
+    forces = {} #id(force): index, in the order they are first found
+    unique_forces = []
+    for obj in itertools.compress(objects, force_counts): #Only the objects with forces
+        for force in obj._forces.values():
+            index = forces.get(id(force))
+            if index is None:
+                index = forces[id(force)] = len(unique_forces)
+                unique_forces.append(force)
+            force_indexes.append(index)
+
+    if world is not None:
+        np = require_numpy()
+        rows = np.fromiter(map(attrgetter("_row"), objects), dtype=np.intp, count=len(objects)) #Removing objects changes the order of the rows
+        states = world.state[np.ix_(rows, _SAVED_FIELDS)].astype("<f8", copy=False).tobytes(order="F") #One field after another
+    else:
+        states = _column("d", itertools.chain.from_iterable(zip(*map(itemgetter(*_SAVED_FIELDS), map(attrgetter("_state"), objects)))))
+
+    exact_time = None if manager._exact_time is None else [str(manager._exact_time.numerator), str(manager._exact_time.denominator)]
+    names = json.dumps({"objects": [obj.name for obj in objects], "forces": [force.name for force in unique_forces],
+            "exact_time": exact_time}, default=str).encode("utf-8")
+    blocks = [names, states, _column("B", integrator_codes)]
+    blocks.extend(_column("d", [getattr(force, attribute) for force in unique_forces]) for attribute in _FORCE_ATTRIBUTES)
+    blocks.append(_column("I", force_counts))
+    blocks.append(_column("I", force_indexes))
+
+    settings = []
+    for name, code in _SETTINGS:
+        value = getattr(manager, name)
+        if value is None: value = float("nan") if code == "d" else -1
+        settings.append(value)
+    body = b"".join([_SETTINGS_STRUCT.pack(*settings, world is not None, _integrator_codes([manager.integrator])[0])] +
+            [_BLOCK_LENGTH.pack(len(block)) + block for block in blocks])
+    if compression is not None:
+        body = zlib.compress(body, compression)
+    return _HEADER.pack(MAGIC, VERSION, compression is not None) + body
+
+def loads(data, **arguments):
+    """
+    Make a universe from bytes saved by :func:`dumps`. Its objects, forces and settings are the same as in the saved universe,
+    and ticking it gives exactly the same results. The accelerations of its objects are calculated from their forces
+    (without the force fields of the saved universe).
+
+    Parameters
+    ----------
+    data: :class:`bytes`
+        The saved universe.
+
+    arguments
+        Other arguments to give the new :class:`pysics.manager.PhysicsManager`, which are not saved (such as a ``broad_phase``,
+        ``contact_solver``, ``colliders`` or ``fields``), or settings to use instead of the saved ones.
+
+    Returns
+    -------
+    :class:`pysics.manager.PhysicsManager`
+        The new universe.
+
+    Raises
+    ------
+    :exc:`ValueError`
+        The data is not a saved universe, or was saved by a newer version of pysics.
+    """
+    data = memoryview(data)
+    if len(data) < _HEADER.size or bytes(data[:len(MAGIC)]) != MAGIC:
+        raise ValueError("The data is not a saved pysics universe.")
+    magic, version, compressed = _HEADER.unpack(data[:_HEADER.size])
+    if version > VERSION:
+        raise ValueError("The universe was saved by a newer version of pysics.")
+    body = memoryview(zlib.decompress(data[_HEADER.size:])) if compressed else data[_HEADER.size:]
+
+    values = _SETTINGS_STRUCT.unpack(body[:_SETTINGS_STRUCT.size])
+    settings = {}
+    for (name, code), value in zip(_SETTINGS, values):
+        if name in _OPTIONAL_SETTINGS and (value != value or value == -1): value = None #NaN or -1
+        settings[name] = value
+    array_backed, integrator_code = values[len(_SETTINGS):]
+    blocks = []
+    offset = _SETTINGS_STRUCT.size
+    while offset < len(body):
+        length, = _BLOCK_LENGTH.unpack(body[offset:offset+_BLOCK_LENGTH.size])
+        offset += _BLOCK_LENGTH.size
+        blocks.append(body[offset:offset+length])
+        offset += length
+    names = json.loads(bytes(blocks[0]).decode("utf-8"))
+    integrator_codes = _read_column("B", blocks[2])
+    force_columns = [_read_column("d", block) for block in blocks[3:3+len(_FORCE_ATTRIBUTES)]]
+    force_counts = _read_column("I", blocks[3+len(_FORCE_ATTRIBUTES)])
+    force_indexes = _read_column("I", blocks[4+len(_FORCE_ATTRIBUTES)])
+    count = len(names["objects"])
+
+    integrator = _INTEGRATORS[integrator_code]
+    manager_arguments = {name: settings[name] for name in ("tick_length", "time_passed", "max_ticks_per_advance", "max_step_distance",
+            "error_tolerance", "max_substeps", "sleep_ticks", "sleep_velocity", "sleep_angular_velocity", "sleep_force",
+            "constraint_iterations", "threads", "deterministic")}
+    manager_arguments.update(array_backed=bool(array_backed), integrator=None if integrator is None else integrator())
+    manager_arguments.update(arguments)
+    manager = PhysicsManager(**manager_arguments)
+    manager.tick_count = settings["tick_count"]
+    manager._unsimulated_time = settings["_unsimulated_time"]
+    manager.alpha = settings["alpha"]
+    if names["exact_time"] is not None:
+        manager._exact_time = Fraction(int(names["exact_time"][0]), int(names["exact_time"][1]))
+
+    #The saved fields of every object, one field after another. The derived fields start at 0, and are calculated once the forces are added.
+    if manager.world is not None:
+        np = require_numpy()
+        saved = np.frombuffer(blocks[1], dtype="<f8").reshape(len(_SAVED_FIELDS), count)
+        states = np.zeros((count, NUM_FIELDS), order="F") #In the layout of the world's buffer, so that every field is one copy
+        for index, field in enumerate(_SAVED_FIELDS):
+            states[:, field] = saved[index]
+        rows = itertools.repeat(None, count)
+        shapes = _shapes(*(states[:, field].tolist() for field in (SHAPE, EXTENTS, EXTENTS+1, EXTENTS+2)))
+    else:
+        states = None
+        saved = _read_column("d", blocks[1])
+        columns = {field: saved[index*count:(index + 1)*count] for index, field in enumerate(_SAVED_FIELDS)}
+        zeros = array("d", bytes(8*count))
+        rows = list(map(list, zip(*(columns.get(field, zeros) for field in range(NUM_FIELDS)))))
+        shapes = _shapes(*(columns[field] for field in (SHAPE, EXTENTS, EXTENTS+1, EXTENTS+2)))
+
+    integrators = [None] + [cls() for cls in _INTEGRATORS[1:]]
+    objects = list(map(PhysicsObject._from_state, names["objects"], rows, shapes, map(integrators.__getitem__, integrator_codes)))
+
+    forces = [Force(name, *attributes) for name, *attributes in zip(names["forces"], *force_columns)]
+    for force in forces:
+        force.force_type = int(force.force_type) if float(force.force_type).is_integer() else force.force_type
+    groups = {} #The indexes of the forces acting on objects, in order: the objects they act on
+    start = 0
+    for obj, force_count in zip(objects, force_counts):
+        if force_count == 0: continue
+        indexes = tuple(force_indexes[start:start+force_count])
+        for index in indexes:
+            force = forces[index]
+            obj._forces[force.name] = force
+            force._parents.add(obj)
+        groups.setdefault(indexes, []).append(obj)
+        start += force_count
+
+    manager.add_objects(objects, states)
+    _sum_forces(manager, groups.values())
+    _calculate_accels(manager, objects)
+    return manager
+
+def _sum_forces(manager, groups):
+    """Sum the forces of loaded objects into their net forces and net torques. The forces of each group of objects
+    (acted on by the same forces, in the same order) are only summed once."""
+    world = manager.world
+    for group in groups:
+        first = group[0]
+        first._sum_forces()
+        if len(group) == 1: continue
+        if world is not None:
+            rows = [obj._row for obj in group[1:]]
+            world.state[rows, NET_FORCE:NET_TORQUE+3] = world.state[first._row, NET_FORCE:NET_TORQUE+3]
+        else:
+            totals = first._state[NET_FORCE:NET_TORQUE+3]
+            for obj in group[1:]:
+                obj._state[NET_FORCE:NET_TORQUE+3] = totals
+
+def _calculate_accels(manager, objects):
+    """Calculate the accelerations of loaded objects from their net forces and net torques, the same way
+    :meth:`pysics.obj.PhysicsObject.calculate_accel` does. Objects with a mass (or moment of inertia) of 0 are left without one,
+    and raise :exc:`pysics.errors.MassOfZeroError` when they are ticked."""
+    if manager.world is not None:
+        np = require_numpy()
+        states = manager.world.state[:manager.world.count]
+        for accel, total, divisor in ((ACCEL, NET_FORCE, MASS), (ANGULAR_ACCEL, NET_TORQUE, MOMENT_OF_INERTIA)):
+            divisors = states[:, divisor:divisor+1]
+            np.divide(states[:, total:total+3], divisors, out=states[:, accel:accel+3], where=divisors != 0)
+        return
+    for obj in objects:
+        state = obj._state
+        for accel, total, divisor in ((ACCEL, NET_FORCE, MASS), (ANGULAR_ACCEL, NET_TORQUE, MOMENT_OF_INERTIA)):
+            if state[divisor] != 0:
+                for axis in range(3):
+                    state[accel+axis] = state[total+axis]/state[divisor]
+
+def dump(manager, file, compression=None):
+    """
+    Save a universe into a binary file (see :func:`dumps`).
+
+    Parameters
+    ----------
+    manager: :class:`pysics.manager.PhysicsManager`
+        The universe to save.
+
+    file: :term:`file object`
+        A file opened for writing in binary mode.
+
+    compression: :class:`int`
+        The :mod:`zlib` compression level, or ``None`` not to compress. Defaults to ``None``.
+    """
+    file.write(dumps(manager, compression))
+
+def load(file, **arguments):
+    """
+    Make a universe from a binary file saved by :func:`dump` (see :func:`loads`).
+
+    Parameters
+    ----------
+    file: :term:`file object`
+        A file opened for reading in binary mode.
+
+    arguments
+        Other arguments to give the new :class:`pysics.manager.PhysicsManager`.
+    """
+    return loads(file.read(), **arguments)
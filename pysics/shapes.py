@@ -0,0 +1,97 @@
+#Codes stored in an object's state row to identify its shape (see pysics.world.SHAPE)
+NO_SHAPE = 0
+SPHERE = 1
+BOX = 2
+
+class Shape():
+    """The base class of every collision shape. Shapes are centered on their object's position.
+
+    A :class:`pysics.obj.PhysicsObject` without a shape is never reported by a broad phase.
+
+    Shapes should not be changed once they are given to an object. To resize an object, give it a new shape.
+
+    Attributes
+    ----------
+    kind: :class:`int`
+        The code identifying this type of shape.
+
+    """
+
+    __slots__ = ()
+
+    kind = NO_SHAPE
+
+    def half_extents(self) -> tuple:
+        """
+        Returns half the size of the axis-aligned bounding box around this shape on each axis in the form (x, y, z)
+
+        Returns
+        -------
+        tuple(:class:`float`, :class:`float`, :class:`float`)
+            The distance from the center of the shape to the faces of its bounding box on the 3 dimensions (x, y, z)
+        """
+        return (0.0, 0.0, 0.0)
+
+class Sphere(Shape):
+    """A sphere (or a circle, if you are only using 2 dimensions).
+
+    Parameters
+    ----------
+    radius: :class:`float`
+        The radius of the sphere in meters.
+
+    Attributes
+    ----------
+    radius: :class:`float`
+        The radius of the sphere in meters.
+
+    """
+
+    __slots__ = ("radius",)
+
+    kind = SPHERE
+
+    def __init__(self, radius):
+        self.radius = radius
+
+    def half_extents(self) -> tuple:
+        return (self.radius, self.radius, self.radius)
+
+class Box(Shape):
+    """An axis-aligned box (or a rectangle, if you are only using 2 dimensions). Boxes do not rotate with their object's orientation.
+
+    Parameters
+    ----------
+    x_length: :class:`float`
+        The length of the box on the x axis in meters.
+
+    y_length: :class:`float`
+        The length of the box on the y axis in meters.
+
+    z_length: :class:`float`
+        The length of the box on the z axis in meters. Defaults to ``0.0`` (a flat box, for 2D games).
+
+    Attributes
+    ----------
+    x_length: :class:`float`
+        The length of the box on the x axis in meters.
+
+    y_length: :class:`float`
+        The length of the box on the y axis in meters.
+
+    z_length: :class:`float`
+        The length of the box on the z axis in meters.
+
+    """
+
+    __slots__ = ("x_length", "y_length", "z_length")
+
+    kind = BOX
+
+    def __init__(self, x_length, y_length, z_length=0.0):
+        self.x_length = x_length
+        self.y_length = y_length
+        self.z_length = z_length
+
+    def half_extents(self) -> tuple:
+        return (self.x_length/2, self.y_length/2, self.z_length/2)
@@ -0,0 +1,158 @@
+import itertools
+from array import array
+
+from .world import require_numpy, NUM_FIELDS
+
+#Snapshots store the state of every object as pages of this many bytes. Pages that are the same as in the previous snapshot
+#(such as the masses and shapes of every object, or the rows of objects that are asleep) are shared with it instead of copied.
+PAGE_SIZE = 4096
+
+#The attributes of a Force that are saved in snapshots
+_FORCE_ATTRIBUTES = ("name", "force_type", "x", "y", "z", "x_rotation_axis_distance", "y_rotation_axis_distance", "z_rotation_axis_distance",
+        "x_rot_angle", "y_rot_angle", "z_rot_angle")
+
+class Snapshot():
+    """The saved state of a universe at one moment, made by :meth:`pysics.manager.PhysicsManager.snapshot`
+    and brought back with :meth:`pysics.manager.PhysicsManager.restore`.
+
+    A snapshot holds the state row of every object (see :data:`pysics.world.STATE_FIELDS`) in one flat buffer, the forces acting
+    on every object (and the values of their attributes), which objects are in the universe, and the time passed in the universe.
+    Static colliders, constraints, force fields and the settings of the universe are not saved.
+
+    Snapshots are delta-compressed against the previous snapshot of the same universe: the flat buffer is split into pages of
+    :data:`PAGE_SIZE` bytes, and pages that did not change are shared between the snapshots instead of copied (they are never
+    changed afterwards). The forces of objects whose forces did not change are shared the same way. Keeping a history of snapshots
+    (such as the last 60 ticks, for rollback netcode) therefore mostly costs the memory of the positions and velocities that changed.
+
+    Attributes
+    ----------
+    objects: tuple(:class:`pysics.obj.PhysicsObject`)
+        The objects that were in the universe, in order.
+
+    time_passed: :class:`float`
+        The time that had passed in the universe, in seconds.
+
+    """
+
+    __slots__ = ("objects", "time_passed", "_rows", "_pages", "_versions", "_forces", "_manager_state")
+
+    @property
+    def nbytes(self) -> int:
+        """The size of the saved state rows in bytes, including pages shared with other snapshots (see :func:`total_nbytes`)."""
+        return sum(len(page) for page in self._pages)
+
+def total_nbytes(snapshots) -> int:
+    """
+    Returns the memory used by the state rows of many snapshots in bytes, counting pages shared between them once.
+
+    Parameters
+    ----------
+    snapshots: Iterable[:class:`Snapshot`]
+        The snapshots.
+    """
+    pages = {}
+    for snapshot in snapshots:
+        for page in snapshot._pages:
+            pages[id(page)] = len(page)
+    return sum(pages.values())
+
+def _paginate(data, previous_pages) -> tuple:
+    """Split bytes into pages, reusing the pages of the previous snapshot that have not changed."""
+    pages = []
+    for index, start in enumerate(range(0, len(data), PAGE_SIZE)):
+        page = data[start:start+PAGE_SIZE]
+        if index < len(previous_pages) and page == previous_pages[index]:
+            page = previous_pages[index] #Keep the old copy, so that the new one is freed
+        pages.append(page)
+    return tuple(pages)
+
+def _record_forces(obj) -> tuple:
+    """Returns the forces acting on an object, each with the values of its attributes."""
+    return tuple((force, tuple(getattr(force, attribute) for attribute in _FORCE_ATTRIBUTES)) for force in obj._forces.values())
+
+def _restore_forces(obj, record):
+    """Make the forces acting on an object, and the values of their attributes, the ones in a record made by :func:`_record_forces`."""
+    for force in obj._forces.values():
+        force._parents.discard(obj)
+    obj._forces = {}
+    for force, values in record:
+        for attribute, value in zip(_FORCE_ATTRIBUTES, values):
+            if getattr(force, attribute) != value:
+                setattr(force, attribute, value) #Through the attribute, so that other objects the force is applied to are told
+        obj._forces[force.name] = force
+        force._parents.add(obj)
+
+def take(objects, rows, world, previous, manager_state) -> Snapshot:
+    """
+    Save the state of objects (see :meth:`pysics.manager.PhysicsManager.snapshot`).
+
+    Parameters
+    ----------
+    objects: tuple(:class:`pysics.obj.PhysicsObject`)
+        The objects of the universe, in order.
+
+    rows: tuple(:class:`pysics.obj.PhysicsObject`)
+        The objects of an array-backed universe in the order of their rows, or ``None``.
+
+    world: :class:`pysics.world.ArrayWorld`
+        The world of an array-backed universe, or ``None``.
+
+    previous: :class:`Snapshot`
+        The previous snapshot of the universe to share unchanged pages and forces with, or ``None``.
+
+    manager_state: tuple
+        The state of the universe itself, restored as it is.
+    """
+    snapshot = Snapshot()
+    snapshot.objects = objects
+    snapshot.time_passed = manager_state[0]
+    snapshot._rows = rows
+    snapshot._manager_state = manager_state
+
+    #Bring every cached net force up to date, so that the saved state rows match the saved forces
+    for obj in objects:
+        if obj._forces_dirty: obj._sum_forces()
+    versions = [obj._forces_version for obj in objects]
+    if previous is not None and previous.objects == objects and previous._versions == versions:
+        forces = previous._forces #No force changed
+    else:
+        recorded = {}
+        if previous is not None:
+            recorded = {id(obj): (version, record) for obj, version, record in zip(previous.objects, previous._versions, previous._forces)}
+        forces = []
+        for obj, version in zip(objects, versions):
+            old = recorded.get(id(obj))
+            forces.append(old[1] if old is not None and old[0] == version else _record_forces(obj))
+        forces = tuple(forces)
+    snapshot._versions = versions
+    snapshot._forces = forces
+
+    if world is not None:
+        data = world.state[:world.count].tobytes(order="F") #One field after another
+    else:
+        data = array("d", itertools.chain.from_iterable(zip(*[obj._state for obj in objects]))).tobytes() #One field after another
+    snapshot._pages = _paginate(data, () if previous is None else previous._pages)
+    return snapshot
+
+def restore_forces(snapshot) -> list:
+    """Restore the forces of every object of a snapshot whose forces changed since. Returns the objects whose forces were restored."""
+    restored = []
+    for obj, version, record in zip(snapshot.objects, snapshot._versions, snapshot._forces):
+        if obj._forces_version != version:
+            _restore_forces(obj, record)
+            restored.append((obj, version))
+    return restored
+
+def restore_states(snapshot, world):
+    """Write the saved state rows of a snapshot back into its objects (or into the world of an array-backed universe,
+    whose rows must be in the same order as when the snapshot was taken)."""
+    data = b"".join(snapshot._pages)
+    if world is not None:
+        count = len(snapshot.objects)
+        world.state[:count] = require_numpy().frombuffer(data, dtype=float).reshape(NUM_FIELDS, count).T
+        return
+    flat = array("d")
+    flat.frombytes(data)
+    count = len(snapshot.objects)
+    for index, obj in enumerate(snapshot.objects):
+        obj._state[:] = flat[index::count]
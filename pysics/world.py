@@ -0,0 +1,387 @@
+from .errors import AlreadyBoundError
+from .errors import MassOfZeroError
+from .errors import MomentOfInertiaZeroError
+
+#Layout of a single object's state row. Every PhysicsObject keeps its kinematic state in a row with this layout,
+#either in a small list of its own or in a row of an ArrayWorld's buffer.
+STATE_FIELDS = (
+    "xpos", "ypos", "zpos",
+    "xvel", "yvel", "zvel",
+    "xaccel", "yaccel", "zaccel",
+    "x_orientation", "y_orientation", "z_orientation",
+    "x_angular_vel", "y_angular_vel", "z_angular_vel",
+    "x_angular_accel", "y_angular_accel", "z_angular_accel",
+    "mass", "moment_of_inertia",
+    "time_passed",
+    "x_net_force", "y_net_force", "z_net_force",
+    "x_net_torque", "y_net_torque", "z_net_torque",
+    "x_extent", "y_extent", "z_extent", "shape",
+    "ccd",
+    "x_previous_pos", "y_previous_pos", "z_previous_pos",
+    "sleep_timer", "asleep",
+)
+"""The names of the fields in a state row, in the order they are stored."""
+
+#Offsets of each block of three axes (x, y, z) within a state row
+POS = 0
+VEL = 3
+ACCEL = 6
+ORIENTATION = 9
+ANGULAR_VEL = 12
+ANGULAR_ACCEL = 15
+#Scalars
+MASS = 18
+MOMENT_OF_INERTIA = 19
+TIME_PASSED = 20
+#Cached sums of the forces acting on an object (see PhysicsObject.get_net_force)
+NET_FORCE = 21
+NET_TORQUE = 24
+#Half the size of an object's bounding box on each axis, and the code of its shape (see pysics.shapes)
+EXTENTS = 27
+SHAPE = 30
+#1 if the object uses continuous collision detection against static colliders (see PhysicsObject.ccd), otherwise 0
+CCD = 31
+#The position of the object before the last tick of PhysicsManager.advance, used to interpolate positions for rendering
+PREVIOUS_POS = 32
+#How many ticks in a row the object has been still, and 1 if it is asleep (see PhysicsManager.sleep_ticks), otherwise 0
+SLEEP_TIMER = 35
+ASLEEP = 36
+
+#The 18 kinematic fields, viewed as (linear/angular, position/velocity/acceleration, axis)
+KINEMATIC_FIELDS = 18
+
+NUM_FIELDS = len(STATE_FIELDS)
+
+def require_numpy():
+    """Import and return :mod:`numpy`, which is only needed for array-backed universes.
+
+    Raises
+    ------
+    :exc:`ImportError`
+        NumPy is not installed.
+    """
+    try:
+        import numpy
+    except ImportError:
+        raise ImportError("Array-backed universes require numpy (pip install numpy).")
+    return numpy
+
+class ArrayWorld():
+    """Structure-of-arrays storage for the state of every object in an array-backed universe.
+
+    The state of all objects lives in one 2D NumPy buffer of shape ``(capacity, NUM_FIELDS)`` stored column-major,
+    so each field (``xpos``, ``yvel``, ``mass``...) is contiguous in memory across all objects.
+    A bound :class:`pysics.obj.PhysicsObject` stores a view of its own row instead of its own values,
+    so reading or writing ``obj.xpos`` reads or writes the buffer directly.
+
+    Worlds are created and managed by :class:`pysics.manager.PhysicsManager` (``array_backed=True``), and
+    rarely need to be used directly.
+
+    Parameters
+    ----------
+    capacity: :class:`int`
+        The number of rows to allocate up front. The buffer doubles in size when it fills up. Defaults to ``64``.
+
+    Attributes
+    ----------
+    state: :class:`numpy.ndarray`
+        The whole buffer, including unused rows. Rows ``0`` to ``count - 1`` belong to :attr:`objects`.
+
+    objects: List[:class:`pysics.obj.PhysicsObject`]
+        The objects stored in this world. ``objects[n]`` owns row ``n``.
+
+    count: :class:`int`
+        The number of rows in use.
+
+    dirty: Set[:class:`pysics.obj.PhysicsObject`]
+        The objects whose cached net force or net torque is out of date, because a force acting on them changed.
+
+    own_integrators: Set[:class:`pysics.obj.PhysicsObject`]
+        The objects that have their own :attr:`pysics.obj.PhysicsObject.integrator`.
+
+    """
+
+    def __init__(self, capacity=64):
+        self.state = require_numpy().zeros((max(int(capacity), 1), NUM_FIELDS), order="F")
+        self.objects = []
+        self.count = 0
+        self.dirty = set()
+        self.own_integrators = set()
+
+    def __setstate__(self, attributes):
+        self.__dict__.update(attributes)
+        #Pickled objects hold no state row of their own (see PhysicsObject.__getstate__), so they are given views of the buffer again
+        for row, obj in enumerate(self.objects):
+            obj._state = self.state[row]
+
+    @property
+    def capacity(self) -> int:
+        """The number of rows currently allocated."""
+        return self.state.shape[0]
+
+    def bind(self, obj):
+        """Move an object's state into this world. The object's attributes become a view of its new row.
+
+        Parameters
+        ----------
+        obj: :class:`pysics.obj.PhysicsObject`
+            The object to store in this world.
+
+        Raises
+        ------
+        :exc:`pysics.errors.AlreadyBoundError`
+            The object is already stored in an array-backed universe.
+        """
+        if obj._world is not None:
+            raise AlreadyBoundError("A PhysicsObject can only be stored in one array-backed universe at a time.")
+        if self.count == self.capacity:
+            self._resize(self.capacity*2)
+        row = self.count
+        self.state[row] = obj._state
+        obj._world = self
+        obj._row = row
+        obj._state = self.state[row]
+        self.objects.append(obj)
+        self.count += 1
+        if obj._forces_dirty:
+            self.dirty.add(obj)
+        if obj._integrator is not None:
+            self.own_integrators.add(obj)
+
+    def bind_all(self, objects, states=None):
+        """Move the state of many objects into this world at once (see :meth:`bind`).
+        Either all of the objects are bound, or none of them are.
+
+        Parameters
+        ----------
+        objects: List[:class:`pysics.obj.PhysicsObject`]
+            The objects to store in this world.
+
+        states: :class:`numpy.ndarray`
+            The state rows to give the objects instead of their own, shape ``(len(objects), NUM_FIELDS)``,
+            copied in one operation. Defaults to ``None`` (the objects' own state).
+
+        Raises
+        ------
+        :exc:`pysics.errors.AlreadyBoundError`
+            One of the objects is already stored in an array-backed universe (or is given twice).
+        """
+        if len(set(map(id, objects))) != len(objects) or any(obj._world is not None for obj in objects):
+            raise AlreadyBoundError("A PhysicsObject can only be stored in one array-backed universe at a time.")
+        if not objects: return
+        start = self.count
+        stop = start + len(objects)
+        capacity = self.capacity
+        while capacity < stop:
+            capacity *= 2
+        if capacity != self.capacity:
+            self._resize(capacity)
+
+        state = self.state
+        state[start:stop] = [obj._state for obj in objects] if states is None else states #One bulk copy
+        for row, obj in enumerate(objects, start):
+            obj._world = self
+            obj._row = row
+            obj._state = state[row]
+            if obj._forces_dirty:
+                self.dirty.add(obj)
+            if obj._integrator is not None:
+                self.own_integrators.add(obj)
+        self.objects.extend(objects)
+        self.count = stop
+
+    def unbind(self, obj):
+        """Move an object's state out of this world, back into the object itself.
+
+        The last row is moved into the freed row so that the used rows stay packed.
+
+        Parameters
+        ----------
+        obj: :class:`pysics.obj.PhysicsObject`
+            The object to remove from this world.
+        """
+        if obj._world is not self: return
+        self.dirty.discard(obj)
+        self.own_integrators.discard(obj)
+        row = obj._row
+        obj._state = self.state[row].tolist()
+        obj._world = None
+        obj._row = None
+
+        last = self.count - 1
+        if row != last:
+            moved = self.objects[last]
+            self.state[row] = self.state[last]
+            self.objects[row] = moved
+            moved._row = row
+            moved._state = self.state[row]
+        self.objects.pop()
+        self.count -= 1
+
+    def clear(self):
+        """Unbind every object stored in this world."""
+        for obj in self.objects:
+            obj._state = self.state[obj._row].tolist()
+            obj._world = None
+            obj._row = None
+        self.objects = []
+        self.count = 0
+        self.dirty.clear()
+        self.own_integrators.clear()
+
+    def use_buffer(self, buffer=None):
+        """Move the state of every object into memory owned by another object (such as shared memory), keeping the capacity.
+
+        The buffer still doubles in size (into memory of its own) when it fills up.
+
+        Parameters
+        ----------
+        buffer: :class:`memoryview`
+            Any writable object supporting the buffer protocol (such as a :class:`mmap.mmap`) of at least
+            ``capacity*NUM_FIELDS*8`` bytes, or ``None`` to move the state back into memory of its own.
+        """
+        np = require_numpy()
+        if buffer is None:
+            state = np.zeros(self.state.shape, order="F")
+        else:
+            state = np.ndarray(self.state.shape, dtype=float, buffer=buffer, order="F")
+        self._move(state)
+
+    def _resize(self, capacity):
+        self._move(require_numpy().zeros((capacity, NUM_FIELDS), order="F"))
+
+    def _move(self, state):
+        state[:self.count] = self.state[:self.count]
+        self.state = state
+        for row, obj in enumerate(self.objects): #Views of the old buffer are stale
+            obj._state = state[row]
+
+    def column(self, start, stop=None):
+        """Returns a view of one or more fields for every used row.
+
+        Parameters
+        ----------
+        start: :class:`int`
+            The index of the first field (for example :data:`POS`).
+
+        stop: :class:`int`
+            One past the index of the last field. Defaults to ``start + 1`` (a 1D view of a single field).
+
+        Returns
+        -------
+        :class:`numpy.ndarray`
+            A view (not a copy) of the requested fields with one row per object.
+        """
+        if stop is None:
+            return self.state[:self.count, start]
+        return self.state[:self.count, start:stop]
+
+    def calculate_accels(self):
+        """Calculate the linear and angular acceleration of every object in one batched operation.
+
+        Only objects in :attr:`dirty` have their forces summed again (in Python).
+        The accelerations are then divided out of the cached net forces and net torques for every object at once,
+        the same way :meth:`pysics.obj.PhysicsObject.calculate_accel` does for a single object.
+
+        Raises
+        ------
+        :exc:`pysics.errors.MassOfZeroError`
+            An object has a mass of ``0``.
+
+        :exc:`pysics.errors.MomentOfInertiaZeroError`
+            An object has a moment of inertia of ``0``.
+        """
+        for obj in self.dirty:
+            if obj._forces_dirty:
+                obj._sum_forces()
+        self.dirty.clear()
+
+        np = require_numpy()
+        n = self.count
+        state = self.state
+        masses = state[:n, MASS:MASS+1]
+        moments_of_inertia = state[:n, MOMENT_OF_INERTIA:MOMENT_OF_INERTIA+1]
+        if not masses.all():
+            raise MassOfZeroError("PhysicsObjects cannot have a mass of 0.")
+        if not moments_of_inertia.all():
+            raise MomentOfInertiaZeroError("PhysicsObjects cannot have a moment of inertia of 0.")
+        np.divide(state[:n, NET_FORCE:NET_FORCE+3], masses, out=state[:n, ACCEL:ACCEL+3])
+        np.divide(state[:n, NET_TORQUE:NET_TORQUE+3], moments_of_inertia, out=state[:n, ANGULAR_ACCEL:ANGULAR_ACCEL+3])
+
+    def integrate(self, tick_length, start=0, stop=None):
+        """Make a single tick pass for every object in this world in one batched operation.
+
+        Uses the same constant-acceleration equations as :meth:`pysics.obj.PhysicsObject.tick`,
+        for linear and angular state together: ::
+
+            x = x(initial) + v(initial)(t) + 1/2(a)(t^2)
+            v = v(initial) + (a)(t)
+
+        The operations are performed in the same order as the scalar path, so for IEEE 754 doubles
+        the results are identical to ticking every object individually (a tolerance of 0 ulp).
+        Accelerations must already be up to date; they are not recalculated here.
+
+        Parameters
+        ----------
+        tick_length: :class:`float`
+            The amount of time that passes this tick.
+
+        start: :class:`int`
+            The first row to move. Defaults to ``0``.
+
+        stop: :class:`int`
+            The row after the last row to move. Defaults to ``None`` (every used row).
+            Separate ranges of rows can be moved on separate threads.
+
+        """
+        if stop is None: stop = self.count
+        if tick_length == 0 or stop <= start: return #Literally no time passes.
+        #Transposing gives one contiguous row per field, and splitting the field axis is always a view, not a copy
+        kinematics = self.state[start:stop, :KINEMATIC_FIELDS].T.reshape(2, 3, 3, stop - start)
+        pos = kinematics[:, 0]
+        vel = kinematics[:, 1]
+        accel = kinematics[:, 2]
+
+        pos += vel*tick_length + (1/2)*(accel)*(tick_length*tick_length)
+        vel += (accel)*(tick_length)
+        self.state[start:stop, TIME_PASSED] += tick_length
+
+    @property
+    def positions(self):
+        """View of ``(xpos, ypos, zpos)`` for every object, shape ``(count, 3)``."""
+        return self.column(POS, POS+3)
+
+    @property
+    def velocities(self):
+        """View of ``(xvel, yvel, zvel)`` for every object, shape ``(count, 3)``."""
+        return self.column(VEL, VEL+3)
+
+    @property
+    def accelerations(self):
+        """View of ``(xaccel, yaccel, zaccel)`` for every object, shape ``(count, 3)``."""
+        return self.column(ACCEL, ACCEL+3)
+
+    @property
+    def orientations(self):
+        """View of the orientations on each axis for every object, shape ``(count, 3)``."""
+        return self.column(ORIENTATION, ORIENTATION+3)
+
+    @property
+    def angular_velocities(self):
+        """View of the angular velocities on each axis for every object, shape ``(count, 3)``."""
+        return self.column(ANGULAR_VEL, ANGULAR_VEL+3)
+
+    @property
+    def angular_accelerations(self):
+        """View of the angular accelerations on each axis for every object, shape ``(count, 3)``."""
+        return self.column(ANGULAR_ACCEL, ANGULAR_ACCEL+3)
+
+    @property
+    def masses(self):
+        """View of the mass of every object, shape ``(count,)``."""
+        return self.column(MASS)
+
+    @property
+    def moments_of_inertia(self):
+        """View of the moment of inertia of every object, shape ``(count,)``."""
+        return self.column(MOMENT_OF_INERTIA)
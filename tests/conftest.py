@@ -0,0 +1,14 @@
+import pytest
+
+def _array_backed_modes():
+    """Scalar universes, and array-backed universes if numpy is installed."""
+    try:
+        import numpy
+    except ImportError:
+        return [False]
+    return [False, True]
+
+@pytest.fixture(params=_array_backed_modes(), ids=lambda array_backed: "array" if array_backed else "scalar")
+def array_backed(request):
+    """Runs a test once for a universe that is not array-backed, and once for one that is."""
+    return request.param
@@ -0,0 +1,92 @@
+import pickle
+
+import pytest
+
+from pysics.obj import PhysicsObject
+from pysics.manager import PhysicsManager
+from pysics.shapes import Sphere, Box
+from pysics.broadphase import SpatialHashGrid, SweepAndPrune
+
+np = pytest.importorskip("numpy")
+
+def random_boxes(seed, count=300, size=1.0):
+    rng = np.random.default_rng(seed)
+    centers = rng.uniform(-10, 10, (count, 3))
+    extents = rng.uniform(0.05, size, (count, 3))
+    return centers - extents, centers + extents
+
+def brute_force_pairs(mins, maxs):
+    overlapping = ((mins[:, None] <= maxs[None]) & (mins[None] <= maxs[:, None])).all(axis=2)
+    first, second = np.nonzero(np.triu(overlapping, 1))
+    return np.stack((first, second), axis=1)
+
+@pytest.mark.parametrize("cell_size", [0.25, 1.0, 5.0])
+def test_spatial_hash_grid_finds_every_pair(cell_size):
+    for seed in range(3):
+        mins, maxs = random_boxes(seed)
+        objects = [object() for _ in range(len(mins))]
+        pairs = SpatialHashGrid(cell_size).find_pairs(objects, mins, maxs)
+        assert np.array_equal(pairs, brute_force_pairs(mins, maxs))
+
+def test_spatial_hash_grid_handles_few_objects():
+    mins, maxs = random_boxes(0, count=1)
+    assert SpatialHashGrid().find_pairs([object()], mins, maxs).shape == (0, 2)
+    with pytest.raises(ValueError):
+        SpatialHashGrid(0)
+
+def test_manager_finds_candidate_pairs(array_backed):
+    a = PhysicsObject("a", shape=Sphere(1.0))
+    b = PhysicsObject("b", xpos=1.5, shape=Box(1.0, 1.0, 1.0))
+    c = PhysicsObject("c", xpos=10.0, xvel=-7.0, shape=Sphere(1.0))
+    ghost = PhysicsObject("ghost") #No shape, so never in a pair
+    manager = PhysicsManager([a, b, c, ghost], array_backed=array_backed, broad_phase=SpatialHashGrid(2.0))
+    assert manager.find_candidate_pairs() == [(a, b)]
+    manager.tick()
+    assert manager.candidate_pairs == [(a, b), (b, c)]
+
+def test_managers_with_a_broad_phase_can_be_pickled(array_backed):
+    manager = PhysicsManager([PhysicsObject("a", shape=Sphere(1.0)), PhysicsObject("b", xpos=1.0, shape=Sphere(1.0))],
+            array_backed=array_backed, broad_phase=SpatialHashGrid())
+    copied = pickle.loads(pickle.dumps(manager))
+    copied.tick()
+    assert [(first.name, second.name) for first, second in copied.candidate_pairs] == [("a", "b")]
+
+@pytest.mark.parametrize("axis", [0, 1, 2])
+def test_sweep_and_prune_finds_every_pair(axis):
+    broad_phase = SweepAndPrune(axis)
+    mins, maxs = random_boxes(0)
+    objects = [object() for _ in range(len(mins))]
+    rng = np.random.default_rng(1)
+    for _ in range(10): #Moving a little each time repairs the sorted order instead of sorting again
+        offsets = rng.normal(0, 0.05, mins.shape)
+        mins, maxs = mins + offsets, maxs + offsets
+        assert np.array_equal(broad_phase.find_pairs(objects, mins, maxs), brute_force_pairs(mins, maxs))
+        assert sorted(broad_phase._order, key=lambda index: mins[index, axis]) == broad_phase._order
+
+def test_sweep_and_prune_follows_added_and_removed_objects():
+    broad_phase = SweepAndPrune()
+    mins, maxs = random_boxes(2, size=3.0)
+    objects = [object() for _ in range(len(mins))]
+    broad_phase.find_pairs(objects, mins, maxs)
+    kept = np.arange(0, len(objects), 2)
+    extra_mins, extra_maxs = random_boxes(3, count=20, size=3.0)
+    objects = [objects[index] for index in kept] + [object() for _ in range(20)]
+    mins = np.concatenate((mins[kept], extra_mins))
+    maxs = np.concatenate((maxs[kept], extra_maxs))
+    assert np.array_equal(broad_phase.find_pairs(objects, mins, maxs), brute_force_pairs(mins, maxs))
+    broad_phase.axis = 2 #Sorted from scratch along the new axis
+    assert np.array_equal(broad_phase.find_pairs(objects, mins, maxs), brute_force_pairs(mins, maxs))
+    with pytest.raises(ValueError):
+        SweepAndPrune(3)
+
+def test_broad_phases_agree_in_a_universe(array_backed):
+    def make(broad_phase):
+        rng = np.random.default_rng(4)
+        objects = [PhysicsObject(str(index), *rng.uniform(-5, 5, 3), *rng.uniform(-1, 1, 3), shape=Sphere(0.5)) for index in range(100)]
+        return PhysicsManager(objects, tick_length=0.1, array_backed=array_backed, broad_phase=broad_phase)
+    grid = make(SpatialHashGrid())
+    sweep = make(SweepAndPrune())
+    for _ in range(20):
+        grid.tick()
+        sweep.tick()
+        assert [(a.name, b.name) for a, b in grid.candidate_pairs] == [(a.name, b.name) for a, b in sweep.candidate_pairs]
@@ -0,0 +1,81 @@
+import pickle
+
+import pytest
+
+from pysics.obj import PhysicsObject
+from pysics.force import Force
+from pysics.manager import PhysicsManager
+from pysics.shapes import Sphere, Box
+from pysics.colliders import HalfSpace, StaticBox
+
+np = pytest.importorskip("numpy")
+
+def test_half_space_normal_is_normalized():
+    wall = HalfSpace(normal=(-2.0, 0.0, 0.0), offset=-800.0)
+    assert wall.normal == (-1.0, 0.0, 0.0)
+    assert wall.offset == -400.0
+    with pytest.raises(ValueError):
+        HalfSpace(normal=(0.0, 0.0, 0.0))
+
+def test_objects_bounce_off_a_floor(array_backed):
+    ball = PhysicsObject("ball", ypos=1.05, yvel=-2.0, shape=Sphere(1.0))
+    manager = PhysicsManager([ball], tick_length=0.1, array_backed=array_backed, colliders=[HalfSpace(restitution=1.0)])
+    manager.tick()
+    assert ball.yvel == pytest.approx(2.0)
+
+def test_objects_rest_on_a_floor(array_backed):
+    box = PhysicsObject("box", ypos=0.5, shape=Box(1.0, 1.0, 1.0), forces=[Force("gravity", y=-9.8)])
+    manager = PhysicsManager([box], tick_length=1/60, array_backed=array_backed, colliders=[HalfSpace(restitution=0.0)])
+    for _ in range(120):
+        manager.tick()
+    assert box.ypos == pytest.approx(0.5, abs=0.02)
+    assert abs(box.yvel) < 0.2
+
+def test_static_box_pushes_objects_out_of_the_nearest_face(array_backed):
+    platform = StaticBox(0.0, 0.0, 10.0, 1.0, z_length=10.0, restitution=0.0)
+    objects = [PhysicsObject("sphere", ypos=1.2, yvel=-1.0, shape=Sphere(1.0)),
+            PhysicsObject("box", xpos=5.3, yvel=-1.0, shape=Box(1.0, 1.0, 1.0)),
+            PhysicsObject("far", ypos=10.0, yvel=-1.0, shape=Sphere(1.0))]
+    indexes, normals, depths = platform.find_contacts(PhysicsManager(objects)._collision_states()[1])
+    assert indexes.tolist() == [0, 1]
+    assert normals.tolist() == [[0.0, 1.0, 0.0], [1.0, 0.0, 0.0]]
+    assert depths == pytest.approx([0.3, 0.2])
+
+def test_colliders_cannot_be_changed_in_place():
+    floor = HalfSpace()
+    manager = PhysicsManager(colliders=[floor])
+    with pytest.raises(AttributeError):
+        manager.colliders.append(HalfSpace())
+    manager.remove_collider(floor)
+    assert manager.colliders == ()
+    with pytest.raises(ValueError):
+        manager.remove_collider(floor)
+
+def test_managers_with_colliders_can_be_pickled(array_backed):
+    manager = PhysicsManager([PhysicsObject("ball", ypos=1.05, yvel=-2.0, shape=Sphere(1.0))], tick_length=0.1,
+            array_backed=array_backed, colliders=[HalfSpace(), StaticBox(5.0, 0.0, 1.0, 1.0)])
+    copied = pickle.loads(pickle.dumps(manager))
+    manager.tick()
+    copied.tick()
+    assert copied.checksum() == manager.checksum()
+
+@pytest.mark.parametrize("ccd", [False, True])
+def test_fast_objects_cannot_pass_through_thin_walls_with_ccd(array_backed, ccd):
+    wall = StaticBox(5.0, 0.0, 0.1, 10.0, restitution=1.0)
+    bullet = PhysicsObject("bullet", xvel=100.0, shape=Sphere(0.1), ccd=ccd)
+    slow = PhysicsObject("slow", ypos=20.0, xvel=1.0, shape=Sphere(0.1), ccd=ccd)
+    manager = PhysicsManager([bullet, slow], tick_length=0.1, array_backed=array_backed, colliders=[wall])
+    manager.tick()
+    assert slow.xpos == pytest.approx(0.1)
+    if ccd: #Bounced back from the wall at 4.85 m, then moved back for the rest of the tick
+        assert bullet.xvel == pytest.approx(-100.0)
+        assert bullet.xpos == pytest.approx(4.85 - (10.0 - 4.85))
+    else: #Jumped straight over the wall
+        assert bullet.xpos == pytest.approx(10.0)
+
+def test_ccd_against_a_half_space(array_backed):
+    bullet = PhysicsObject("bullet", ypos=1.0, yvel=-100.0, shape=Sphere(0.5), ccd=True)
+    manager = PhysicsManager([bullet], tick_length=0.1, array_backed=array_backed, colliders=[HalfSpace(restitution=0.5)])
+    manager.tick()
+    assert bullet.yvel == pytest.approx(50.0)
+    assert bullet.ypos >= 0.5
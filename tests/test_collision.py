@@ -0,0 +1,75 @@
+import math
+import pickle
+
+import pytest
+
+from pysics.obj import PhysicsObject
+from pysics.manager import PhysicsManager
+from pysics.shapes import Sphere, Box
+from pysics.broadphase import SpatialHashGrid
+from pysics.collision import ContactSolver, find_contacts, plane_contacts
+
+np = pytest.importorskip("numpy")
+
+def contacts_between(*objects):
+    manager = PhysicsManager(objects)
+    objects, states, in_place = manager._collision_states()
+    pairs = np.array([(index, other) for index in range(len(objects)) for other in range(index + 1, len(objects))], dtype=np.intp)
+    return find_contacts(objects, states, pairs)
+
+def test_sphere_sphere_contact():
+    contacts = list(contacts_between(PhysicsObject("a", shape=Sphere(1.0)), PhysicsObject("b", xpos=1.5, shape=Sphere(1.0))))
+    assert len(contacts) == 1
+    assert contacts[0].normal == (1.0, 0.0, 0.0)
+    assert contacts[0].depth == pytest.approx(0.5)
+    assert len(contacts_between(PhysicsObject("a", shape=Sphere(1.0)), PhysicsObject("b", xpos=2.5, shape=Sphere(1.0)))) == 0
+
+def test_box_box_contact_uses_the_axis_of_least_overlap():
+    contacts = list(contacts_between(PhysicsObject("a", shape=Box(2.0, 2.0, 2.0)), PhysicsObject("b", xpos=0.5, ypos=-1.8, shape=Box(2.0, 2.0, 2.0))))
+    assert contacts[0].normal == (0.0, -1.0, 0.0)
+    assert contacts[0].depth == pytest.approx(0.2)
+
+def test_sphere_box_contact_in_either_order():
+    sphere = PhysicsObject("sphere", ypos=1.8, shape=Sphere(1.0))
+    box = PhysicsObject("box", shape=Box(2.0, 2.0, 2.0))
+    sphere_first = list(contacts_between(sphere, box))[0]
+    box_first = list(contacts_between(box, sphere))[0]
+    assert sphere_first.normal == (0.0, -1.0, 0.0) #Pushes the box away from the sphere
+    assert box_first.normal == (0.0, 1.0, 0.0)
+    assert sphere_first.depth == box_first.depth == pytest.approx(0.2)
+
+def test_plane_contacts():
+    objects = [PhysicsObject("sphere", ypos=0.5, shape=Sphere(1.0)), PhysicsObject("box", ypos=0.5, shape=Box(2.0, 4.0, 2.0)),
+            PhysicsObject("above", ypos=5.0, shape=Sphere(1.0))]
+    states = PhysicsManager(objects)._collision_states()[1]
+    indexes, depths = plane_contacts(states, (0.0, 1.0, 0.0), 0.0)
+    assert indexes.tolist() == [0, 1]
+    assert depths.tolist() == [0.5, 1.5]
+
+def test_elastic_collision_conserves_momentum_and_energy(array_backed):
+    a = PhysicsObject("a", xvel=3.0, mass=1.0, shape=Sphere(1.0))
+    b = PhysicsObject("b", xpos=1.9, xvel=-1.0, mass=3.0, shape=Sphere(1.0))
+    manager = PhysicsManager([a, b], tick_length=0.001, array_backed=array_backed,
+            broad_phase=SpatialHashGrid(), contact_solver=ContactSolver(restitution=1.0))
+    manager.tick()
+    assert len(manager.contacts) == 1
+    assert a.xvel*a.mass + b.xvel*b.mass == pytest.approx(0.0)
+    assert (a.xvel, b.xvel) == (pytest.approx(-3.0), pytest.approx(1.0))
+    assert b.xpos - a.xpos > 1.9 #Pushed apart
+
+def test_inelastic_collision_with_friction_stops_sliding(array_backed):
+    a = PhysicsObject("a", yvel=-1.0, xvel=0.1, shape=Sphere(1.0))
+    b = PhysicsObject("b", ypos=-1.95, mass=math.inf, shape=Sphere(1.0)) #Cannot be moved
+    manager = PhysicsManager([a, b], tick_length=0.001, array_backed=array_backed,
+            broad_phase=SpatialHashGrid(), contact_solver=ContactSolver(restitution=0.0, friction=1.0))
+    manager.tick()
+    assert a.get_vel() == (pytest.approx(0.0), pytest.approx(0.0), 0.0)
+    assert b.get_vel() == (0.0, 0.0, 0.0)
+
+def test_managers_with_a_contact_solver_can_be_pickled(array_backed):
+    manager = PhysicsManager([PhysicsObject("a", xvel=1.0, shape=Sphere(1.0)), PhysicsObject("b", xpos=1.9, shape=Sphere(1.0))],
+            array_backed=array_backed, broad_phase=SpatialHashGrid(), contact_solver=ContactSolver())
+    copied = pickle.loads(pickle.dumps(manager))
+    manager.tick(0.01)
+    copied.tick(0.01)
+    assert copied.checksum() == manager.checksum()
@@ -0,0 +1,85 @@
+import math
+
+import pytest
+
+from pysics.obj import PhysicsObject
+from pysics.manager import PhysicsManager
+from pysics.constraints import Spring, DampedSpring, DistanceConstraint, Rope
+
+pytest.importorskip("numpy") #Constraints are solved with numpy
+
+def distance(a, b):
+    return math.sqrt(sum((q - p)**2 for p, q in zip(a.get_pos(), b.get_pos())))
+
+def test_constraints_need_objects_of_the_universe(array_backed):
+    a = PhysicsObject("a")
+    manager = PhysicsManager([a], array_backed=array_backed)
+    with pytest.raises(ValueError):
+        manager.add_constraint(Spring(a, PhysicsObject("b", xpos=1.0)))
+    spring = Spring(a, anchor=(1.0, 0.0, 0.0))
+    manager.add_constraint(spring)
+    with pytest.raises(AttributeError):
+        manager.constraints.append(spring)
+    assert manager.constraints == (spring,)
+    manager.remove_constraint(spring)
+    with pytest.raises(ValueError):
+        manager.remove_constraint(spring)
+
+def test_springs_oscillate_around_their_rest_length(array_backed):
+    bob = PhysicsObject("bob", xpos=2.0)
+    manager = PhysicsManager([bob], tick_length=0.1, array_backed=array_backed)
+    manager.add_constraint(Spring(bob, rest_length=1.0, stiffness=4.0))
+    positions = []
+    for _ in range(2000):
+        manager.tick()
+        positions.append(bob.xpos)
+    assert min(positions) < -1.9 #Swings through the anchor, out to the other side
+    assert max(abs(position) for position in positions) < 2.05 #Without gaining energy over time
+    assert max(abs(position) for position in positions[-200:]) > 1.9
+    assert bob.ypos == 0 and bob.zpos == 0
+
+def test_damped_springs_come_to_rest(array_backed):
+    a = PhysicsObject("a", xpos=-1.0)
+    b = PhysicsObject("b", xpos=1.0, mass=3.0)
+    manager = PhysicsManager([a, b], tick_length=0.05, array_backed=array_backed)
+    manager.add_constraint(DampedSpring(a, b, rest_length=1.0, stiffness=10.0, damping=2.0))
+    for _ in range(500):
+        manager.tick()
+    assert distance(a, b) == pytest.approx(1.0, abs=1e-3)
+    assert a.xpos + 3*b.xpos == pytest.approx(2.0) #The center of mass stays where it was
+
+def test_distance_constraints_keep_their_length(array_backed):
+    a = PhysicsObject("a", yvel=1.0)
+    b = PhysicsObject("b", xpos=2.0, yvel=-1.0)
+    manager = PhysicsManager([a, b], tick_length=0.05, array_backed=array_backed)
+    manager.add_constraint(DistanceConstraint(a, b))
+    for _ in range(100):
+        manager.tick()
+        assert distance(a, b) == pytest.approx(2.0, abs=1e-9)
+    assert a.xpos != 0 #The objects spin around each other
+
+def test_ropes_are_slack_when_short(array_backed):
+    bob = PhysicsObject("bob", xpos=0.5, xvel=1.0)
+    manager = PhysicsManager([bob], tick_length=0.1, array_backed=array_backed)
+    manager.add_constraint(Rope(bob, length=1.0))
+    for _ in range(4):
+        manager.tick()
+    assert bob.xpos == pytest.approx(0.9) and bob.xvel == 1 #Moves freely
+    for _ in range(10):
+        manager.tick()
+        assert bob.xpos <= 1.0 + 1e-9
+    assert bob.xvel == pytest.approx(0.0)
+
+def test_scalar_and_array_constraints_agree():
+    def swing(array_backed):
+        a = PhysicsObject("a", yvel=1.0)
+        b = PhysicsObject("b", xpos=1.0, zvel=0.5)
+        c = PhysicsObject("c", xpos=3.0)
+        manager = PhysicsManager([a, b, c], tick_length=0.05, array_backed=array_backed)
+        manager.add_constraint(DistanceConstraint(a, anchor=(0.0, -1.0, 0.0)))
+        manager.add_constraint(Rope(a, b, length=1.5))
+        manager.add_constraint(DampedSpring(b, c, stiffness=3.0))
+        for _ in range(100):
+            manager.tick()
+        return [obj.get_pos() + obj.get_vel() for obj in manager.objects]
+    assert swing(False) == swing(True)
@@ -0,0 +1,57 @@
+import pytest
+
+from pysics.obj import PhysicsObject
+from pysics.force import Force
+from pysics.manager import PhysicsManager
+from pysics.fields import UniformGravity, QuadraticDrag
+
+def make_manager(array_backed, reverse_forces=False, deterministic=True):
+    objects = []
+    for index in range(50):
+        forces = [Force("f{}".format(number), x=0.1*number + index/3, y=1e16 if number == 0 else -(number*0.37)) for number in range(4)]
+        forces.append(Force("cancel", y=-1e16)) #Summed exactly, so the order the forces were applied in does not matter
+        if reverse_forces: forces.reverse()
+        objects.append(PhysicsObject(str(index), xpos=index*0.1, yvel=index/7, zvel=-index/11, mass=1 + index/9, forces=forces))
+    return PhysicsManager(objects, tick_length=1/30, array_backed=array_backed, deterministic=deterministic, fields=[UniformGravity(), QuadraticDrag(0.01)])
+
+def run(manager, ticks=60):
+    checksums = []
+    for _ in range(ticks):
+        manager.tick()
+        checksums.append(manager.checksum())
+    return checksums
+
+def test_ticks_are_reproducible(array_backed):
+    checksums = run(make_manager(array_backed))
+    assert run(make_manager(array_backed)) == checksums
+    assert run(make_manager(array_backed, reverse_forces=True)) == checksums
+    assert len(set(checksums)) == len(checksums) #Every tick changes the state
+
+def test_scalar_and_array_universes_have_the_same_checksums():
+    pytest.importorskip("numpy")
+    assert run(make_manager(False)) == run(make_manager(True))
+
+def test_checksums_are_the_same_on_every_machine(array_backed):
+    manager = make_manager(array_backed)
+    run(manager, 30)
+    assert manager.checksum() == 13225370774301264440
+
+def test_deterministic_time_is_exact(array_backed):
+    manager = make_manager(array_backed)
+    run(manager, 30)
+    assert manager.time_passed == 1.0 and manager.tick_count == 30
+    manager.time_passed = 5.0 #Set by hand
+    run(manager, 15)
+    assert manager.time_passed == 5.5
+
+    drifting = make_manager(array_backed, deterministic=False)
+    run(drifting, 30)
+    assert drifting.time_passed == pytest.approx(1.0) and drifting.time_passed != 1.0
+
+def test_checksums_change_with_the_state(array_backed):
+    manager = make_manager(array_backed)
+    checksum = manager.checksum()
+    manager.objects[-1].zpos = 1e-300
+    assert manager.checksum() != checksum
+    manager.objects[-1].zpos = 0.0
+    assert manager.checksum() == checksum
@@ -0,0 +1,52 @@
+import pytest
+
+from pysics.obj import PhysicsObject
+from pysics.force import Force
+from pysics.manager import PhysicsManager
+from pysics.fields import UniformGravity, LinearDrag, QuadraticDrag, Wind, RadialAttractor, sum_acceleration, sum_accelerations
+
+FIELDS = [UniformGravity(direction=(1.0, -2.0, 0.5)), LinearDrag(0.3), QuadraticDrag(0.7), Wind((3.0, 0.0, -1.0), 0.2),
+          RadialAttractor((1.0, 2.0, 3.0), strength=5.0, radius=0.5)]
+
+def make_objects():
+    return [PhysicsObject(str(index), xpos=index*0.37 - 2, ypos=1.3*index, zpos=-0.1*index*index,
+            xvel=0.9*index - 3, yvel=(-1.0)**index*1.7, zvel=index/7, mass=1 + index/3) for index in range(12)]
+
+@pytest.mark.parametrize("field", FIELDS, ids=lambda field: type(field).__name__)
+def test_scalar_and_array_accelerations_are_identical(field):
+    np = pytest.importorskip("numpy")
+    objects = make_objects()
+    positions = np.array([obj.get_pos() for obj in objects])
+    velocities = np.array([obj.get_vel() for obj in objects])
+    masses = np.array([obj.mass for obj in objects])
+    batched = field.accelerations(positions, velocities, masses).tolist()
+    for obj, accel in zip(objects, batched):
+        assert list(field.acceleration(obj.get_pos(), obj.get_vel(), obj.mass)) == accel
+
+def test_fields_act_on_every_object(array_backed):
+    obj = PhysicsObject("a", mass=2.0, forces=[Force("push", x=2.0)])
+    manager = PhysicsManager([obj], array_backed=array_backed, fields=[UniformGravity(10.0)])
+    with pytest.raises(AttributeError):
+        manager.fields.append(LinearDrag())
+    manager.tick()
+    assert obj.get_vel() == (1.0, -10.0, 0.0) #Gravity does not depend on mass, unlike the force
+    manager.remove_field(manager.fields[0])
+    manager.tick()
+    assert obj.get_vel() == (2.0, -10.0, 0.0)
+    with pytest.raises(ValueError):
+        manager.remove_field(LinearDrag())
+
+def test_scalar_and_array_universes_with_fields_agree():
+    pytest.importorskip("numpy")
+    def run(array_backed):
+        manager = PhysicsManager(make_objects(), tick_length=0.05, array_backed=array_backed, fields=FIELDS)
+        for _ in range(50):
+            manager.tick()
+        return [obj.get_pos() + obj.get_vel() for obj in manager.objects]
+    assert run(False) == run(True)
+
+def test_sum_of_fields():
+    np = pytest.importorskip("numpy")
+    assert sum_acceleration([], (0.0, 0.0, 0.0), (0.0, 0.0, 0.0), 1.0) == (0.0, 0.0, 0.0)
+    total = sum_accelerations(FIELDS, np.array([[1.0, 0.0, 0.0]]), np.array([[0.0, 2.0, 0.0]]), np.array([2.0]))
+    assert total.tolist() == [list(sum_acceleration(FIELDS, (1.0, 0.0, 0.0), (0.0, 2.0, 0.0), 2.0))]
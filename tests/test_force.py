@@ -0,0 +1,128 @@
+import copy
+import gc
+import math
+import pickle
+import weakref
+
+import pytest
+
+from pysics.obj import PhysicsObject
+from pysics.force import Force
+from pysics.manager import PhysicsManager
+from pysics.errors import NameUsedError
+
+def test_torque_is_calculated_on_creation():
+    force = Force("f", 2.0, 3.0, 4.0, 0, 0.5, 0.25, 2.0, 0.3, 0.6, 0.9)
+    torque = (force.x_torque, force.y_torque, force.z_torque)
+    assert torque == force.calculate_torque()
+    assert torque == (0.5*2.0*math.sin(0.3), 0.25*3.0*math.sin(0.6), 2.0*4.0*math.sin(0.9))
+
+def test_net_force_is_cached():
+    obj = PhysicsObject("a", forces=[Force("f", 1.0, 2.0)])
+    assert obj.get_net_force() == (1.0, 2.0, 0.0)
+    assert not obj._forces_dirty
+    obj.apply_force(Force("g", y=-5.0))
+    assert obj._forces_dirty
+    assert obj.get_net_force() == (1.0, -3.0, 0.0)
+
+def test_changing_a_force_updates_every_object_it_acts_on(array_backed):
+    wind = Force("wind", x=1.0)
+    objects = [PhysicsObject("a", forces=[wind]), PhysicsObject("b", mass=2.0, forces=[wind])]
+    manager = PhysicsManager(objects, tick_length=1.0, array_backed=array_backed)
+    manager.tick()
+    wind.x = -4.0
+    manager.tick()
+    assert [obj.get_net_force() for obj in objects] == [(-4.0, 0.0, 0.0)]*2
+    assert [obj.xaccel for obj in objects] == [-4.0, -2.0]
+    #0.5 m after the first tick, then back by 2 m (or 1 m) and forward by the first tick's velocity
+    assert [obj.xpos for obj in objects] == [0.5 + 1.0 - 2.0, 0.25 + 0.5 - 1.0]
+
+def test_angular_acceleration_sums_every_torque(array_backed):
+    #Only the last force's torque used to count
+    first = Force("first", y=2.0, y_rotation_axis_distance=0.5, y_rot_angle=math.pi/2)
+    second = Force("second", y=4.0, y_rotation_axis_distance=0.25, y_rot_angle=math.pi/2)
+    obj = PhysicsObject("a", forces=[first, second], moment_of_inertia=2.0)
+    assert obj.get_net_torque() == (0.0, 0.5*2.0 + 0.25*4.0, 0.0)
+    assert obj.calculate_angular_accel() == (0.0, 1.0, 0.0)
+    manager = PhysicsManager([obj], array_backed=array_backed)
+    manager.tick()
+    assert obj.y_angular_accel == 1 and obj.y_angular_vel == 1
+
+def test_removed_forces_stop_notifying():
+    force = Force("f", x=1.0)
+    obj = PhysicsObject("a", forces=[force])
+    obj.remove_force(force)
+    assert not force._parents
+    obj.get_net_force()
+    force.x = 10.0
+    assert not obj._forces_dirty
+    assert obj.get_net_force() == (0.0, 0.0, 0.0)
+
+def test_net_force_does_not_depend_on_order():
+    values = [0.1, 1e16, 0.3, -1e16, 0.7]
+    forward = PhysicsObject("a", forces=[Force(str(index), x=value) for index, value in enumerate(values)])
+    backward = PhysicsObject("b", forces=[Force(str(index), x=value) for index, value in reversed(list(enumerate(values)))])
+    assert forward.get_net_force() == backward.get_net_force() == (math.fsum(values), 0.0, 0.0)
+
+def test_forces_cannot_be_changed_in_place():
+    obj = PhysicsObject("a", forces=[Force("f", x=1.0)])
+    with pytest.raises(AttributeError):
+        obj.forces.append(Force("g", x=1.0))
+    assert [force.name for force in obj.forces] == ["f"]
+
+def test_forces_are_indexed_by_name():
+    first = Force("first", x=1.0)
+    obj = PhysicsObject("a", forces=[first, Force("second", y=2.0), Force("third", z=3.0)])
+    assert obj.get_force("second").y == 2.0
+    assert obj.get_force("missing") is None
+    with pytest.raises(NameUsedError):
+        obj.apply_force(Force("first"))
+
+    replacement = obj.replace_force("first", Force("first", x=5.0))
+    assert [force.name for force in obj.forces] == ["first", "second", "third"] #Keeps its place
+    assert not first._parents and list(replacement._parents) == [obj]
+    assert obj.replace_force("second", y=-2.0) is obj.get_force("second")
+    assert obj.get_net_force() == (5.0, -2.0, 3.0)
+    with pytest.raises(ValueError):
+        obj.replace_force("third", Force("other"))
+    with pytest.raises(AttributeError):
+        obj.replace_force("third", mass=1.0)
+
+    obj.remove_force_by_name("second")
+    obj.remove_force_by_name("missing")
+    assert obj.get_net_force() == (5.0, 0.0, 3.0)
+    obj.forces = [Force("only", x=-1.0)]
+    assert [force.name for force in obj.forces] == ["only"]
+    assert not replacement._parents
+    assert obj.get_net_force() == (-1.0, 0.0, 0.0)
+
+def test_forces_do_not_keep_their_objects_alive(array_backed):
+    gravity = Force("gravity", y=-9.8)
+    objects = [PhysicsObject(str(index), forces=[gravity]) for index in range(3)]
+    manager = PhysicsManager(objects, array_backed=array_backed)
+    removed = weakref.ref(objects[1])
+    manager.remove_object(objects[1])
+    del objects[1]
+    gc.collect()
+    assert removed() is None
+    assert set(gravity._parents) == set(objects)
+
+    gravity.y = -1.0 #Still noticed by the objects that are left
+    manager.tick()
+    assert [obj.yvel for obj in objects] == [-1.0, -1.0]
+
+def test_copying_a_force_leaves_its_objects_behind():
+    force = Force("f", x=1.0, y_rotation_axis_distance=0.5, y_rot_angle=0.3)
+    obj = PhysicsObject("a", forces=[force])
+    obj.get_net_force()
+    for copied in (copy.copy(force), copy.deepcopy(force), pickle.loads(pickle.dumps(force))):
+        assert not copied._parents and list(force._parents) == [obj]
+        assert (copied.name, copied.x, copied.y_torque) == (force.name, force.x, force.y_torque)
+        copied.x = 2.0
+        assert not obj._forces_dirty
+
+    loaded = pickle.loads(pickle.dumps(obj)) #An object brings its forces, which notice it again
+    loaded.get_net_force()
+    loaded.forces[0].x = 3.0
+    assert loaded.get_net_force() == (3.0, 0.0, 0.0)
+    assert obj.get_net_force() == (1.0, 0.0, 0.0)
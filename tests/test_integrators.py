@@ -0,0 +1,58 @@
+import pytest
+
+from pysics.obj import PhysicsObject
+from pysics.force import Force
+from pysics.manager import PhysicsManager
+from pysics.fields import ForceField
+from pysics.integrators import ConstantAcceleration, SemiImplicitEuler, VelocityVerlet, RK4
+
+class SpringField(ForceField):
+    """A spring of stiffness 1 between every object and the origin."""
+
+    def acceleration(self, position, velocity, mass):
+        return tuple(-component/mass for component in position)
+
+    def accelerations(self, positions, velocities, masses):
+        return -positions/masses[:, None]
+
+def energy_drift(obj):
+    """How far the energy of an object on a spring (stiffness and mass 1, let go at x = 1) is from where it started."""
+    return abs((1/2)*obj.xvel**2 + (1/2)*obj.xpos**2 - (1/2))
+
+def field_spring_drift(integrator, array_backed):
+    obj = PhysicsObject("bob", xpos=1.0)
+    manager = PhysicsManager([obj], tick_length=0.1, integrator=integrator, array_backed=array_backed)
+    manager.add_field(SpringField())
+    for _ in range(1000):
+        manager.tick()
+    return energy_drift(obj)
+
+def force_spring_drift(integrator, array_backed):
+    obj = PhysicsObject("bob", xpos=1.0, forces=[Force("spring")])
+    manager = PhysicsManager([obj], tick_length=0.1, integrator=integrator, array_backed=array_backed)
+    for _ in range(1000):
+        obj.forces[0].x = -obj.xpos #Recalculated every tick, like the springs of the stickman example
+        manager.tick()
+    return energy_drift(obj)
+
+def test_integrators_keep_the_energy_of_a_spring_field(array_backed):
+    constant = field_spring_drift(ConstantAcceleration(), array_backed)
+    assert constant > 10 #Gains energy every tick
+    assert field_spring_drift(SemiImplicitEuler(), array_backed) < 0.05
+    assert field_spring_drift(VelocityVerlet(), array_backed) < 0.001
+    assert field_spring_drift(RK4(), array_backed) < 0.0001
+
+def test_semi_implicit_euler_keeps_the_energy_of_a_spring_force(array_backed):
+    assert force_spring_drift(ConstantAcceleration(), array_backed) > 10
+    assert force_spring_drift(SemiImplicitEuler(), array_backed) < 0.05
+
+def test_forces_stay_the_same_during_a_tick(array_backed):
+    #Only force fields are found during the tick, so forces alone move objects as with constant acceleration
+    constant = force_spring_drift(ConstantAcceleration(), array_backed)
+    assert force_spring_drift(VelocityVerlet(), array_backed) == constant
+    assert force_spring_drift(RK4(), array_backed) == pytest.approx(constant)
+
+def test_scalar_and_array_integrators_agree():
+    pytest.importorskip("numpy")
+    for integrator in (ConstantAcceleration(), SemiImplicitEuler(), VelocityVerlet(), RK4()):
+        assert field_spring_drift(integrator, False) == field_spring_drift(integrator, True)
@@ -0,0 +1,107 @@
+import pytest
+
+from pysics.obj import PhysicsObject
+from pysics.force import Force
+from pysics.manager import PhysicsManager
+from pysics.fields import LinearDrag
+from pysics.errors import NameUsedError
+
+def test_objects_cannot_be_changed_in_place(array_backed):
+    manager = PhysicsManager([PhysicsObject("a")], array_backed=array_backed)
+    with pytest.raises(AttributeError):
+        manager.objects.append(PhysicsObject("b"))
+    assert [obj.name for obj in manager.objects] == ["a"]
+
+def test_objects_are_indexed_by_name(array_backed):
+    objects = [PhysicsObject(str(index), xpos=index) for index in range(10)]
+    manager = PhysicsManager(objects[:5], array_backed=array_backed)
+    manager.add_objects(objects[5:])
+    assert manager.objects == tuple(objects)
+    assert manager.get_object("7") is objects[7]
+    assert manager.get_object("missing") is None
+
+    with pytest.raises(NameUsedError):
+        manager.add_object(PhysicsObject("3"))
+    with pytest.raises(NameUsedError): #Nothing is added if one name is used
+        manager.add_objects([PhysicsObject("new"), PhysicsObject("new")])
+    with pytest.raises(NameUsedError):
+        manager.add_objects([PhysicsObject("new"), PhysicsObject("9")])
+    assert manager.get_object("new") is None and len(manager.objects) == 10
+
+    manager.remove_object(objects[2])
+    manager.remove_object_by_name("4")
+    manager.remove_object_by_name("missing")
+    with pytest.raises(ValueError):
+        manager.remove_object(PhysicsObject("5")) #Not the object in the universe, only its name
+    with pytest.raises(ValueError): #Nothing is removed if one object is not in the universe
+        manager.remove_objects([objects[5], objects[2]])
+    manager.remove_objects([objects[5], objects[6]])
+    assert [obj.name for obj in manager.objects] == ["0", "1", "3", "7", "8", "9"]
+    manager.tick()
+    assert [obj.xpos for obj in manager.objects] == [0, 1, 3, 7, 8, 9]
+    assert manager.clear() == [objects[index] for index in (0, 1, 3, 7, 8, 9)]
+    assert manager.objects == ()
+
+def test_ticks_move_every_object(array_backed):
+    manager = PhysicsManager([PhysicsObject("a", xvel=2.0, forces=[Force("f", y=-2.0)])], tick_length=0.5, array_backed=array_backed)
+    manager.tick()
+    manager.tick(0.25)
+    obj = manager.get_object("a")
+    assert obj.get_pos() == (1.5, -0.5625, 0.0)
+    assert obj.time_passed == manager.time_passed == 0.75
+    assert manager.tick_count == 2
+
+def test_advance_runs_fixed_ticks(array_backed):
+    ball = PhysicsObject("ball", xvel=1.0)
+    manager = PhysicsManager([ball], tick_length=0.25, array_backed=array_backed)
+    assert manager.advance(0.1) == 0
+    assert manager.alpha == pytest.approx(0.4)
+    assert manager.advance(0.5) == 2 #0.6 s owed
+    assert manager.time_passed == 0.5
+    assert manager.alpha == pytest.approx(0.4)
+    #Drawn between where the ball was before the last tick and where it is now
+    assert ball.get_interpolated_pos(manager.alpha) == (pytest.approx(0.35), 0.0, 0.0)
+    if array_backed:
+        objects, positions = manager.interpolated_positions()
+        assert objects == [ball] and positions.tolist() == [list(ball.get_interpolated_pos(manager.alpha))]
+
+def test_advance_drops_time_it_cannot_catch_up_on(array_backed):
+    manager = PhysicsManager([PhysicsObject("ball")], tick_length=0.1, array_backed=array_backed, max_ticks_per_advance=3)
+    assert manager.advance(1.05) == 3
+    assert manager.time_passed == pytest.approx(0.3)
+    assert manager.alpha == pytest.approx(0.5) #The fraction of a tick is kept
+    assert manager.advance(0.06) == 1
+
+def test_advance_needs_time_to_move_forwards():
+    with pytest.raises(ValueError):
+        PhysicsManager(tick_length=0.0).advance(1.0)
+    with pytest.raises(ValueError):
+        PhysicsManager().advance(-1.0)
+
+def test_error_tolerance_splits_ticks_with_stiff_fields(array_backed):
+    obj = PhysicsObject("a", xvel=100.0)
+    manager = PhysicsManager([obj], tick_length=0.5, error_tolerance=1e-3, array_backed=array_backed)
+    manager.add_field(LinearDrag(5))
+    manager.tick()
+    assert manager.last_substeps > 1
+    assert 0 < obj.xvel < 100 #Slowed down, not turned around as in a single step (100 - 5*100*0.5 = -150)
+
+    calm = PhysicsManager([PhysicsObject("b", xvel=100.0)], tick_length=0.5, error_tolerance=1e-3, array_backed=array_backed)
+    calm.tick()
+    assert calm.last_substeps == 1 #Nothing changes during the tick
+
+def test_max_step_distance_splits_fast_ticks(array_backed):
+    obj = PhysicsObject("a", xvel=10.0, forces=[Force("push", x=2.0)])
+    manager = PhysicsManager([obj], tick_length=1.0, max_step_distance=0.5, array_backed=array_backed)
+    manager.tick()
+    assert manager.last_substeps == 22 #Would move 10*1 + 1/2*2*1^2 = 11 meters in one step
+    assert obj.xpos == pytest.approx(11.0) and obj.xvel == pytest.approx(12.0) and obj.time_passed == pytest.approx(1.0)
+    assert manager.time_passed == 1.0 and manager.tick_count == 1
+
+    manager.max_substeps = 8
+    manager.tick()
+    assert manager.last_substeps == 8
+
+    slow = PhysicsManager([PhysicsObject("b", xvel=0.1)], tick_length=1.0, max_step_distance=0.5, array_backed=array_backed)
+    slow.tick()
+    assert slow.last_substeps == 1
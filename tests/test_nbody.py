@@ -0,0 +1,58 @@
+import copy
+import pickle
+
+import pytest
+
+from pysics.obj import PhysicsObject
+from pysics.manager import PhysicsManager
+from pysics.nbody import NBodyGravity
+
+np = pytest.importorskip("numpy")
+
+def cluster(count, seed=0):
+    random = np.random.RandomState(seed)
+    positions = np.concatenate((random.normal(0.0, 1.0, (count//2, 3)), random.normal(20.0, 3.0, (count - count//2, 3))))
+    masses = random.uniform(0.5, 2.0, count)
+    return positions, masses
+
+def test_two_bodies_pull_each_other():
+    positions = np.array([[0.0, 0.0, 0.0], [2.0, 0.0, 0.0]])
+    masses = np.array([4.0, 1.0])
+    for direct in (False, True):
+        accels = NBodyGravity(gravitational_constant=1.0, direct=direct).mutual_accelerations(positions, masses)
+        assert accels.tolist() == [[0.25, 0.0, 0.0], [-1.0, 0.0, 0.0]]
+
+def test_barnes_hut_is_close_to_the_direct_sum():
+    positions, masses = cluster(3000)
+    exact = NBodyGravity(gravitational_constant=1.0, direct=True).mutual_accelerations(positions, masses)
+    errors = []
+    for theta in (0.3, 0.5, 1.0):
+        approximate = NBodyGravity(gravitational_constant=1.0, theta=theta).mutual_accelerations(positions, masses)
+        relative = np.sqrt(((approximate - exact)**2).sum(axis=1))/np.sqrt((exact**2).sum(axis=1))
+        errors.append(np.median(relative))
+    assert errors[0] < 0.005 and errors[1] < 0.01 and errors[2] < 0.05
+    assert errors == sorted(errors) #Larger opening angles are less accurate
+
+def test_opening_angle_of_zero_sums_every_pair():
+    positions, masses = cluster(200)
+    positions[5] = positions[6] #Objects in the same place do not pull on each other
+    exact = NBodyGravity(softening=0.1, direct=True).mutual_accelerations(positions, masses)
+    tree = NBodyGravity(softening=0.1, theta=0.0).mutual_accelerations(positions, masses)
+    assert np.allclose(tree, exact, rtol=1e-9, atol=0.0)
+    assert np.isfinite(tree).all()
+
+def test_momentum_is_kept(array_backed):
+    positions, masses = cluster(50, seed=1)
+    objects = [PhysicsObject(str(index), *position.tolist(), mass=float(mass)) for index, (position, mass) in enumerate(zip(positions, masses))]
+    manager = PhysicsManager(objects, tick_length=0.01, array_backed=array_backed, fields=[NBodyGravity(gravitational_constant=1.0, softening=0.1, direct=True)])
+    for _ in range(20):
+        manager.tick()
+    momentum = sum(np.array(obj.get_vel())*obj.mass for obj in objects)
+    assert np.abs(momentum).max() < 1e-9
+    assert objects[0].get_vel() != (0.0, 0.0, 0.0)
+
+def test_gravity_can_be_copied():
+    gravity = NBodyGravity(theta=0.7, softening=0.2)
+    for other in (copy.deepcopy(gravity), pickle.loads(pickle.dumps(gravity))):
+        positions, masses = cluster(100)
+        assert (other.mutual_accelerations(positions, masses) == gravity.mutual_accelerations(positions, masses)).all()
@@ -0,0 +1,28 @@
+import pickle
+
+import pytest
+
+from pysics.obj import PhysicsObject
+from pysics.force import Force
+from pysics.manager import PhysicsManager
+
+class BodyPart(PhysicsObject):
+    """A subclass without __slots__ of its own, like the one in the stickman example."""
+
+    def __init__(self, name, limb, **arguments):
+        super().__init__(name, **arguments)
+        self.limb = limb
+
+def test_objects_and_forces_have_no_dict():
+    for instance in (PhysicsObject("a"), Force("f")):
+        assert not hasattr(instance, "__dict__")
+        with pytest.raises(AttributeError):
+            instance.colour = "red"
+
+def test_subclasses_get_a_dict(array_backed):
+    part = BodyPart("arm", "left", xvel=1.0)
+    part.colour = "red"
+    manager = PhysicsManager([part], array_backed=array_backed)
+    manager.tick()
+    copied = pickle.loads(pickle.dumps(manager)).get_object("arm")
+    assert (copied.limb, copied.colour, copied.xpos) == ("left", "red", 1.0)
@@ -0,0 +1,59 @@
+import pytest
+
+from pysics.obj import PhysicsObject
+from pysics.manager import PhysicsManager
+from pysics.recording import Recorder, open_recording
+
+np = pytest.importorskip("numpy")
+
+def make_manager(array_backed):
+    objects = [PhysicsObject("ball {}".format(index), xpos=index, yvel=index/2, zvel=-1.0) for index in range(20)]
+    return PhysicsManager(objects, tick_length=0.25, array_backed=array_backed)
+
+def test_recordings_hold_every_tick(array_backed, tmp_path):
+    manager = make_manager(array_backed)
+    path = str(tmp_path/"match.rec")
+    expected = []
+    with Recorder(path, manager.objects, capacity=4, flush_interval=8) as recorder: #Grows past its capacity
+        manager.add_recorder(recorder)
+        with pytest.raises(AttributeError):
+            manager.recorders.append(recorder)
+        for tick in range(30):
+            manager.tick()
+            expected.append([obj.get_pos() + obj.get_vel() for obj in manager.objects])
+            if tick == 19:
+                assert len(open_recording(path)) == 16 #Only the ticks up to the last flush
+    assert recorder.ticks == 30
+    with pytest.raises(ValueError):
+        recorder.record(0.0)
+
+    recording = open_recording(path)
+    assert len(recording) == 30 and recording.names == [obj.name for obj in manager.objects]
+    assert recording.times.tolist() == [0.25*(tick + 1) for tick in range(30)]
+    assert recording.states.tolist() == [[list(state) for state in tick] for tick in expected]
+    assert recording.object_states("ball 3")[:, recording.fields.index("xvel")].tolist() == [0.0]*30
+
+def test_recording_some_fields_of_some_objects(array_backed, tmp_path):
+    manager = make_manager(array_backed)
+    path = str(tmp_path/"heights.rec")
+    chosen = manager.objects[::-3]
+    with Recorder(path, chosen, fields=("ypos", "time_passed")) as recorder:
+        manager.add_recorder(recorder)
+        for _ in range(3):
+            manager.tick()
+        manager.remove_recorder(recorder)
+        manager.tick() #Not recorded
+    recording = open_recording(path)
+    assert recording.fields == ["ypos", "time_passed"]
+    assert recording.states[-1].tolist() == [[obj.yvel*0.75, 0.75] for obj in chosen]
+
+def test_bad_recordings(tmp_path):
+    with pytest.raises(ValueError):
+        Recorder(str(tmp_path/"bad.rec"), [], fields=("speed",))
+    path = tmp_path/"text.rec"
+    path.write_bytes(b"not a recording")
+    with pytest.raises(ValueError):
+        open_recording(str(path))
+    with Recorder(str(tmp_path/"empty.rec"), [PhysicsObject("a")]) as recorder:
+        pass
+    assert len(open_recording(str(tmp_path/"empty.rec"))) == 0
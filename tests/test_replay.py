@@ -0,0 +1,73 @@
+import os
+
+import pytest
+
+from pysics.obj import PhysicsObject
+from pysics.manager import PhysicsManager
+from pysics.recording import Recorder
+from pysics.replay import ReplayWriter, open_replay
+
+np = pytest.importorskip("numpy")
+
+def record(array_backed, tmp_path, ticks=100, keyframe_interval=16):
+    objects = [PhysicsObject("ball {}".format(index), xpos=index, yvel=index/3, zvel=-0.5) for index in range(50)]
+    manager = PhysicsManager(objects, tick_length=0.1, array_backed=array_backed)
+    path = str(tmp_path/"match.replay")
+    expected = []
+    with ReplayWriter(path, manager.objects, keyframe_interval=keyframe_interval) as writer:
+        manager.add_recorder(writer)
+        for _ in range(ticks):
+            manager.tick()
+            expected.append([list(obj.get_pos() + obj.get_vel()) for obj in objects])
+    with pytest.raises(ValueError):
+        writer.record(0.0)
+    return path, expected
+
+def test_any_tick_can_be_found(array_backed, tmp_path):
+    path, expected = record(array_backed, tmp_path)
+    replay = open_replay(path)
+    assert len(replay) == 100 and replay.names[3] == "ball 3"
+    assert replay.times.tolist() == pytest.approx([0.1*(tick + 1) for tick in range(100)])
+    for tick in (57, 0, 99, 16, 15, -1):
+        assert replay.frame(tick).tolist() == expected[tick] #Bit for bit
+    assert replay.object_frame("ball 7", 40).tolist() == expected[40][7]
+    with pytest.raises(IndexError):
+        replay.frame(100)
+
+def test_frames_play_forwards_and_backwards(tmp_path):
+    path, expected = record(False, tmp_path)
+    replay = open_replay(path)
+    assert [frame.tolist() for time, frame in replay.frames()] == expected
+    assert [frame.tolist() for time, frame in replay.frames(start=-1, stop=-40, step=-1)] == expected[:-40:-1]
+    assert [time for time, frame in replay.frames(10, 30, 7)] == replay.times[10:30:7].tolist()
+
+def test_frames_stop_at_the_ends_of_the_replay(tmp_path):
+    path, expected = record(False, tmp_path, ticks=10, keyframe_interval=4)
+    replay = open_replay(path)
+    kill_cam = replay.frames(start=len(replay) - 1, stop=len(replay) - 300, step=-1) #A window longer than the replay
+    assert [frame.tolist() for time, frame in kill_cam] == expected[::-1]
+    assert [frame.tolist() for time, frame in replay.frames(start=5, stop=300)] == expected[5:]
+    assert [time for time, frame in replay.frames(start=2, stop=-1, step=-1)] == replay.times[2:-1:-1].tolist()
+    with pytest.raises(IndexError):
+        next(replay.frames(start=10))
+
+def test_replays_are_smaller_than_recordings(tmp_path):
+    path, expected = record(False, tmp_path, ticks=300, keyframe_interval=60)
+    objects = [PhysicsObject("ball {}".format(index), xpos=index, yvel=index/3, zvel=-0.5) for index in range(50)]
+    manager = PhysicsManager(objects, tick_length=0.1)
+    with Recorder(str(tmp_path/"match.rec"), objects) as recorder:
+        manager.add_recorder(recorder)
+        for _ in range(300):
+            manager.tick()
+    assert os.path.getsize(path) < os.path.getsize(str(tmp_path/"match.rec"))/2
+
+def test_unfinished_replays(tmp_path):
+    path = str(tmp_path/"unfinished.replay")
+    writer = ReplayWriter(path, [PhysicsObject("a")])
+    writer.record(1.0)
+    with pytest.raises(ValueError):
+        open_replay(path) #Not closed yet
+    writer.close()
+    assert len(open_replay(path)) == 1
+    with pytest.raises(ValueError):
+        open_replay(__file__) #Not a replay
@@ -0,0 +1,76 @@
+import multiprocessing
+
+import pytest
+
+from pysics.obj import PhysicsObject
+from pysics.force import Force
+from pysics.manager import PhysicsManager
+from pysics.fields import UniformGravity, QuadraticDrag
+from pysics.integrators import VelocityVerlet
+from pysics.scheduler import UniverseScheduler
+from pysics.errors import UnsharedStateError
+
+pytest.importorskip("numpy")
+
+can_fork = pytest.mark.skipif("fork" not in multiprocessing.get_all_start_methods(), reason="worker processes need fork")
+
+def make_managers(count=5):
+    managers = []
+    for match in range(count):
+        objects = [PhysicsObject("{}-{}".format(match, index), xpos=index, yvel=match + index/10, mass=1 + index,
+                forces=[Force("push", x=0.5*match)]) for index in range(match*7 + 3)]
+        managers.append(PhysicsManager(objects, tick_length=1/60, array_backed=True, integrator=VelocityVerlet(),
+                fields=[UniformGravity(), QuadraticDrag(0.05)]))
+    return managers
+
+def states(managers):
+    return [(manager.time_passed, manager.tick_count, [obj.get_pos() + obj.get_vel() for obj in manager.objects]) for manager in managers]
+
+@can_fork
+def test_scheduler_matches_serial_ticks():
+    serial = make_managers()
+    for manager in serial:
+        for _ in range(20):
+            manager.tick()
+
+    parallel = make_managers()
+    with UniverseScheduler(parallel, processes=3) as scheduler:
+        assert scheduler.parallel
+        scheduler.tick(ticks=10)
+        for _ in range(10):
+            scheduler.tick()
+        parallel[0].objects[0].xvel += 1.0 #Velocities can be changed between ticks
+        serial[0].objects[0].xvel += 1.0
+        scheduler.tick(ticks=10)
+    for manager in serial:
+        for _ in range(20):
+            manager.tick()
+    for _ in range(10): #Ticked one after another once closed
+        scheduler.tick()
+    assert not scheduler.parallel
+    assert states(parallel) == states(serial)
+
+def test_serial_fallback():
+    managers = make_managers(3)
+    serial = make_managers(3)
+    scheduler = UniverseScheduler(managers, processes=1)
+    assert not scheduler.parallel
+    scheduler.tick(0.1, ticks=3)
+    for manager in serial:
+        for _ in range(3):
+            manager.tick(0.1)
+    assert states(managers) == states(serial)
+
+@can_fork
+def test_parallel_universes_must_be_array_backed():
+    with pytest.raises(ValueError):
+        UniverseScheduler([PhysicsManager([PhysicsObject("a")]), PhysicsManager([PhysicsObject("b")])], processes=2)
+
+@can_fork
+def test_universes_cannot_grow_while_shared():
+    managers = make_managers(2)
+    with UniverseScheduler(managers, processes=2) as scheduler:
+        scheduler.tick()
+        managers[1].add_objects([PhysicsObject("new {}".format(index)) for index in range(1000)])
+        with pytest.raises(UnsharedStateError):
+            scheduler.tick()
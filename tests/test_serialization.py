@@ -0,0 +1,104 @@
+import pytest
+
+from pysics.obj import PhysicsObject
+from pysics.force import Force
+from pysics.manager import PhysicsManager
+from pysics.shapes import Sphere, Box
+from pysics.integrators import RK4, SemiImplicitEuler
+from pysics import serialization
+
+def make_manager(array_backed):
+    gravity = Force("gravity", y=-9.8) #Shared by many objects, and saved once
+    objects = []
+    for index in range(40):
+        forces = [gravity] if index % 2 else []
+        if index % 5 == 0:
+            forces.append(Force("spin {}".format(index), x=1.5, z=-0.5, force_type=1, x_rotation_axis_distance=0.2, z_rot_angle=0.1))
+        objects.append(PhysicsObject(index if index % 7 == 0 else "object {}".format(index), xpos=index, yvel=index/3, zvel=-1.0,
+                x_angular_vel=0.01*index, forces=forces, mass=1 + index % 4, moment_of_inertia=2.0,
+                shape=Sphere(0.5) if index % 3 == 0 else Box(1.0, 2.0, 0.5) if index % 3 == 1 else None,
+                ccd=index % 4 == 0, integrator=RK4() if index % 6 == 0 else None))
+    manager = PhysicsManager(objects, tick_length=1/30, array_backed=array_backed, integrator=SemiImplicitEuler(),
+            max_step_distance=5.0, deterministic=True)
+    for _ in range(3):
+        manager.tick()
+    manager.remove_object(objects[4]) #Changes the order of the rows of an array-backed universe
+    manager.advance(0.05)
+    return manager
+
+def states(manager):
+    return [(obj.name, obj.get_pos(), obj.get_vel(), obj.get_accel(), obj.get_net_force(), obj.get_net_torque(), obj.x_angular_accel,
+            obj.time_passed, obj.mass, None if obj.shape is None else (type(obj.shape), obj.shape.half_extents()), obj.ccd, type(obj.integrator),
+            [(force.name, force.x, force.y, force.z, force.force_type) for force in obj.forces]) for obj in manager.objects]
+
+def settings(manager):
+    return (manager.tick_length, manager.time_passed, manager.tick_count, manager._exact_time, manager._unsimulated_time, manager.alpha,
+            manager.max_step_distance, manager.error_tolerance, manager.deterministic, type(manager.integrator))
+
+@pytest.mark.parametrize("compression", [None, 6])
+def test_loaded_universes_are_identical(array_backed, compression):
+    manager = make_manager(array_backed)
+    loaded = serialization.loads(serialization.dumps(manager, compression))
+    assert (loaded.world is not None) == array_backed
+    assert states(loaded) == states(manager)
+    assert settings(loaded) == settings(manager)
+    assert loaded.checksum() == manager.checksum()
+    shared = [obj for obj in loaded.objects if obj.get_force("gravity") is not None]
+    assert all(obj.get_force("gravity") is shared[0].get_force("gravity") for obj in shared)
+
+    for _ in range(10): #Ticking gives exactly the same results
+        manager.tick()
+        loaded.tick()
+    assert loaded.checksum() == manager.checksum()
+
+def test_universes_can_be_loaded_into_the_other_kind():
+    pytest.importorskip("numpy")
+    manager = make_manager(True)
+    loaded = serialization.loads(serialization.dumps(manager), array_backed=False, tick_length=0.5)
+    assert loaded.world is None and loaded.tick_length == 0.5
+    assert states(loaded) == states(manager)
+
+def test_derived_fields_are_not_saved(array_backed):
+    push = Force("push", x=2.0)
+    objects = [PhysicsObject(str(index), xpos=index, mass=1 + index % 4, forces=[push] if index % 2 else []) for index in range(1000)]
+    manager = PhysicsManager(objects, array_backed=array_backed)
+    data = serialization.dumps(manager)
+    assert len(data) < 1000*215 #25 of the 37 fields of each object, its name and how many forces act on it
+    assert len(serialization.dumps(manager, 9)) < len(data)/2
+
+    loaded = serialization.loads(data)
+    assert [obj.get_accel() for obj in loaded.objects] == [(2/(1 + index % 4) if index % 2 else 0.0, 0.0, 0.0) for index in range(1000)]
+    assert loaded.objects[3].get_net_force() == (2.0, 0.0, 0.0)
+    assert loaded.checksum() == manager.checksum()
+
+def test_accelerations_are_calculated_for_every_object(array_backed):
+    push = Force("push", x=1.0, y_rotation_axis_distance=0.5, y_rot_angle=0.4)
+    objects = [PhysicsObject(str(index), xvel=index - 3, mass=(-1)**index*(1 + index % 3), moment_of_inertia=(-1)**(index//2)*2.0,
+            forces=[push] if index % 3 == 0 else []) for index in range(12)] #Negative masses without forces have accelerations of -0.0
+    manager = PhysicsManager(objects, array_backed=array_backed)
+    manager.tick()
+    loaded = serialization.loads(serialization.dumps(manager))
+    assert [repr(obj.get_accel() + obj.get_angular_accel()) for obj in loaded.objects] \
+            == [repr(obj.get_accel() + obj.get_angular_accel()) for obj in manager.objects]
+    assert loaded.checksum() == manager.checksum()
+
+def test_files(tmp_path, array_backed):
+    manager = make_manager(array_backed)
+    with open(str(tmp_path/"level.save"), "wb") as file:
+        serialization.dump(manager, file)
+    with open(str(tmp_path/"level.save"), "rb") as file:
+        loaded = serialization.load(file)
+    assert states(loaded) == states(manager)
+
+def test_bad_saves():
+    with pytest.raises(ValueError):
+        serialization.loads(b"not a save")
+    data = bytearray(serialization.dumps(PhysicsManager([PhysicsObject("a")])))
+    data[len(serialization.MAGIC)] += 1 #A newer version
+    with pytest.raises(ValueError):
+        serialization.loads(bytes(data))
+
+    class Cone(Sphere):
+        pass
+    with pytest.raises(ValueError):
+        serialization.dumps(PhysicsManager([PhysicsObject("cone", shape=Cone(1.0))]))
@@ -0,0 +1,64 @@
+import pytest
+
+from pysics.obj import PhysicsObject
+from pysics.force import Force
+from pysics.manager import PhysicsManager
+from pysics.constraints import Spring
+
+pytest.importorskip("numpy") #Sleeping requires numpy
+
+def test_still_objects_fall_asleep(array_backed):
+    still = PhysicsObject("still", xvel=0.01)
+    moving = PhysicsObject("moving", xvel=1.0)
+    manager = PhysicsManager([still, moving], sleep_ticks=3, array_backed=array_backed)
+    for _ in range(2):
+        manager.tick()
+    assert not still.asleep
+    manager.tick()
+    assert still.asleep and not moving.asleep
+    assert still.xvel == 0 #Falling asleep stops the object
+
+    manager.tick()
+    assert still.xpos == pytest.approx(0.03) and still.time_passed == 4 #Not moved, but time still passes
+    assert moving.xpos == 4
+
+def test_objects_wake_up(array_backed):
+    obj = PhysicsObject("obj", forces=[Force("push")])
+    manager = PhysicsManager([obj], sleep_ticks=1, array_backed=array_backed)
+    manager.tick()
+    assert obj.asleep
+
+    obj.forces[0].x = 1.0 #Changing a force wakes its objects up
+    assert not obj.asleep
+    manager.tick()
+    assert obj.xvel == 1
+
+    obj.xvel = 0.0
+    obj.forces[0].x = 0.0
+    manager.tick()
+    assert obj.asleep
+    obj.xvel = 2.0 #Changing the velocity directly does not, until the end of the next tick
+    manager.tick()
+    assert obj.xpos == 0.5 and not obj.asleep
+    manager.tick()
+    assert obj.xpos == 2.5
+
+    obj.xvel = 0.0
+    manager.tick()
+    assert obj.asleep
+    obj.wake()
+    assert not obj.asleep
+
+def test_islands_sleep_together(array_backed):
+    still = PhysicsObject("still", xpos=0.0)
+    moving = PhysicsObject("moving", xpos=1.0, yvel=1.0)
+    manager = PhysicsManager([still, moving], sleep_ticks=2, array_backed=array_backed)
+    manager.add_constraint(Spring(still, moving, stiffness=0.0)) #Connects them without pulling
+    for _ in range(5):
+        manager.tick()
+    assert not still.asleep #Kept awake by the moving object it is connected to
+
+    manager.remove_constraint(manager.constraints[0])
+    for _ in range(2):
+        manager.tick()
+    assert still.asleep and not moving.asleep
@@ -0,0 +1,77 @@
+import pytest
+
+from pysics.obj import PhysicsObject
+from pysics.force import Force
+from pysics.manager import PhysicsManager
+from pysics.snapshot import total_nbytes
+from pysics.errors import AlreadyBoundError
+
+def make_manager(array_backed, count=200):
+    push = Force("push", x=1.0, y=0.5) #Shared by every object
+    objects = [PhysicsObject(str(index), xpos=index, yvel=index % 3, mass=1 + index % 4, forces=[push]) for index in range(count)]
+    return PhysicsManager(objects, tick_length=0.1, array_backed=array_backed)
+
+def states(manager):
+    return [(obj.name, obj.get_pos(), obj.get_vel(), obj.get_accel(), obj.get_net_force(), obj.time_passed) for obj in manager.objects] \
+            + [manager.time_passed, manager.tick_count, manager.checksum()]
+
+def test_restoring_rolls_back_every_change(array_backed):
+    manager = make_manager(array_backed)
+    for _ in range(3):
+        manager.tick()
+    saved = states(manager)
+    snapshot = manager.snapshot()
+    for _ in range(5):
+        manager.tick()
+    after = states(manager)
+
+    push = manager.objects[0].forces[0]
+    push.x = -3.0
+    manager.objects[1].apply_force(Force("kick", z=2.0))
+    manager.objects[2].xvel = 100.0
+    manager.remove_object(manager.objects[3])
+    manager.add_object(PhysicsObject("new"))
+    manager.tick()
+
+    manager.restore(snapshot)
+    assert states(manager) == saved
+    assert push.x == 1.0 and [force.name for force in manager.objects[1].forces] == ["push"]
+    for _ in range(5): #Ticking again gives exactly the same results
+        manager.tick()
+    assert states(manager) == after
+
+    manager.restore(snapshot) #Any number of times
+    assert states(manager) == saved
+
+def test_failed_restores_change_nothing(array_backed):
+    pytest.importorskip("numpy")
+    a = PhysicsObject("a", xvel=1.0)
+    b = PhysicsObject("b", yvel=1.0)
+    manager = PhysicsManager([a, b], array_backed=array_backed)
+    snapshot = manager.snapshot()
+    manager.remove_object(a)
+    other = PhysicsManager([a], array_backed=True) #Now stored in another array-backed universe
+    manager.tick()
+
+    with pytest.raises(AlreadyBoundError):
+        manager.restore(snapshot)
+    assert manager.objects == (b,) and b.ypos == 1
+    assert manager.world is None or list(manager.world.objects) == [b]
+    assert a._world is other.world
+    manager.tick()
+    other.tick()
+    assert b.ypos == 2 and a.xpos == 1
+
+def test_snapshots_share_pages_that_did_not_change(array_backed):
+    manager = make_manager(array_backed, count=2000)
+    history = [manager.snapshot()]
+    for _ in range(10):
+        manager.objects[0].xpos += 1.0 #Only one object moves
+        history.append(manager.snapshot())
+    assert total_nbytes(history) < 2*history[0].nbytes
+    assert history[-1].nbytes == history[0].nbytes
+    assert history[-1]._forces is history[0]._forces #No force changed
+
+    manager.tick() #Every object moves, but only the pages of the fields that changed (such as positions) are copied
+    history.append(manager.snapshot())
+    assert history[0].nbytes*1.1 < total_nbytes(history[-2:]) < history[0].nbytes*1.5
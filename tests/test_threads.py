@@ -0,0 +1,49 @@
+import copy
+import pickle
+
+import pytest
+
+from pysics.obj import PhysicsObject
+from pysics.force import Force
+from pysics.manager import PhysicsManager
+from pysics.fields import UniformGravity, LinearDrag
+from pysics.integrators import SemiImplicitEuler, RK4
+
+pytest.importorskip("numpy")
+
+def make_manager(array_backed, threads):
+    objects = [PhysicsObject(str(index), xpos=index/100, yvel=(index % 7) - 3, mass=1 + index % 5,
+            forces=[Force("push", x=index % 3)], integrator=RK4() if index % 10 == 0 else None) for index in range(5000)]
+    return PhysicsManager(objects, tick_length=0.01, array_backed=array_backed, threads=threads, integrator=SemiImplicitEuler(),
+            fields=[UniformGravity(), LinearDrag(0.2)])
+
+def states(manager):
+    return [obj.get_pos() + obj.get_vel() for obj in manager.objects]
+
+def test_threads_match_one_thread(array_backed):
+    serial = make_manager(array_backed, None)
+    with make_manager(array_backed, 4) as threaded:
+        for _ in range(5):
+            serial.tick()
+            threaded.tick()
+        assert threaded._thread_pool is not None
+    assert threaded._thread_pool is None #Closed at the end of the with statement
+    assert states(threaded) == states(serial)
+
+    threaded.tick() #Starts new threads
+    serial.tick()
+    assert states(threaded) == states(serial)
+    threaded.close()
+    threaded.close()
+
+def test_threaded_universes_can_be_copied(array_backed):
+    manager = make_manager(array_backed, 2)
+    manager.tick()
+    for other in (copy.deepcopy(manager), pickle.loads(pickle.dumps(manager))):
+        assert other._thread_pool is None and other.threads == 2
+        other.tick()
+        assert other._thread_pool is not None
+        other.close()
+    manager.tick()
+    assert states(other) == states(manager)
+    manager.close()
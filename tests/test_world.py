@@ -0,0 +1,124 @@
+import copy
+import pickle
+import random
+
+import pytest
+
+from pysics.obj import PhysicsObject
+from pysics.force import Force
+from pysics.manager import PhysicsManager
+from pysics.errors import AlreadyBoundError
+from pysics.world import NUM_FIELDS, STATE_FIELDS
+
+np = pytest.importorskip("numpy")
+
+def make_objects(seed=1, count=20):
+    rng = random.Random(seed)
+    objects = []
+    for index in range(count):
+        obj = PhysicsObject(str(index), xpos=rng.random(), yvel=rng.random(), z_angular_vel=rng.random(), mass=rng.random() + 0.5)
+        obj.apply_force(Force("push", x=rng.random(), y=rng.random(), x_rotation_axis_distance=0.3, x_rot_angle=0.2))
+        objects.append(obj)
+    return objects
+
+def test_state_row_layout():
+    obj = PhysicsObject("a", 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, mass=13, moment_of_inertia=14, time_passed=15)
+    assert len(obj._state) == NUM_FIELDS
+    for name in ("xpos", "ypos", "zpos", "xvel", "yvel", "zvel", "x_orientation", "y_orientation", "z_orientation",
+            "x_angular_vel", "y_angular_vel", "z_angular_vel", "mass", "moment_of_inertia", "time_passed"):
+        assert obj._state[STATE_FIELDS.index(name)] == getattr(obj, name)
+    assert obj.get_interpolated_pos(0.0) == (1, 2, 3)
+
+def test_attributes_are_views_of_the_world():
+    manager = PhysicsManager(make_objects(), array_backed=True)
+    obj = manager.get_object("3")
+    obj.xpos = 42.0
+    assert manager.world.state[obj._row, STATE_FIELDS.index("xpos")] == 42.0
+    manager.world.positions[obj._row, 1] = -1.0
+    assert obj.ypos == -1.0
+
+def test_attributes_are_python_types():
+    manager = PhysicsManager(make_objects(), array_backed=True)
+    obj = manager.objects[0]
+    assert type(obj.xpos) is float
+    assert type(obj.mass) is float
+    assert type(obj.ccd) is bool
+    assert type(obj.asleep) is bool
+    assert all(type(value) is float for value in obj.get_net_force() + obj.calculate_accel() + obj.get_interpolated_pos(0.5))
+
+def test_removed_objects_keep_their_state():
+    objects = make_objects()
+    manager = PhysicsManager(objects, array_backed=True)
+    manager.tick(0.1)
+    obj = objects[2]
+    state = obj._state.tolist()
+    manager.remove_object(obj)
+    assert obj._world is None and obj._state == state
+    #The last row fills the gap
+    assert [o._row for o in manager.world.objects] == list(range(manager.world.count))
+    for row, other in enumerate(manager.world.objects):
+        assert other._state.base is manager.world.state.base or other._state.base is manager.world.state
+
+def test_objects_can_only_be_in_one_world():
+    obj = PhysicsObject("a")
+    PhysicsManager([obj], array_backed=True)
+    with pytest.raises(AlreadyBoundError):
+        PhysicsManager([obj], array_backed=True)
+
+def test_bind_all_is_all_or_nothing():
+    objects = make_objects()
+    PhysicsManager(objects[-1:], array_backed=True)
+    manager = PhysicsManager(array_backed=True)
+    with pytest.raises(AlreadyBoundError):
+        manager.world.bind_all(objects)
+    assert manager.world.count == 0
+    assert all(obj._world is None for obj in objects[:-1])
+
+def test_world_grows():
+    manager = PhysicsManager(array_backed=True)
+    for obj in make_objects(count=200):
+        manager.add_object(obj)
+    assert manager.world.capacity >= 200
+    assert [obj.name for obj in manager.world.objects] == [str(index) for index in range(200)]
+
+@pytest.mark.parametrize("array_backed", [False, True])
+@pytest.mark.parametrize("copier", [lambda manager: pickle.loads(pickle.dumps(manager)), copy.deepcopy])
+def test_managers_can_be_copied(array_backed, copier):
+    manager = PhysicsManager(make_objects(), tick_length=0.1, array_backed=array_backed)
+    manager.tick()
+    copied = copier(manager)
+    if array_backed:
+        assert all(obj._state.base is copied.world.state.base or obj._state.base is copied.world.state for obj in copied.objects)
+    for _ in range(10):
+        manager.tick()
+        copied.tick()
+    assert copied.checksum() == manager.checksum()
+
+def test_batched_ticks_match_scalar_ticks():
+    scalar = PhysicsManager(make_objects(), tick_length=0.1)
+    batched = PhysicsManager(make_objects(), tick_length=0.1, array_backed=True)
+    for tick in range(100):
+        if tick == 50: #Changing a force part way through is noticed by both
+            scalar.get_object("4").replace_force("push", x=-3.0)
+            batched.get_object("4").replace_force("push", x=-3.0)
+        scalar.tick()
+        batched.tick()
+    for a, b in zip(scalar.objects, batched.objects):
+        assert a._state == b._state.tolist() #Bit-identical, not just close
+    assert scalar.checksum() == batched.checksum()
+
+def test_integrate_ranges_match_whole_world():
+    whole = PhysicsManager(make_objects(count=50), array_backed=True)
+    ranges = PhysicsManager(make_objects(count=50), array_backed=True)
+    whole.world.calculate_accels()
+    ranges.world.calculate_accels()
+    whole.world.integrate(0.25)
+    for start in range(0, 50, 7):
+        ranges.world.integrate(0.25, start, min(start + 7, 50))
+    assert np.array_equal(whole.world.state, ranges.world.state)
+
+def test_zero_length_ticks_change_nothing():
+    manager = PhysicsManager(make_objects(), array_backed=True)
+    before = manager.world.state.copy()
+    manager.tick(0)
+    assert np.array_equal(before, manager.world.state)